@@ -5,9 +5,13 @@ from __future__ import annotations
 
 import os
 import subprocess
+import sys
 import threading
-from datetime import date, timedelta
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import replace
+from datetime import date, datetime, timedelta
 from decimal import Decimal
+from functools import lru_cache
 from pathlib import Path
 from typing import NamedTuple
 
@@ -16,11 +20,23 @@ from textual.binding import Binding
 from textual.containers import Container
 from textual.widgets import Static, Footer, DataTable
 from textual.coordinate import Coordinate
+from rich.style import Style
 from rich.text import Text
 
 import storage
-from models import Ticket, TicketAllocation, TimeEntry
-from utils import calculate_points, get_weeks_in_month
+from models import Config, Ticket, TicketAllocation, TimeEntry
+from utils import (
+    DAY_ABBRS,
+    MONTH_ABBRS,
+    MONTH_NAMES,
+    calculate_points,
+    format_short_date,
+    count_weekdays,
+    get_week_month,
+    get_weeks_in_month,
+    hundredths_to_hours,
+    minutes_to_hundredths,
+)
 from screens import (
     ConfirmScreen,
     DeliverableBillTicketsScreen,
@@ -39,6 +55,134 @@ from screens import (
 )
 from widgets import CombinedHeader, DayDescription, DayHeader, DaySummary, DayTimeEntry, WeeklySummary
 
+# Offsets from a week's Saturday start to each of its seven days
+_DAY_OFFSETS = tuple(timedelta(days=i) for i in range(7))
+
+
+# Decimal constants for totals, so hot paths don't parse a string per use.
+# Decimals are immutable, so sharing them is safe.
+_ZERO = Decimal("0")
+# Decimal(n) for weekday counts up to a month's worth
+_DECIMAL_INTS = tuple(Decimal(i) for i in range(32))
+
+
+# Position of each adjust type's total in _tally_hundredths' result
+_ADJUST_TYPE_SLOTS: dict[str | None, int] = {"L": 1, "S": 2, "T": 3, "P": 4}
+
+
+# (label, width) columns of the month and year tables, which differ only
+# in their first column, plus the money columns appended when shown
+_TOTALS_COLUMNS = (
+    ("Worked", 8), ("Poss", 8), ("L", 6), ("S", 6), ("T", 6), ("P", 6), ("Total", 8),
+)
+_MONTH_COLUMNS = (("W/C Mon", 12), *_TOTALS_COLUMNS)
+_YEAR_COLUMNS = (("Month", 12), *_TOTALS_COLUMNS)
+_MONEY_COLUMNS = (("Bill", 10), ("+VAT", 10))
+# The billing table's columns, likewise with optional money columns
+_BILLING_COLUMNS = (("Deliverable", 12), ("Title", 30), ("Work Package", 10), ("Hours", 8), ("Points", 8))
+_BILLING_MONEY_COLUMNS = (("Ex VAT", 12), ("Inc VAT", 12))
+# _get_month_totals keys, in _TOTALS_COLUMNS order
+_TOTALS_KEYS = ("worked", "max_hours", "leave", "sick", "training", "public_holiday", "total")
+
+
+# Widgets shown only in each view mode; _set_view_mode hides the rest
+_MODE_WIDGETS: dict[str, tuple[str, ...]] = {
+    "week": ("#combined-header", "#week-table-container", "#week-earnings", "#weekly-summary"),
+    "month": ("#month-header", "#month-table-container", "#month-earnings", "#month-summary"),
+    "year": ("#year-header", "#year-table-container", "#year-earnings", "#year-summary"),
+    "day": ("#day-header", "#day-time-entry", "#day-table-container", "#day-summary", "#day-description"),
+    "allocations": (
+        "#allocations-header", "#allocations-table-container", "#alloc-description", "#allocations-summary",
+    ),
+    "billing": ("#billing-header", "#billing-table-container", "#billing-summary"),
+}
+
+
+# check_action rules: view-switching keys hidden in the listed modes, and
+# mode-specific keys shown only in the listed modes
+_ACTION_HIDDEN_IN: dict[str, frozenset[str]] = {
+    "week_view": frozenset({"week"}),
+    "month_view": frozenset({"month", "day"}),
+    "year_view": frozenset({"year", "day"}),
+    "allocations_view": frozenset({"allocations"}),
+    "billing_view": frozenset({"billing"}),
+}
+_ACTION_SHOWN_IN: dict[str, frozenset[str]] = {
+    # Navigation
+    "goto_today": frozenset({"week", "month"}),
+    "edit_ticket_on_alloc_row": frozenset({"allocations"}),
+    "alloc_prev_month": frozenset({"allocations", "billing"}),
+    "alloc_next_month": frozenset({"allocations", "billing"}),
+    # Week/day view
+    "edit_day": frozenset({"week", "day"}),
+    "toggle_money": frozenset({"month", "year", "allocations", "billing"}),
+    # Year view only
+    "populate_holidays": frozenset({"year"}),
+    # Day view / allocations view — allocation operations
+    "add_allocation": frozenset({"day", "allocations"}),
+    "delete_allocation": frozenset({"day", "allocations"}),
+    "move_allocation": frozenset({"day", "allocations"}),
+    "toggle_entered": frozenset({"day"}),
+    "back_to_week": frozenset({"day"}),
+    # Allocations view only
+    "toggle_points_entered": frozenset({"allocations"}),
+    "export_allocations": frozenset({"allocations"}),
+    # Billing view only
+    "finalise_billing": frozenset({"billing"}),
+    "generate_invoice": frozenset({"billing"}),
+}
+
+# Row styles for the week, month and year tables, parsed once
+_PLAIN = Style()
+_DIM = Style(dim=True)
+
+# Cells that never vary, shared rather than rebuilt per row.
+# DataTable renders Text cells without mutating them.
+_DASHES = {_PLAIN: Text("-", style=_PLAIN), _DIM: Text("-", style=_DIM)}
+_EMPTIES = {_PLAIN: Text("", style=_PLAIN), _DIM: Text("", style=_DIM)}
+_ALLOC_NO_HOURS = Text("-", style="dim")
+_ALLOC_NONE = Text("?", style="dim")
+_ALLOC_UNDER = Text("↓", style="yellow")
+_ALLOC_OVER = Text("↑", style="red")
+_ALLOC_EXACT = Text("✓", style="green")
+
+
+@lru_cache(maxsize=1024)
+def _cell(value: str, style: Style) -> Text:
+    """Return a table cell, shared between rows with the same value and style.
+
+    Totals like "7.5h" or "20d" repeat across rows and refreshes, so cells
+    are memoised rather than built anew each time; "-" and "" always map
+    to the prebuilt shared cells.
+    """
+    if value == "-":
+        return _DASHES[style]
+    if not value:
+        return _EMPTIES[style]
+    return Text(value, style=style)
+
+
+class _AllocTotals(NamedTuple):
+    """Month figures behind the allocations view's summary line.
+
+    bill is (points, finalised) when points are shown, else None.
+    """
+    allocated: Decimal
+    worked: Decimal
+    entered: Decimal
+    mismatch_days: int
+    bill: tuple[int, bool] | None
+
+
+def _same_cell(old: object, new: object) -> bool:
+    """Return True if two table cells would render identically."""
+    if old is new:
+        return True
+    if isinstance(old, Text) and isinstance(new, Text):
+        # Text equality ignores the base style, which we use for dimming
+        return old.plain == new.plain and old.style == new.style and old.spans == new.spans
+    return old == new
+
 
 def _emit_terminal_title(title: str) -> None:
     """Send OSC 0 so the terminal updates its window/tab title.
@@ -183,63 +327,69 @@ class TimesheetDataTable(DataTable):
             ).rich_style
         return row_style
 
+    def set_columns(self, columns: Sequence[tuple[str, int]]) -> bool:
+        """Replace the columns with (label, width) pairs, unless already shown.
+
+        Columns only added or removed at the end (e.g. the money columns)
+        are changed in place, keeping the rows for replace_rows to patch;
+        any other change clears the table and rebuilds it.
+
+        Returns True if the columns changed.
+        """
+        current = [(column.label.plain, column.width) for column in self.columns.values()]
+        columns = list(columns)
+        if current == columns:
+            return False
+        if columns[:len(current)] == current:
+            for label, width in columns[len(current):]:
+                self.add_column(label, width=width)
+        elif current[:len(columns)] == columns:
+            for key in list(self.columns)[len(columns):]:
+                self.remove_column(key)
+        else:
+            self.clear(columns=True)
+            for label, width in columns:
+                self.add_column(label, width=width)
+        return True
+
+    def replace_rows(self, rows: Sequence[tuple[str, Sequence[object]]]) -> None:
+        """Show the given (key, cells) rows, patching cells in place when possible.
+
+        If the row keys match those already shown, only the cells whose
+        content changed are updated, avoiding a clear and full re-layout.
+        Otherwise the table is cleared and rebuilt.
+        """
+        keys = [row.key.value for row in self.ordered_rows]
+        if keys != [key for key, _ in rows] or any(
+            len(cells) != len(self.columns) for _, cells in rows
+        ):
+            self.clear()
+            for key, cells in rows:
+                self.add_row(*cells, key=key)
+            return
+
+        for row_index, (key, cells) in enumerate(rows):
+            current = self.get_row(key)
+            for column, value in enumerate(cells):
+                if not _same_cell(current[column], value):
+                    self.update_cell_at(Coordinate(row_index, column), value)
+
     def on_key(self, event) -> None:
         """Handle key events - intercept left/right in week/month/day views, 'c' in allocations."""
-        if not hasattr(self.app, 'view_mode'):
+        # (key, view mode) -> app handler, built once when the app mounts
+        handlers = getattr(self.app, '_table_key_handlers', None)
+        if handlers is None:
             return  # Let default handling occur
 
-        view_mode = self.app.view_mode  # type: ignore[attr-defined]
+        handler = handlers.get((event.key, self.app.view_mode))  # type: ignore[attr-defined]
+        if handler is None:
+            return  # For other keys/views, don't intercept - let DataTable handle normally
 
-        if event.key == "left" and view_mode in ("week", "month", "day"):
-            if hasattr(self.app, 'action_prev_week'):
-                self.app.action_prev_week()  # type: ignore[attr-defined]
+        handler()
+        if event.key in ("left", "right"):
             self.scroll_x = 0
-            event.prevent_default()
-            event.stop()
-        elif event.key == "right" and view_mode in ("week", "month", "day"):
-            if hasattr(self.app, 'action_next_week'):
-                self.app.action_next_week()  # type: ignore[attr-defined]
-            self.scroll_x = 0
-            event.prevent_default()
-            event.stop()
-        elif event.key in ("c", "enter") and view_mode == "allocations":
-            # Toggle entered state with 'c' or Enter key
-            if hasattr(self.app, '_toggle_allocation_entered_state'):
-                self.app._toggle_allocation_entered_state()  # type: ignore[attr-defined]
-            event.prevent_default()
-            event.stop()
-        elif event.key == "p" and view_mode == "allocations":
-            # Toggle points entered state
-            if hasattr(self.app, '_toggle_points_entered_state'):
-                self.app._toggle_points_entered_state()  # type: ignore[attr-defined]
-            event.prevent_default()
-            event.stop()
-        elif event.key == "e" and view_mode == "allocations":
-            if hasattr(self.app, '_alloc_edit_allocation'):
-                self.app._alloc_edit_allocation()  # type: ignore[attr-defined]
-            event.prevent_default()
-            event.stop()
-        elif event.key == "a" and view_mode == "allocations":
-            if hasattr(self.app, '_alloc_add_allocation'):
-                self.app._alloc_add_allocation()  # type: ignore[attr-defined]
-            event.prevent_default()
-            event.stop()
-        elif event.key == "d" and view_mode == "allocations":
-            if hasattr(self.app, '_alloc_delete_allocation'):
-                self.app._alloc_delete_allocation()  # type: ignore[attr-defined]
-            event.prevent_default()
-            event.stop()
-        elif event.key == "v" and view_mode == "allocations":
-            if hasattr(self.app, '_alloc_move_allocation'):
-                self.app._alloc_move_allocation()  # type: ignore[attr-defined]
-            event.prevent_default()
-            event.stop()
-        elif event.key == "t" and view_mode == "allocations":
-            if hasattr(self.app, '_alloc_edit_ticket'):
-                self.app._alloc_edit_ticket()  # type: ignore[attr-defined]
-            event.prevent_default()
-            event.stop()
-        # For other keys/views, don't intercept - let DataTable handle normally
+        event.prevent_default()
+        event.stop()
 
 
     def on_click(self, event) -> None:
@@ -452,6 +602,10 @@ class TimesheetApp(App):
         super().__init__()
         storage.init_db()
 
+        # Config only changes through explicit saves, so it is loaded on
+        # first use and kept rather than re-read on every refresh and keypress
+        self._config_cache: Config | None = None
+
         # View mode: "week", "month", "year", or "day"
         self.view_mode = "week"
 
@@ -475,6 +629,18 @@ class TimesheetApp(App):
         # Day view: currently selected date and its allocations
         self.day_view_date: date | None = None
         self.day_allocations: list[TicketAllocation] = []
+        self._day_allocations_total = _ZERO
+
+        # Allocations view: ticket whose ID cell is currently highlighted
+        self._alloc_highlighted_row: str | None = None
+        # Ticket ID cells from the last render, as (normal, highlighted), so
+        # moving the highlight doesn't look the ticket up again
+        self._alloc_ticket_cells: dict[str, tuple[str | Text, Text]] = {}
+        # (allocated, entered) hours per ticket row and the month's totals
+        # from the last render, so toggling an allocation's entered flag can
+        # patch the affected cells instead of rebuilding the table
+        self._alloc_row_totals: dict[str, tuple[Decimal, Decimal]] = {}
+        self._alloc_totals = _AllocTotals(_ZERO, _ZERO, _ZERO, 0, None)
 
         # Privacy mode: hide earnings by default
         self.show_money = False
@@ -485,38 +651,133 @@ class TimesheetApp(App):
         # Clipboard for cut/copy/paste
         self._day_clipboard: TimeEntry | None = None
 
+        # Entries by month for the current month and its neighbours, so
+        # crossing a month boundary doesn't wait on SQLite
+        self._month_cache: dict[tuple[int, int], dict[date, TimeEntry]] = {}
+        # storage.write_count() when the month cache was last known to match
+        # storage; see _sync_month_cache()
+        self._month_cache_writes: tuple[int, int] = (0, 0)
+
+        # Rendered week-view cells per date, keyed on the entry object they
+        # were built from (None for blank days) and the month being viewed
+        self._week_row_cache: dict[date, tuple[TimeEntry | None, int, tuple[Text, ...]]] = {}
+
+        # Empty entries handed out for unsaved days, reused per date until
+        # the month changes
+        self._blank_entries: dict[date, TimeEntry] = {}
+
+        # State each view was last rendered from, so a refresh with nothing
+        # new to show is skipped. _render_version is bumped whenever the
+        # in-memory data changes; commits, including those made by the HTTP
+        # API in another process, are caught by storage.write_count()
+        self._render_version = 0
+        self._last_rendered: dict[str, tuple] = {}
+
+        # Per-month totals and bill points for the year view, kept until the
+        # next commit from any process, the HTTP API included (or config
+        # reload), so toggling money redraws without touching storage;
+        # _month_totals_writes is the storage.write_count() they were
+        # computed at
+        self._month_totals_cache: dict[tuple[int, int], dict] = {}
+        self._month_bill_cache: dict[tuple[int, int], tuple[int, bool]] = {}
+        self._month_totals_writes: tuple[int, int] | None = None
+
+        # (ticket_id, date) -> allocation for the month the allocations view
+        # last rendered, and the (render version, write count, year, month)
+        # it holds, so cursor moves and key actions needn't re-query storage;
+        # the write count also moves when the HTTP API commits elsewhere
+        self._alloc_lookup: dict[tuple[str, date], TicketAllocation] = {}
+        self._alloc_lookup_state: tuple[int, tuple[int, int], int, int] | None = None
+
+        # Entry last formatted for the day view and its display strings
+        self._day_entry_strs: tuple[TimeEntry | None, tuple[str, str, str, str, str, str]] | None = None
+
+        # Inputs of the month and year earnings panels as last shown, so an
+        # unchanged panel isn't reformatted and repainted
+        self._earnings_rendered: dict[str, tuple] = {}
+
         # Help panel state
         self._help_panel_visible = False
 
+    @property
+    def _config(self) -> Config:
+        """The current config, loaded from storage on first use."""
+        if self._config_cache is None:
+            self._config_cache = storage.get_config()
+        return self._config_cache
+
+    def _invalidate_config(self) -> None:
+        """Drop the cached config so the next use reloads it."""
+        self._config_cache = None
+        self._month_totals_cache.clear()
+        self._month_bill_cache.clear()
+        self._invalidate_render()
+
+    def _invalidate_render(self) -> None:
+        """Force every view to re-render on its next refresh."""
+        self._render_version += 1
+
+    def _render_is_current(self, view: str, *state: object) -> bool:
+        """Return True if view was last rendered from the same state.
+
+        Otherwise records the state as rendered and returns False. Any commit
+        (from this process or another), data reload, money toggle or change
+        of day counts as new state.
+        """
+        key = (
+            self._render_version, storage.write_count(), self.show_money,
+            date.today(), *state,
+        )
+        if self._last_rendered.get(view) == key:
+            return True
+        self._last_rendered[view] = key
+        return False
+
+    def on_app_focus(self) -> None:
+        """Pick up config and entries saved by another process (e.g. an import) while unfocused."""
+        self._invalidate_config()
+        self._reload_month_data()
+        self._refresh_display()
+
+    @property
+    def weeks(self) -> Sequence[tuple[date, date]]:
+        """(week_start, week_end) pairs for the current month."""
+        return self._weeks
+
+    @weeks.setter
+    def weeks(self, weeks: Sequence[tuple[date, date]]) -> None:
+        self._weeks = weeks
+        # Map every day of every week to its index for O(1) week lookups
+        self._date_to_week = {
+            start + offset: idx
+            for idx, (start, end) in enumerate(weeks)
+            for offset in _DAY_OFFSETS[:(end - start).days + 1]
+        }
+
     def _find_week_for_date(self, d: date) -> int:
         """Find which week index contains the given date."""
-        for i, (start, end) in enumerate(self.weeks):
-            if start <= d <= end:
-                return i
-        return 0
+        return self._date_to_week.get(d, 0)
 
     def _get_week_month(self, week_start: date, week_end: date) -> tuple[int, int]:
         """Determine which month a week belongs to based on weekday majority.
 
         Returns (year, month) of the month that contains the majority of weekdays.
         """
-        weekday_months: dict[tuple[int, int], int] = {}
-
-        current = week_start
-        while current <= week_end:
-            if current.weekday() < 5:  # Mon-Fri
-                key = (current.year, current.month)
-                weekday_months[key] = weekday_months.get(key, 0) + 1
-            current += timedelta(days=1)
-
-        if not weekday_months:
-            return (week_start.year, week_start.month)
-
-        return max(weekday_months.keys(), key=lambda k: weekday_months[k])
+        return get_week_month(week_start, week_end)
 
     def _sync_month_to_week(self):
         """Update current month if the current week belongs to a different month."""
         week_start, week_end = self.weeks[self.current_week_idx]
+
+        # Common case: Monday and Friday (week_end) are both in the current
+        # month, so every weekday is and the majority count can be skipped
+        monday = week_start + _DAY_OFFSETS[2]
+        if (
+            monday.month == week_end.month == self.current_month
+            and monday.year == self.current_year
+        ):
+            return
+
         year, month = self._get_week_month(week_start, week_end)
 
         if year != self.current_year or month != self.current_month:
@@ -531,7 +792,7 @@ class TimesheetApp(App):
             self._load_month_data()
 
             # Update header
-            header = self.query_one("#combined-header", CombinedHeader)
+            header = self._combined_header
             header.year = self.current_year
             header.month = self.current_month
 
@@ -569,6 +830,49 @@ class TimesheetApp(App):
         yield Footer()
 
     def on_mount(self):
+        # Keys the tables hand to the app rather than handling themselves,
+        # by (key, view mode); see TimesheetDataTable.on_key
+        self._table_key_handlers: dict[tuple[str, str], Callable[[], None]] = {}
+        for view in ("week", "month", "day"):
+            self._table_key_handlers[("left", view)] = self.action_prev_week
+            self._table_key_handlers[("right", view)] = self.action_next_week
+        self._table_key_handlers.update({
+            # Toggle entered state with 'c' or Enter key
+            ("c", "allocations"): self._toggle_allocation_entered_state,
+            ("enter", "allocations"): self._toggle_allocation_entered_state,
+            ("p", "allocations"): self._toggle_points_entered_state,
+            ("e", "allocations"): self._alloc_edit_allocation,
+            ("a", "allocations"): self._alloc_add_allocation,
+            ("d", "allocations"): self._alloc_delete_allocation,
+            ("v", "allocations"): self._alloc_move_allocation,
+            ("t", "allocations"): self._alloc_edit_ticket,
+        })
+
+        # Look up the widgets every refresh touches once, rather than walking
+        # the DOM on each keystroke
+        self._combined_header = self.query_one("#combined-header", CombinedHeader)
+        self._week_table = self.query_one("#week-table", TimesheetDataTable)
+        self._weekly_summary = self.query_one("#weekly-summary", WeeklySummary)
+        self._week_earnings = self.query_one("#week-earnings", Static)
+        self._month_header = self.query_one("#month-header", Static)
+        self._month_table = self.query_one("#month-table", TimesheetDataTable)
+        self._month_summary = self.query_one("#month-summary", Static)
+        self._month_earnings = self.query_one("#month-earnings", Static)
+        self._year_header = self.query_one("#year-header", Static)
+        self._year_table = self.query_one("#year-table", TimesheetDataTable)
+        self._year_summary = self.query_one("#year-summary", Static)
+        self._year_earnings = self.query_one("#year-earnings", Static)
+        self._day_table = self.query_one("#day-table", TimesheetDataTable)
+        self._alloc_table = self.query_one("#allocations-table", TimesheetDataTable)
+        self._billing_table = self.query_one("#billing-table", TimesheetDataTable)
+        self._alloc_description = self.query_one("#alloc-description", DayDescription)
+        # (view mode, widget) for every mode-specific widget
+        self._mode_widgets = [
+            (view, self.query_one(widget_id))
+            for view, widget_ids in _MODE_WIDGETS.items()
+            for widget_id in widget_ids
+        ]
+
         self._setup_week_table()
         self._setup_month_table()
         self._setup_year_table()
@@ -577,7 +881,7 @@ class TimesheetApp(App):
         self._setup_billing_table()
         self._load_month_data()
         # Ensure header matches initial state
-        header = self.query_one("#combined-header", CombinedHeader)
+        header = self._combined_header
         header.year = self.current_year
         header.month = self.current_month
         # Set up initial binding visibility
@@ -585,7 +889,7 @@ class TimesheetApp(App):
         self._refresh_display()
         self._select_date(date.today())
         # Focus the week table
-        self.query_one("#week-table", DataTable).focus()
+        self._week_table.focus()
         # Probe git for upstream updates in the background so the UI is
         # interactive immediately; the worker fails safe (no dialog) when
         # not in a git repo, offline, or already in sync.
@@ -638,7 +942,7 @@ class TimesheetApp(App):
             self.exit()
 
     def _setup_week_table(self):
-        table = self.query_one("#week-table", DataTable)
+        table = self._week_table
         table.cursor_type = "row"
         table.add_column("Day", width=4)
         table.add_column("Date", width=8)
@@ -652,35 +956,30 @@ class TimesheetApp(App):
         table.add_column("Comment", width=48)  # Slightly smaller to fit Alloc
 
     def _setup_month_table(self):
-        table = self.query_one("#month-table", DataTable)
+        table = self._month_table
         table.cursor_type = "row"
-        table.add_column("W/C Mon", width=12)
-        table.add_column("Worked", width=8)
-        table.add_column("Poss", width=8)
-        table.add_column("L", width=6)
-        table.add_column("S", width=6)
-        table.add_column("T", width=6)
-        table.add_column("P", width=6)
-        table.add_column("Total", width=8)
+        table.set_columns(self._month_columns())
 
     def _setup_year_table(self):
-        table = self.query_one("#year-table", DataTable)
+        table = self._year_table
         table.cursor_type = "row"
-        table.add_column("Month", width=12)
-        table.add_column("Worked", width=8)
-        table.add_column("Poss", width=8)
-        table.add_column("L", width=6)
-        table.add_column("S", width=6)
-        table.add_column("T", width=6)
-        table.add_column("P", width=6)
-        table.add_column("Total", width=8)
+        table.set_columns(self._year_columns())
+
+    def _month_columns(self) -> Sequence[tuple[str, int]]:
+        """Month table columns; money columns only for hourly-billed months."""
+        if self.show_money and self._is_hourly_billing_month():
+            return _MONTH_COLUMNS + _MONEY_COLUMNS
+        return _MONTH_COLUMNS
+
+    def _year_columns(self) -> Sequence[tuple[str, int]]:
+        """Year table columns, with money columns when earnings are shown."""
         if self.show_money:
-            table.add_column("Bill", width=10)
-            table.add_column("+VAT", width=10)
+            return _YEAR_COLUMNS + _MONEY_COLUMNS
+        return _YEAR_COLUMNS
 
     def _setup_day_table(self):
         """Set up the day allocations table."""
-        table = self.query_one("#day-table", DataTable)
+        table = self._day_table
         table.cursor_type = "row"
         table.add_column("Ticket", width=10)
         table.add_column("Ticket Desc", width=25)
@@ -690,67 +989,132 @@ class TimesheetApp(App):
 
     def _setup_allocations_table(self):
         """Set up the allocations report table (columns added dynamically)."""
-        table = self.query_one("#allocations-table", DataTable)
+        table = self._alloc_table
         table.cursor_type = "cell"  # Cell mode for clicking individual allocations
         # Columns are added dynamically in _refresh_allocations_display
 
     def _is_hourly_billing_month(self) -> bool:
         """Check if the current month uses hourly billing (pre-contract)."""
-        config = storage.get_config()
+        config = self._config
         if not config.contract_start:
             return True
         current = date(self.current_year, self.current_month, 1)
         return current < config.contract_start
 
     def _rebuild_tables(self):
-        """Rebuild table columns when show_money changes."""
-        # Rebuild month table
-        month_table = self.query_one("#month-table", DataTable)
-        month_table.clear(columns=True)
-        month_table.add_column("W/C Mon", width=12)
-        month_table.add_column("Worked", width=8)
-        month_table.add_column("Poss", width=8)
-        month_table.add_column("L", width=6)
-        month_table.add_column("S", width=6)
-        month_table.add_column("T", width=6)
-        month_table.add_column("P", width=6)
-        month_table.add_column("Total", width=8)
-        if self.show_money and self._is_hourly_billing_month():
-            month_table.add_column("Bill", width=10)
-            month_table.add_column("+VAT", width=10)
-
-        # Rebuild year table
-        year_table = self.query_one("#year-table", DataTable)
-        year_table.clear(columns=True)
-        year_table.add_column("Month", width=12)
-        year_table.add_column("Worked", width=8)
-        year_table.add_column("Poss", width=8)
-        year_table.add_column("L", width=6)
-        year_table.add_column("S", width=6)
-        year_table.add_column("T", width=6)
-        year_table.add_column("P", width=6)
-        year_table.add_column("Total", width=8)
-        if self.show_money:
-            year_table.add_column("Bill", width=10)
-            year_table.add_column("+VAT", width=10)
+        """Update table columns when show_money changes.
 
-        # Rebuild billing table
+        Only the trailing money columns are added or removed; the rows are
+        kept and patched by the following refresh.
+        """
+        self._month_table.set_columns(self._month_columns())
+        self._year_table.set_columns(self._year_columns())
         self._setup_billing_table()
 
     def _load_month_data(self):
-        """Load all entries for current month into memory."""
-        entries = storage.get_month_entries(self.current_year, self.current_month)
-        self.entries = {e.date: e for e in entries}
+        """Load all entries for current month into memory.
 
-    def _get_or_create_entry(self, d: date) -> TimeEntry:
-        """Get entry for date or create empty one."""
-        if d in self.entries:
-            return self.entries[d]
+        Served from the month cache when possible. The first load fetches the
+        adjacent months in the same query; afterwards any missing neighbours
+        are prefetched once the display has refreshed.
+        """
+        key = (self.current_year, self.current_month)
+        if not self._month_cache:
+            self._month_cache_writes = storage.write_count()
+            self._fetch_months(self._adjacent_months(key))
+        elif key not in self._month_cache:
+            self._fetch_months([key])
+        self.entries = self._month_cache[key]
+        self._week_row_cache.clear()
+        self._blank_entries.clear()
+        self._invalidate_render()
+        self.call_after_refresh(self._prefetch_adjacent_months)
+
+    def _reload_month_data(self) -> None:
+        """Drop the month cache and load the current month afresh from storage."""
+        self._month_cache.clear()
+        self._load_month_data()
+
+    def _sync_month_cache(self) -> bool:
+        """Reload the month cache if another process has committed since it was checked.
 
-        return TimeEntry(
-            date=d,
-            day_of_week=d.strftime("%a"),
+        Each local commit moves both parts of storage.write_count() by one;
+        any other movement means something else (an import, the HTTP API)
+        wrote, so cached entries may be out of date. Returns True if the
+        cache was reloaded.
+        """
+        writes, version = storage.write_count()
+        last_writes, last_version = self._month_cache_writes
+        if version - last_version == writes - last_writes:
+            self._month_cache_writes = (writes, version)
+            return False
+        self._reload_month_data()
+        return True
+
+    @staticmethod
+    def _adjacent_months(key: tuple[int, int]) -> list[tuple[int, int]]:
+        """Return the (year, month) keys for the month before, key, and the month after."""
+        year, month = key
+        prev_month = (year - 1, 12) if month == 1 else (year, month - 1)
+        next_month = (year + 1, 1) if month == 12 else (year, month + 1)
+        return [prev_month, key, next_month]
+
+    def _fetch_months(self, keys: list[tuple[int, int]]) -> None:
+        """Load consecutive months into the month cache with a single query."""
+        from calendar import monthrange
+
+        first_year, first_month = keys[0]
+        last_year, last_month = keys[-1]
+        entries = storage.get_entries_range(
+            date(first_year, first_month, 1),
+            date(last_year, last_month, monthrange(last_year, last_month)[1]),
         )
+        for key in keys:
+            self._month_cache[key] = {}
+        for entry in entries:
+            self._month_cache[(entry.date.year, entry.date.month)][entry.date] = entry
+
+    def _prefetch_adjacent_months(self) -> None:
+        """Fetch the current month's neighbours and drop months further away."""
+        wanted = self._adjacent_months((self.current_year, self.current_month))
+        for key in list(self._month_cache):
+            if key not in wanted:
+                del self._month_cache[key]
+        for key in wanted:
+            if key not in self._month_cache:
+                self._fetch_months([key])
+
+    def _cache_entry(self, entry: TimeEntry) -> None:
+        """Record a saved entry in the month cache.
+
+        Updates its own month if loaded, plus any other cached month holding
+        the date (a boundary day edited from the neighbouring month's week).
+        """
+        d = entry.date
+        own = self._month_cache.get((d.year, d.month))
+        if own is not None:
+            own[d] = entry
+        for month in self._month_cache.values():
+            if d in month:
+                month[d] = entry
+        self._invalidate_render()
+
+    def _get_or_create_entry(self, d: date) -> TimeEntry:
+        """Get entry for date or an empty one.
+
+        Empty entries are shared per date and never stored in self.entries,
+        which only holds days that have been saved.
+        """
+        entry = self.entries.get(d)
+        if entry is not None:
+            return entry
+        blank = self._blank_entries.get(d)
+        if blank is None:
+            blank = self._blank_entries[d] = TimeEntry(
+                date=d,
+                day_of_week=DAY_ABBRS[d.weekday()],
+            )
+        return blank
 
     def _count_weekdays(self, start: date, end: date, filter_month: int | None = None) -> int:
         """Count weekdays (Mon-Fri) in a date range.
@@ -760,16 +1124,21 @@ class TimesheetApp(App):
             end: End date
             filter_month: If provided, only count days in this month (1-12)
         """
+        if filter_month is None:
+            return count_weekdays(start, end)
+
+        from calendar import monthrange
+
+        # Clip the range to filter_month in each year it spans
         count = 0
-        current = start
-        while current <= end:
-            if current.weekday() < 5:  # Mon=0 to Fri=4
-                if filter_month is None or current.month == filter_month:
-                    count += 1
-            current += timedelta(days=1)
+        for year in range(start.year, end.year + 1):
+            month_start = date(year, filter_month, 1)
+            month_end = date(year, filter_month, monthrange(year, filter_month)[1])
+            count += count_weekdays(max(start, month_start), min(end, month_end))
         return count
 
     def _refresh_display(self):
+        self._sync_month_cache()
         if self.view_mode == "week":
             self._refresh_week_display()
         elif self.view_mode == "month":
@@ -796,14 +1165,10 @@ class TimesheetApp(App):
         mode = self.view_mode
         if mode == "week":
             if self.weeks and 0 <= self.current_week_idx < len(self.weeks):
-                month_name = date(
-                    self.current_year, self.current_month, 1,
-                ).strftime("%B %Y")
+                month_name = f"{MONTH_NAMES[self.current_month]} {self.current_year}"
                 return f"TIMESHEET: WEEK {self.current_week_idx + 1} {month_name}"
         elif mode == "month":
-            month_name = date(
-                self.current_year, self.current_month, 1,
-            ).strftime("%B %Y")
+            month_name = f"{MONTH_NAMES[self.current_month]} {self.current_year}"
             return f"TIMESHEET: {month_name}"
         elif mode == "year":
             return (
@@ -811,17 +1176,16 @@ class TimesheetApp(App):
                 f"-{self.company_year_start + 1}"
             )
         elif mode == "day" and self.day_view_date:
-            return f"ALLOCATIONS: {self.day_view_date.strftime('%a %b %d, %Y')}"
+            d = self.day_view_date
+            return f"ALLOCATIONS: {DAY_ABBRS[d.weekday()]} {MONTH_ABBRS[d.month]} {d.day:02d}, {d.year}"
         elif mode == "allocations":
-            month_name = date(
-                self.current_year, self.current_month, 1,
-            ).strftime("%B %Y")
+            month_name = f"{MONTH_NAMES[self.current_month]} {self.current_year}"
             return f"ALLOCATIONS: {month_name}"
         elif mode == "billing":
             if self.billing_view_period is None:
                 return "CURRENT BILL"
             y, m = self.billing_view_period
-            return f"BILL {date(y, m, 1).strftime('%b %Y').upper()}"
+            return f"BILL {MONTH_ABBRS[m].upper()} {y}"
         return ""
 
     def on_screen_resume(self) -> None:
@@ -829,9 +1193,13 @@ class TimesheetApp(App):
         self._update_window_title()
 
     def _refresh_week_display(self):
+        if self._render_is_current(
+            "week", self.current_year, self.current_month, self.current_week_idx,
+        ):
+            return
+
         # Update combined header
-        combined_header = self.query_one("#combined-header", CombinedHeader)
-        config = storage.get_config()
+        combined_header = self._combined_header
 
         week_start, week_end = self.weeks[self.current_week_idx]
 
@@ -842,39 +1210,52 @@ class TimesheetApp(App):
             week_end
         )
 
-        # Calculate week totals and breakdown by type (filtered to current month only)
-        week_worked = Decimal("0")
-        week_leave = Decimal("0")
-        week_sick = Decimal("0")
-        week_training = Decimal("0")
-        week_public_holiday = Decimal("0")
-
-        for i in range(7):
-            d = week_start + timedelta(days=i)
-            # Only include days from the current month in totals
-            if d.month != self.current_month:
-                continue
-            entry = self._get_or_create_entry(d)
-            week_worked += entry.worked_hours
+        # Build the rows and collect the entries that count towards the
+        # totals (days in the current month) in one pass over the week
+        rows: list[tuple[str, tuple[Text, ...]]] = []
+        counted: list[TimeEntry] = []
+        for offset in _DAY_OFFSETS:
+            d = week_start + offset
+            entry = self.entries.get(d)
+            rows.append((d.isoformat(), self._week_row(d, entry)))
+            if entry is not None and d.month == self.current_month:
+                counted.append(entry)
+        self._refresh_week_summary(counted)
 
-            # Categorise adjustments by type
-            if entry.adjusted_hours:
-                if entry.adjust_type == "L":
-                    week_leave += entry.adjusted_hours
-                elif entry.adjust_type == "S":
-                    week_sick += entry.adjusted_hours
-                elif entry.adjust_type == "T":
-                    week_training += entry.adjusted_hours
-                elif entry.adjust_type == "P":
-                    week_public_holiday += entry.adjusted_hours
+        # Hide week earnings (hourly billing no longer applicable)
+        week_earnings = self._week_earnings
+        week_earnings.add_class("hidden")
+
+        # Update table
+        table = self._week_table
+        table.replace_rows(rows)
+
+    def _get_counted_week_entries(self) -> list[TimeEntry]:
+        """Return the current week's entries for days in the current month."""
+        week_start, _ = self.weeks[self.current_week_idx]
+        entries = self.entries
+        return [
+            entry for entry in (entries.get(week_start + offset) for offset in _DAY_OFFSETS)
+            if entry is not None and entry.date.month == self.current_month
+        ]
+
+    def _refresh_week_summary(self, counted: list[TimeEntry]) -> None:
+        """Recalculate the weekly summary from the week's in-month entries."""
+        config = self._config
+        week_start, week_end = self.weeks[self.current_week_idx]
+
+        # Calculate week totals and breakdown by type (filtered to current month only)
+        (
+            week_worked, week_leave, week_sick, week_training, week_public_holiday,
+        ) = map(hundredths_to_hours, self._tally_hundredths(counted))
 
         # Calculate max week hours: weekdays × daily hours - public holiday adjustments
         # Only count weekdays in the current month
         week_weekdays = self._count_weekdays(week_start, week_end, filter_month=self.current_month)
-        week_max_hours = (Decimal(week_weekdays) * config.standard_day_hours) - week_public_holiday
+        week_max_hours = (_DECIMAL_INTS[week_weekdays] * config.standard_day_hours) - week_public_holiday
 
         # Update weekly summary
-        weekly_summary = self.query_one("#weekly-summary", WeeklySummary)
+        weekly_summary = self._weekly_summary
         weekly_summary.update_display(
             week_worked,
             week_max_hours,
@@ -885,95 +1266,172 @@ class TimesheetApp(App):
             config
         )
 
-        # Hide week earnings (hourly billing no longer applicable)
-        week_earnings = self.query_one("#week-earnings", Static)
-        week_earnings.add_class("hidden")
+    def _refresh_week_day(self, d: date) -> None:
+        """Update a single day's row and the weekly summary after an edit.
 
-        # Update table
-        table = self.query_one("#week-table", DataTable)
-        table.clear()
+        Patches the existing row's cells in place rather than clearing and
+        rebuilding the whole table, so the cursor and the other six rows are
+        left untouched. Falls back to a full refresh if the day isn't shown.
+        """
+        table = self._week_table
+        row_key = d.isoformat()
+        if self.view_mode != "week" or row_key not in table.rows:
+            self._refresh_display()
+            return
 
-        for i in range(7):
-            d = week_start + timedelta(days=i)
-            entry = self._get_or_create_entry(d)
+        row_index = table.get_row_index(row_key)
+        for column, value in enumerate(self._week_row(d, self.entries.get(d))):
+            table.update_cell_at(Coordinate(row_index, column), value)
+        self._refresh_week_summary(self._get_counted_week_entries())
 
-            in_str = entry.clock_in.strftime("%H:%M") if entry.clock_in else "-"
-            lunch_str = f"{int(entry.lunch_duration.total_seconds() // 60):02d}m" if entry.lunch_duration else "-"
-            out_str = entry.clock_out.strftime("%H:%M") if entry.clock_out else "-"
-            worked_str = f"{float(entry.worked_hours):g}h" if entry.worked_hours else "-"
-            adj_str = f"{float(entry.adjusted_hours):g}h" if entry.adjusted_hours else "-"
-            type_str = entry.adjust_type or ""
-            comment_str = (entry.comment[:45] + "...") if entry.comment and len(entry.comment) > 45 else (entry.comment or "")
+    def _week_row(self, d: date, entry: TimeEntry | None) -> tuple[Text, ...]:
+        """Return every cell of a day's week-view row."""
+        cells = self._week_row_cells(d, entry)
 
-            # Calculate allocation status
-            alloc_status = self._get_allocation_status(d, entry.worked_hours)
+        # Allocation status is always recalculated: allocations change
+        # independently of the time entry the cached cells came from
+        worked_hours = entry.worked_hours if entry is not None else _ZERO
+        alloc_status = self._get_allocation_status(d, worked_hours)
 
-            # Highlight if this day is in the current billing month
-            date_str = d.strftime("%b %d")
-            if d.month != self.current_month:
-                date_str = f"({date_str})"
+        return (*cells[:6], alloc_status, *cells[6:])
 
-            # Dim weekend rows
-            is_weekend = entry.day_of_week in ("Sat", "Sun")
-            style = "dim" if is_weekend else ""
+    def _week_row_cells(self, d: date, entry: TimeEntry | None) -> tuple[Text, ...]:
+        """Return the week-view cells for a day, excluding allocation status.
 
-            table.add_row(
-                Text(entry.day_of_week, style=style),
+        Cells are rebuilt only when the day's entry object has been replaced
+        or the viewed month has changed (which alters the boundary-day date
+        formatting); otherwise the previously rendered Text objects are reused.
+        Blank days (entry is None) are rendered without a placeholder TimeEntry.
+        """
+        cached = self._week_row_cache.get(d)
+        if cached is not None and cached[0] is entry and cached[1] == self.current_month:
+            return cached[2]
+
+        # Highlight if this day is in the current billing month
+        date_str = format_short_date(d)
+        if d.month != self.current_month:
+            date_str = f"({date_str})"
+
+        if entry is None:
+            # Dim weekend rows
+            style = _DIM if d.weekday() >= 5 else _PLAIN
+            dash, empty = _DASHES[style], _EMPTIES[style]
+            cells = (
+                Text(DAY_ABBRS[d.weekday()], style=style),
                 Text(date_str, style=style),
-                Text(in_str, style=style),
-                Text(lunch_str, style=style),
-                Text(out_str, style=style),
-                Text(worked_str, style=style),
-                alloc_status,
-                Text(adj_str, style=style),
-                Text(type_str, style=style),
-                Text(comment_str, style=style),
-                key=d.isoformat(),
+                dash, dash, dash, dash, dash,
+                empty, empty,
             )
+            self._week_row_cache[d] = (entry, self.current_month, cells)
+            return cells
+
+        in_str = f"{entry.clock_in.hour:02d}:{entry.clock_in.minute:02d}" if entry.clock_in else "-"
+        lunch_str = f"{int(entry.lunch_duration.total_seconds() // 60):02d}m" if entry.lunch_duration else "-"
+        out_str = f"{entry.clock_out.hour:02d}:{entry.clock_out.minute:02d}" if entry.clock_out else "-"
+        worked_str = f"{float(entry.worked_hours):g}h" if entry.worked_hours else "-"
+        adj_str = f"{float(entry.adjusted_hours):g}h" if entry.adjusted_hours else "-"
+        type_str = entry.adjust_type or ""
+        comment_str = (entry.comment[:45] + "...") if entry.comment and len(entry.comment) > 45 else (entry.comment or "")
+
+        # Dim weekend rows
+        is_weekend = entry.day_of_week in ("Sat", "Sun")
+        style = _DIM if is_weekend else _PLAIN
+
+        cells = (
+            Text(entry.day_of_week, style=style),
+            Text(date_str, style=style),
+            _cell(in_str, style),
+            _cell(lunch_str, style),
+            _cell(out_str, style),
+            _cell(worked_str, style),
+            _cell(adj_str, style),
+            _cell(type_str, style),
+            _cell(comment_str, style),
+        )
+        self._week_row_cache[d] = (entry, self.current_month, cells)
+        return cells
+
+    @staticmethod
+    def _tally_hundredths(entries: Iterable[TimeEntry]) -> tuple[int, int, int, int, int]:
+        """Sum entries into (worked, leave, sick, training, public holiday) hundredths of an hour.
 
-    def _get_week_totals(self, week_start: date, week_end: date, filter_month: int | None = None) -> dict:
+        Each entry is rounded to the hundredth as worked_hours and
+        adjusted_hours round it, so the totals match summing those, but
+        as integers converted to Decimal hours once by the caller rather
+        than adding a Decimal per entry.
+        """
+        totals = [0, 0, 0, 0, 0]
+        for entry in entries:
+            totals[0] += minutes_to_hundredths(entry.worked_minutes)
+
+            # Categorise adjustments by type
+            slot = _ADJUST_TYPE_SLOTS.get(entry.adjust_type)
+            if slot is not None:
+                totals[slot] += minutes_to_hundredths(entry.adjusted_minutes)
+        return totals[0], totals[1], totals[2], totals[3], totals[4]
+
+    def _get_week_totals(
+        self,
+        week_start: date,
+        week_end: date,
+        filter_month: int | None = None,
+        entries_dict: dict[date, TimeEntry] | None = None,
+    ) -> dict:
         """Calculate totals for a week.
 
         Args:
             week_start: Start of week (Saturday)
             week_end: End of week (Friday)
             filter_month: If provided, only count days in this month (1-12)
+            entries_dict: Entries already loaded for every counted day; if
+                omitted, the week is fetched from storage
         """
-        config = storage.get_config()
-        entries = storage.get_entries_range(week_start, week_end)
-        entries_dict = {e.date: e for e in entries}
+        if entries_dict is not None and filter_month is not None:
+            return self._get_week_totals_in_month(week_start, filter_month, entries_dict)
 
-        worked = Decimal("0")
-        leave = Decimal("0")
-        sick = Decimal("0")
-        training = Decimal("0")
-        public_holiday = Decimal("0")
+        if entries_dict is None:
+            entries = storage.get_entries_range(week_start, week_end)
+            entries_dict = {e.date: e for e in entries}
 
         # Count weekdays in week (optionally filtered by month)
-        weekdays = 0
-        current = week_start
-        while current <= week_end:
-            if current.weekday() < 5:  # Mon-Fri
-                if filter_month is None or current.month == filter_month:
-                    weekdays += 1
-            current += timedelta(days=1)
+        weekdays = self._count_weekdays(week_start, week_end, filter_month)
 
         # Sum up entries (optionally filtered by month)
-        for entry_date, entry in entries_dict.items():
-            if filter_month is not None and entry_date.month != filter_month:
+        days = [week_start + offset for offset in _DAY_OFFSETS]
+        hundredths = self._tally_hundredths(
+            entries_dict[d] for d in days
+            if d in entries_dict and (filter_month is None or d.month == filter_month)
+        )
+        return self._build_week_totals(hundredths, weekdays)
+
+    def _get_week_totals_in_month(
+        self, week_start: date, month: int, entries_dict: dict[date, TimeEntry],
+    ) -> dict:
+        """Calculate totals for the days of a week that fall in the given month.
+
+        The month view's case of _get_week_totals: the entries are already
+        loaded, so weekdays and entries are gathered in one pass over the
+        week's days.
+        """
+        weekdays = 0
+        counted: list[TimeEntry] = []
+        for offset in _DAY_OFFSETS:
+            d = week_start + offset
+            if d.month != month:
                 continue
-            worked += entry.worked_hours
-            if entry.adjusted_hours:
-                if entry.adjust_type == "L":
-                    leave += entry.adjusted_hours
-                elif entry.adjust_type == "S":
-                    sick += entry.adjusted_hours
-                elif entry.adjust_type == "T":
-                    training += entry.adjusted_hours
-                elif entry.adjust_type == "P":
-                    public_holiday += entry.adjusted_hours
-
-        max_hours = (Decimal(weekdays) * config.standard_day_hours) - public_holiday
+            if d.weekday() < 5:
+                weekdays += 1
+            entry = entries_dict.get(d)
+            if entry is not None:
+                counted.append(entry)
+        return self._build_week_totals(self._tally_hundredths(counted), weekdays)
+
+    def _build_week_totals(self, hundredths: tuple[int, int, int, int, int], weekdays: int) -> dict:
+        """Turn tallied hundredths of an hour and a weekday count into a week totals dict."""
+        config = self._config
+        worked, leave, sick, training, public_holiday = map(hundredths_to_hours, hundredths)
+
+        max_hours = (_DECIMAL_INTS[weekdays] * config.standard_day_hours) - public_holiday
         total = worked + leave + sick + training + public_holiday
 
         return {
@@ -988,81 +1446,77 @@ class TimesheetApp(App):
 
     def _refresh_month_display(self):
         """Refresh the month view (weekly summaries)."""
-        config = storage.get_config()
+        if self._render_is_current("month", self.current_year, self.current_month):
+            return
+
+        config = self._config
 
         # Update month header
-        month_header = self.query_one("#month-header", Static)
-        month_name = date(self.current_year, self.current_month, 1).strftime("%B %Y")
+        month_header = self._month_header
+        month_name = f"{MONTH_NAMES[self.current_month]} {self.current_year}"
         month_header.update(Text(f"TIMESHEET: {month_name}", style="bold"))
 
         # Rebuild table columns (structure depends on billing model for this month)
-        table = self.query_one("#month-table", DataTable)
-        table.clear(columns=True)
-        table.add_column("W/C Mon", width=12)
-        table.add_column("Worked", width=8)
-        table.add_column("Poss", width=8)
-        table.add_column("L", width=6)
-        table.add_column("S", width=6)
-        table.add_column("T", width=6)
-        table.add_column("P", width=6)
-        table.add_column("Total", width=8)
-        if self.show_money and self._is_hourly_billing_month():
-            table.add_column("Bill", width=10)
-            table.add_column("+VAT", width=10)
+        table = self._month_table
+        table.set_columns(self._month_columns())
+        rows: list[tuple[str, list[Text]]] = []
 
         # Month totals
-        month_worked = Decimal("0")
-        month_max = Decimal("0")
-        month_leave = Decimal("0")
-        month_sick = Decimal("0")
-        month_training = Decimal("0")
-        month_ph = Decimal("0")
-        month_total = Decimal("0")
+        month_worked = _ZERO
+        month_max = _ZERO
+        month_leave = _ZERO
+        month_sick = _ZERO
+        month_training = _ZERO
+        month_ph = _ZERO
+        month_total = _ZERO
 
+        today = date.today()
         for week_start, week_end in self.weeks:
             # Find Monday of this week (week commencing)
             # Weeks always start on Saturday, so Monday is 2 days later
-            monday = week_start + timedelta(days=2)
+            monday = week_start + _DAY_OFFSETS[2]
 
-            # Get week totals (filtered to only include days in current month)
-            totals = self._get_week_totals(week_start, week_end, filter_month=self.current_month)
-            wc_str = monday.strftime("%d %b")
+            # Get week totals (filtered to only include days in current month,
+            # all of which are already loaded)
+            totals = self._get_week_totals_in_month(
+                week_start, self.current_month, self.entries,
+            )
+            wc_str = f"{monday.day:02d} {MONTH_ABBRS[monday.month]}"
             # Put in parentheses if Monday is from a different month
             if monday.month != self.current_month:
                 wc_str = f"({wc_str})"
 
             # Check if this is a future week with no data
-            today = date.today()
             is_future = week_start > today
 
             # Dim if future with no work
             if is_future and totals["worked"] == 0:
-                style = "dim"
+                style = _DIM
             else:
-                style = ""
+                style = _PLAIN
 
             row_data = [
-                Text(wc_str, style=style),
-                Text(f"{float(totals['worked']):g}h" if totals['worked'] else "-", style=style),
-                Text(f"{float(totals['max_hours']):g}h" if totals['max_hours'] else "-", style=style),
-                Text(f"{float(totals['leave']):g}h" if totals['leave'] else "-", style=style),
-                Text(f"{float(totals['sick']):g}h" if totals['sick'] else "-", style=style),
-                Text(f"{float(totals['training']):g}h" if totals['training'] else "-", style=style),
-                Text(f"{float(totals['public_holiday']):g}h" if totals['public_holiday'] else "-", style=style),
-                Text(f"{float(totals['total']):g}h" if totals['total'] else "-", style=style),
+                _cell(wc_str, style),
+                _cell(f"{float(totals['worked']):g}h" if totals['worked'] else "-", style),
+                _cell(f"{float(totals['max_hours']):g}h" if totals['max_hours'] else "-", style),
+                _cell(f"{float(totals['leave']):g}h" if totals['leave'] else "-", style),
+                _cell(f"{float(totals['sick']):g}h" if totals['sick'] else "-", style),
+                _cell(f"{float(totals['training']):g}h" if totals['training'] else "-", style),
+                _cell(f"{float(totals['public_holiday']):g}h" if totals['public_holiday'] else "-", style),
+                _cell(f"{float(totals['total']):g}h" if totals['total'] else "-", style),
             ]
 
             if self.show_money and self._is_hourly_billing_month():
                 billable = totals['worked'] * config.hourly_rate
                 with_vat = billable * (1 + config.vat_rate)
-                row_data.append(Text(
-                    f"£{float(billable):,.0f}" if billable else "-", style=style,
+                row_data.append(_cell(
+                    f"£{float(billable):,.0f}" if billable else "-", style,
                 ))
-                row_data.append(Text(
-                    f"£{float(with_vat):,.0f}" if with_vat else "-", style=style,
+                row_data.append(_cell(
+                    f"£{float(with_vat):,.0f}" if with_vat else "-", style,
                 ))
 
-            table.add_row(*row_data, key=f"{week_start.isoformat()}")
+            rows.append((week_start.isoformat(), row_data))
 
             # Accumulate month totals
             month_worked += totals["worked"]
@@ -1073,8 +1527,10 @@ class TimesheetApp(App):
             month_ph += totals["public_holiday"]
             month_total += totals["total"]
 
+        table.replace_rows(rows)
+
         # Update month summary
-        month_summary = self.query_one("#month-summary", Static)
+        month_summary = self._month_summary
         text = Text()
 
         # Convert to days
@@ -1092,7 +1548,6 @@ class TimesheetApp(App):
         text.append(f"                                      of target max  {float(month_max):>6g}h      ({round(max_days, 2):>5g}d)   ({pct:.1f}%)\n")
 
         # Show "of target max to date" only for current month
-        today = date.today()
         if self.current_year == today.year and self.current_month == today.month:
             month_start = date(self.current_year, self.current_month, 1)
             max_to_date = self._get_max_hours_to_date(month_start, today)
@@ -1117,35 +1572,33 @@ class TimesheetApp(App):
         month_summary.update(text)
 
         # Update earnings display
-        month_earnings = self.query_one("#month-earnings", Static)
+        month_earnings = self._month_earnings
         if self._is_hourly_billing_month():
             # Pre-contract: hourly billing summary
             if self.show_money:
                 month_earnings.remove_class("hidden")
-                month_billable = month_worked * config.hourly_rate
-                month_with_vat = month_billable * (1 + config.vat_rate)
-                amount_str = f"£{float(month_billable):,.2f}"
-                vat_str = f"£{float(month_with_vat):,.2f}"
-                earnings_text = Text()
-                earnings_text.append(
-                    f"                                           Billable"
-                    f"  {amount_str:>10}   ({vat_str} inc VAT)",
-                )
-                month_earnings.update(earnings_text)
+                key = ("hourly", month_worked, config.hourly_rate, config.vat_rate)
+                if self._earnings_rendered.get("month") != key:
+                    self._earnings_rendered["month"] = key
+                    month_billable = month_worked * config.hourly_rate
+                    month_with_vat = month_billable * (1 + config.vat_rate)
+                    amount_str = f"£{month_billable:,.2f}"
+                    vat_str = f"£{month_with_vat:,.2f}"
+                    month_earnings.update(Text(
+                        f"                                           Billable"
+                        f"  {amount_str:>10}   ({vat_str} inc VAT)",
+                    ))
             else:
                 month_earnings.add_class("hidden")
         elif config.contract_start:
             # Post-contract: points-based summary
             month_earnings.remove_class("hidden")
-            earnings_text = Text()
 
             # This month's bill - what was billed (finalised) or will be
             # billed (current). The single figure that matches the Billing
             # view; a ticket cashes in the month it closes.
-            bill_pts, bill_finalised = storage.get_month_bill_points(
+            bill_pts, bill_finalised = self._get_month_bill_points(
                 self.current_year, self.current_month,
-                config.hours_per_point, config.point_rate, config.vat_rate,
-                contract_start=config.contract_start,
             )
             bill_label = "Billed" if bill_finalised else "To bill"
 
@@ -1189,6 +1642,15 @@ class TimesheetApp(App):
                 budget_str += f"+{rolled_over} rolled over"
             budget_str += f"={total_available} available"
 
+            key = (
+                "points", int(ytd_pts), budget_str, bill_label, bill_pts,
+                self.show_money, config.point_rate, config.vat_rate,
+            )
+            if self._earnings_rendered.get("month") == key:
+                return
+            self._earnings_rendered["month"] = key
+
+            earnings_text = Text()
             earnings_text.append(
                 f"              Contract year: {int(ytd_pts)} pts billed"
                 f"  |  This month: {budget_str}\n",
@@ -1211,47 +1673,42 @@ class TimesheetApp(App):
         else:
             month_earnings.add_class("hidden")
 
-    def _get_month_totals(self, year: int, month: int) -> dict:
-        """Calculate totals for a month."""
+    def _get_month_totals(
+        self, year: int, month: int, entries: list[TimeEntry] | None = None,
+    ) -> dict:
+        """Calculate totals for a month.
+
+        Args:
+            year: Year of the month
+            month: Month (1-12)
+            entries: The month's entries, if already loaded; if omitted and
+                the totals aren't cached, they are fetched from storage
+        """
         from calendar import monthrange
 
-        entries = storage.get_month_entries(year, month)
-        entries_dict = {e.date: e for e in entries}
-        config = storage.get_config()
+        self._expire_month_totals()
+        key = (year, month)
+        cached = self._month_totals_cache.get(key)
+        if cached is not None:
+            return cached
 
-        worked = Decimal("0")
-        leave = Decimal("0")
-        sick = Decimal("0")
-        training = Decimal("0")
-        public_holiday = Decimal("0")
+        if entries is None:
+            entries = storage.get_month_entries(year, month)
+        config = self._config
 
         # Count weekdays in month
         first_day = date(year, month, 1)
         last_day = date(year, month, monthrange(year, month)[1])
-        weekdays = 0
-        current = first_day
-        while current <= last_day:
-            if current.weekday() < 5:  # Mon-Fri
-                weekdays += 1
-            current += timedelta(days=1)
+        weekdays = count_weekdays(first_day, last_day)
 
         # Sum up entries
-        for _, entry in entries_dict.items():
-            worked += entry.worked_hours
-            if entry.adjusted_hours:
-                if entry.adjust_type == "L":
-                    leave += entry.adjusted_hours
-                elif entry.adjust_type == "S":
-                    sick += entry.adjusted_hours
-                elif entry.adjust_type == "T":
-                    training += entry.adjusted_hours
-                elif entry.adjust_type == "P":
-                    public_holiday += entry.adjusted_hours
-
-        max_hours = (Decimal(weekdays) * config.standard_day_hours) - public_holiday
+        hundredths = self._tally_hundredths(entries)
+        worked, leave, sick, training, public_holiday = map(hundredths_to_hours, hundredths)
+
+        max_hours = (_DECIMAL_INTS[weekdays] * config.standard_day_hours) - public_holiday
         total = worked + leave + sick + training + public_holiday
 
-        return {
+        totals = self._month_totals_cache[key] = {
             "worked": worked,
             "max_hours": max_hours,
             "leave": leave,
@@ -1260,43 +1717,65 @@ class TimesheetApp(App):
             "public_holiday": public_holiday,
             "total": total,
         }
+        return totals
+
+    def _expire_month_totals(self) -> None:
+        """Drop cached month totals and bills if anything has been committed since."""
+        writes = storage.write_count()
+        if writes != self._month_totals_writes:
+            self._month_totals_cache.clear()
+            self._month_bill_cache.clear()
+            self._month_totals_writes = writes
+
+    def _get_month_bill_points(self, year: int, month: int) -> tuple[int, bool]:
+        """storage.get_month_bill_points for a month, memoised until the next save."""
+        self._expire_month_totals()
+        key = (year, month)
+        bill = self._month_bill_cache.get(key)
+        if bill is None:
+            config = self._config
+            bill = self._month_bill_cache[key] = storage.get_month_bill_points(
+                year, month, config.hours_per_point,
+                config.point_rate, config.vat_rate,
+                contract_start=config.contract_start,
+            )
+        return bill
 
     def _get_max_hours_to_date(self, start_date: date, end_date: date) -> Decimal:
         """Calculate max workable hours from start_date to end_date (inclusive).
 
         Counts weekdays and subtracts public holiday hours from entries.
         """
-        config = storage.get_config()
+        config = self._config
 
         # Count weekdays in range
-        weekdays = 0
-        current = start_date
-        while current <= end_date:
-            if current.weekday() < 5:  # Mon-Fri
-                weekdays += 1
-            current += timedelta(days=1)
-
-        # Get public holiday hours from entries in this range
-        public_holiday_hours = Decimal("0")
-        for entry_date, entry in self.entries.items():
-            if start_date <= entry_date <= end_date:
-                if entry.adjust_type == "P" and entry.adjusted_hours:
-                    public_holiday_hours += entry.adjusted_hours
+        weekdays = count_weekdays(start_date, end_date)
+
+        # Get public holiday time from entries in this range, each rounded
+        # as adjusted_hours rounds it and summed as integer hundredths
+        public_holiday = sum(
+            minutes_to_hundredths(entry.adjusted_minutes)
+            for entry_date, entry in self.entries.items()
+            if start_date <= entry_date <= end_date and entry.adjust_type == "P"
+        )
 
-        return (Decimal(weekdays) * config.standard_day_hours) - public_holiday_hours
+        return (Decimal(weekdays) * config.standard_day_hours) - hundredths_to_hours(public_holiday)
 
     def _refresh_year_display(self):
-        config = storage.get_config()
+        if self._render_is_current("year", self.company_year_start):
+            return
+
+        config = self._config
         std_day = float(config.standard_day_hours)
 
         # Update year header
-        year_header = self.query_one("#year-header", Static)
+        year_header = self._year_header
         year_label = f"{self.company_year_start}-{self.company_year_start + 1}"
         year_header.update(Text(f"TIMESHEET: {year_label}", style="bold"))
 
         # Build table data
-        table = self.query_one("#year-table", DataTable)
-        table.clear()
+        table = self._year_table
+        rows: list[tuple[str, list[Text]]] = []
 
         # Company year months: Sep, Oct, Nov, Dec, Jan, Feb, Mar, Apr, May, Jun, Jul, Aug
         months = [
@@ -1314,105 +1793,100 @@ class TimesheetApp(App):
             (self.company_year_start + 1, 8),
         ]
 
-        # Year totals
-        year_worked = Decimal("0")
-        year_max = Decimal("0")
-        year_leave = Decimal("0")
-        year_sick = Decimal("0")
-        year_training = Decimal("0")
-        year_ph = Decimal("0")
-        year_total = Decimal("0")
+        # Year totals, in _TOTALS_KEYS order
+        year_sums = [_ZERO] * len(_TOTALS_KEYS)
+
+        # Fetch the entries for any months without cached totals in one
+        # query, bucketed by month
+        self._expire_month_totals()
+        missing = [key for key in months if key not in self._month_totals_cache]
+        month_entries: dict[tuple[int, int], list[TimeEntry]] = {key: [] for key in missing}
+        if missing:
+            from calendar import monthrange
+
+            last_year, last_month = missing[-1]
+            for entry in storage.get_entries_range(
+                date(*missing[0], 1),
+                date(last_year, last_month, monthrange(last_year, last_month)[1]),
+            ):
+                bucket = month_entries.get((entry.date.year, entry.date.month))
+                if bucket is not None:
+                    bucket.append(entry)
+
+        # Loop invariants, read once rather than per month
+        today = date.today()
+        this_month = (today.year, today.month)
+        current_month = (self.current_year, self.current_month)
+        show_money = self.show_money
+        contract_start = config.contract_start
+        hourly_rate = config.hourly_rate
+        vat_factor = 1 + config.vat_rate
 
         for year, month in months:
-            totals = self._get_month_totals(year, month)
-            month_name = date(year, month, 1).strftime("%b %Y")
-
-            # Convert hours to days
-            worked_d = round(float(totals['worked']) / std_day, 2) if totals['worked'] else 0
-            max_d = round(float(totals['max_hours']) / std_day, 2) if totals['max_hours'] else 0
-            leave_d = round(float(totals['leave']) / std_day, 2) if totals['leave'] else 0
-            sick_d = round(float(totals['sick']) / std_day, 2) if totals['sick'] else 0
-            training_d = round(float(totals['training']) / std_day, 2) if totals['training'] else 0
-            ph_d = round(float(totals['public_holiday']) / std_day, 2) if totals['public_holiday'] else 0
-            total_d = round(float(totals['total']) / std_day, 2) if totals['total'] else 0
+            totals = self._get_month_totals(year, month, month_entries.get((year, month)))
+            month_name = f"{MONTH_ABBRS[month]} {year}"
+
+            # Pull the totals out in column order once, for both the day
+            # conversion and the year accumulation
+            hours = [totals[k] for k in _TOTALS_KEYS]
 
             # Check if this is a future month with no data
-            today = date.today()
-            is_future = (year > today.year) or (year == today.year and month > today.month)
+            is_future = (year, month) > this_month
 
             # Dim if future with no work, or if only has public holidays (no actual work)
             if is_future and totals["worked"] == 0:
-                style = "dim"
+                style = _DIM
             else:
-                style = ""
+                style = _PLAIN
 
-            row_data = [
-                Text(month_name, style=style),
-                Text(f"{worked_d:g}d" if worked_d else "-", style=style),
-                Text(f"{max_d:g}d" if max_d else "-", style=style),
-                Text(f"{leave_d:g}d" if leave_d else "-", style=style),
-                Text(f"{sick_d:g}d" if sick_d else "-", style=style),
-                Text(f"{training_d:g}d" if training_d else "-", style=style),
-                Text(f"{ph_d:g}d" if ph_d else "-", style=style),
-                Text(f"{total_d:g}d" if total_d else "-", style=style),
-            ]
+            row_data = [_cell(month_name, style)]
+            for h in hours:
+                # Convert hours to days
+                days = round(float(h) / std_day, 2) if h else 0
+                row_data.append(_cell(f"{days:g}d" if days else "-", style))
 
-            if self.show_money:
+            if show_money:
                 month_start = date(year, month, 1)
-                if config.contract_start and month_start >= config.contract_start:
+                if contract_start and month_start >= contract_start:
                     # Points-based billing = that month's bill. Finalised
                     # months show the actual invoice; the current month
                     # shows the pending bill; future months show nothing.
-                    bill_p, fin = storage.get_month_bill_points(
-                        year, month, config.hours_per_point,
-                        config.point_rate, config.vat_rate,
-                        contract_start=config.contract_start,
-                    )
-                    is_current = (year, month) == (
-                        self.current_year, self.current_month,
-                    )
+                    bill_p, fin = self._get_month_bill_points(year, month)
+                    is_current = (year, month) == current_month
                     month_pts = bill_p if (fin or is_current) else 0
                     billable = Decimal(month_pts) * config.point_rate
                 else:
                     # Hourly billing
-                    billable = totals['worked'] * config.hourly_rate
-                with_vat = billable * (1 + config.vat_rate)
-                row_data.append(Text(
-                    f"£{float(billable):,.0f}" if billable else "-", style=style,
+                    billable = totals['worked'] * hourly_rate
+                with_vat = billable * vat_factor
+                row_data.append(_cell(
+                    f"£{float(billable):,.0f}" if billable else "-", style,
                 ))
-                row_data.append(Text(
-                    f"£{float(with_vat):,.0f}" if with_vat else "-", style=style,
+                row_data.append(_cell(
+                    f"£{float(with_vat):,.0f}" if with_vat else "-", style,
                 ))
 
-            table.add_row(*row_data, key=f"{year}-{month:02d}")
+            rows.append((f"{year}-{month:02d}", row_data))
 
             # Accumulate year totals
-            year_worked += totals["worked"]
-            year_max += totals["max_hours"]
-            year_leave += totals["leave"]
-            year_sick += totals["sick"]
-            year_training += totals["training"]
-            year_ph += totals["public_holiday"]
-            year_total += totals["total"]
+            year_sums = [acc + h for acc, h in zip(year_sums, hours)]
+
+        table.replace_rows(rows)
 
         # Update year summary
-        year_summary = self.query_one("#year-summary", Static)
+        year_summary = self._year_summary
         text = Text()
 
-        worked_days = round(float(year_worked) / std_day, 2) if year_worked else 0
-        max_days = round(float(year_max) / std_day, 2) if year_max else 0
-        leave_days = round(float(year_leave) / std_day, 2) if year_leave else 0
-        sick_days = round(float(year_sick) / std_day, 2) if year_sick else 0
-        training_days = round(float(year_training) / std_day, 2) if year_training else 0
-        ph_days = round(float(year_ph) / std_day, 2) if year_ph else 0
-        total_days = round(float(year_total) / std_day, 2) if year_total else 0
+        year_leave, year_sick, year_ph = year_sums[2], year_sums[3], year_sums[5]
+        worked_days, max_days, leave_days, sick_days, training_days, ph_days, total_days = (
+            round(float(h) / std_day, 2) if h else 0 for h in year_sums
+        )
 
         text.append(f"                                             Worked  {worked_days:>6g}d\n")
         pct = (worked_days / max_days * 100) if max_days else 0
         text.append(f"                                      of target max  {max_days:>6g}d   ({pct:.1f}%)\n")
 
         # Show "of target max to date" only for current company year
-        today = date.today()
         if today.month >= 9:
             current_company_year = today.year
         else:
@@ -1441,10 +1915,9 @@ class TimesheetApp(App):
         year_summary.update(text)
 
         # Update points/earnings display
-        year_earnings = self.query_one("#year-earnings", Static)
+        year_earnings = self._year_earnings
         if config.contract_start:
             year_earnings.remove_class("hidden")
-            earnings_text = Text()
 
             # Billed so far this contract year (against the annual cap),
             # plus what's pending on the current, not-yet-finalised bill.
@@ -1462,9 +1935,18 @@ class TimesheetApp(App):
                 contract_start=config.contract_start,
             )
             to_bill_pts = int(
-                sum((line.points for line in pending_lines), Decimal("0"))
+                sum((line.points for line in pending_lines), _ZERO)
+            )
+
+            key = (
+                int(ytd_pts), config.annual_max_points, to_bill_pts,
+                self.show_money, config.point_rate, config.vat_rate,
             )
+            if self._earnings_rendered.get("year") == key:
+                return
+            self._earnings_rendered["year"] = key
 
+            earnings_text = Text()
             earnings_text.append(
                 f"              Year-to-date: {int(ytd_pts)} pts billed"
                 f"  |  Annual max: {config.annual_max_points} pts"
@@ -1495,15 +1977,46 @@ class TimesheetApp(App):
         else:
             year_earnings.add_class("hidden")
 
-    def _refresh_day_display(self):
-        """Refresh the day view (ticket allocations for a single day)."""
+    def _day_entry_strings(self, entry: TimeEntry | None) -> tuple[str, str, str, str, str, str]:
+        """Format an entry's fields for the day view's time entry line.
+
+        The strings for the last entry shown are kept until the entry
+        changes, so moving between allocations on the same day, or back to
+        it, reuses them.
+        """
+        cached = self._day_entry_strs
+        if cached is not None and cached[0] == entry:
+            return cached[1]
+
+        if entry:
+            strings = (
+                f"{entry.clock_in.hour:02d}:{entry.clock_in.minute:02d}" if entry.clock_in else "-",
+                f"{int(entry.lunch_duration.total_seconds() // 60)}m" if entry.lunch_duration else "-",
+                f"{entry.clock_out.hour:02d}:{entry.clock_out.minute:02d}" if entry.clock_out else "-",
+                f"{float(entry.adjusted_hours):g}h" if entry.adjusted_hours else "-",
+                entry.adjust_type or "",
+                entry.comment or "",
+            )
+        else:
+            strings = ("-", "-", "-", "-", "", "")
+        self._day_entry_strs = (entry, strings)
+        return strings
+
+    def _refresh_day_display(self, entry: TimeEntry | None = None):
+        """Refresh the day view (ticket allocations for a single day).
+
+        Args:
+            entry: The day's time entry, if the caller has just saved it.
+                   Otherwise it is read from storage.
+        """
         if not self.day_view_date:
             return
 
         # Get the time entry for this day (fetch from storage directly
         # in case it's a boundary day from an adjacent month)
-        entry = storage.get_entry(self.day_view_date)
-        worked_hours = entry.worked_hours if entry else Decimal("0")
+        if entry is None or entry.date != self.day_view_date:
+            entry = storage.get_entry(self.day_view_date)
+        worked_hours = entry.worked_hours if entry else _ZERO
 
         # Update day header
         day_header = self.query_one("#day-header", DayHeader)
@@ -1511,31 +2024,21 @@ class TimesheetApp(App):
 
         # Update time entry details
         day_time_entry = self.query_one("#day-time-entry", DayTimeEntry)
-        if entry:
-            in_str = entry.clock_in.strftime("%H:%M") if entry.clock_in else "-"
-            lunch_str = f"{int(entry.lunch_duration.total_seconds() // 60)}m" if entry.lunch_duration else "-"
-            out_str = entry.clock_out.strftime("%H:%M") if entry.clock_out else "-"
-            adj_str = f"{float(entry.adjusted_hours):g}h" if entry.adjusted_hours else "-"
-            type_str = entry.adjust_type or ""
-            comment_str = entry.comment or ""
-        else:
-            in_str = "-"
-            lunch_str = "-"
-            out_str = "-"
-            adj_str = "-"
-            type_str = ""
-            comment_str = ""
-        day_time_entry.update_display(in_str, lunch_str, out_str, adj_str, type_str, comment_str)
+        day_time_entry.update_display(*self._day_entry_strings(entry))
 
         # Load allocations for this day
         self.day_allocations = storage.get_allocations_for_date(self.day_view_date)
 
         # Build table data
-        table = self.query_one("#day-table", DataTable)
+        table = self._day_table
         table.clear()
 
+        # Fetch the day's tickets in one query rather than one per row
+        tickets = storage.get_tickets([alloc.ticket_id for alloc in self.day_allocations])
+        total_allocated = _ZERO
         for alloc in self.day_allocations:
-            ticket = storage.get_ticket(alloc.ticket_id)
+            total_allocated += alloc.hours
+            ticket = tickets.get(alloc.ticket_id)
             desc = ticket.description[:25] if ticket else "(unknown)"
             alloc_desc = (alloc.description or "").split("\n")[0][:35]
             entered = Text("✓", style="green") if alloc.entered_on_client else Text("-", style="dim")
@@ -1548,18 +2051,16 @@ class TimesheetApp(App):
                 key=alloc.ticket_id,
             )
 
-        # Calculate total allocated
-        total_allocated = sum((a.hours for a in self.day_allocations), Decimal("0"))
-
         # Update day summary
         day_summary = self.query_one("#day-summary", DaySummary)
         day_summary.update_display(total_allocated, worked_hours)
+        self._day_allocations_total = total_allocated
 
         # Update description pane for first row
         day_desc = self.query_one("#day-description", DayDescription)
         if self.day_allocations:
             alloc = self.day_allocations[0]
-            ticket = storage.get_ticket(alloc.ticket_id)
+            ticket = tickets.get(alloc.ticket_id)
             day_desc.update_display(
                 alloc.ticket_id,
                 ticket.description if ticket else "(unknown)",
@@ -1578,25 +2079,30 @@ class TimesheetApp(App):
         - `✓` (green) = exactly allocated
         """
         if worked_hours == 0:
-            return Text("-", style="dim")
+            return _ALLOC_NO_HOURS
 
         total_allocated = storage.get_total_allocated_hours(d)
 
         if total_allocated == 0:
-            return Text("?", style="dim")
+            return _ALLOC_NONE
         elif total_allocated < worked_hours:
-            return Text("↓", style="yellow")
+            return _ALLOC_UNDER
         elif total_allocated > worked_hours:
-            return Text("↑", style="red")
+            return _ALLOC_OVER
         else:
-            return Text("✓", style="green")
+            return _ALLOC_EXACT
+
+    def _get_allocation_status_with_sep(
+        self, worked_hours: Decimal, total_allocated: Decimal, is_friday: bool,
+    ) -> Text:
+        """Get allocation status indicator, with separator for Friday columns.
 
-    def _get_allocation_status_with_sep(self, d: date, worked_hours: Decimal, is_friday: bool) -> Text:
-        """Get allocation status indicator, with separator for Friday columns."""
+        total_allocated is the day's allocated hours, already summed by the
+        caller from the month's allocations.
+        """
         if worked_hours == 0:
             symbol, style = "-", "dim"
         else:
-            total_allocated = storage.get_total_allocated_hours(d)
             if total_allocated == 0:
                 symbol, style = "?", "dim"
             elif total_allocated < worked_hours:
@@ -1615,16 +2121,25 @@ class TimesheetApp(App):
 
     def _refresh_allocations_display(self):
         """Refresh the allocations report (tickets × days matrix)."""
+        if self._render_is_current("allocations", self.current_year, self.current_month):
+            return
+
         from calendar import monthrange
 
         # Update header
         alloc_header = self.query_one("#allocations-header", Static)
-        month_name = date(self.current_year, self.current_month, 1).strftime("%B %Y")
+        month_name = f"{MONTH_NAMES[self.current_month]} {self.current_year}"
         alloc_header.update(Text(f"ALLOCATIONS: {month_name}", style="bold"))
 
         # Get days in month
         num_days = monthrange(self.current_year, self.current_month)[1]
 
+        # Read before loading, so a commit made while the view loads leaves
+        # the lookup below out of date rather than silently stale
+        lookup_state = (
+            self._render_version, storage.write_count(), self.current_year, self.current_month,
+        )
+
         # Get all allocations for the month
         allocations = storage.get_allocations_for_month(self.current_year, self.current_month)
 
@@ -1632,31 +2147,34 @@ class TimesheetApp(App):
         entries = storage.get_month_entries(self.current_year, self.current_month)
         entries_dict = {e.date: e for e in entries}
 
-        # Build dicts: ticket_id -> {date -> hours} and (ticket_id, date) -> allocation
+        # Build dicts: ticket_id -> {date -> hours}, (ticket_id, date) -> allocation
+        # and date -> total allocated hours (for the status row and mismatch
+        # count, so neither needs a per-day storage query)
         ticket_hours: dict[str, dict[date, Decimal]] = {}
         alloc_lookup: dict[tuple[str, date], TicketAllocation] = {}
+        allocated_by_day: dict[date, Decimal] = {}
+        total_allocated = _ZERO
         for alloc in allocations:
             if alloc.ticket_id not in ticket_hours:
                 ticket_hours[alloc.ticket_id] = {}
             ticket_hours[alloc.ticket_id][alloc.date] = alloc.hours
             alloc_lookup[(alloc.ticket_id, alloc.date)] = alloc
+            allocated_by_day[alloc.date] = allocated_by_day.get(alloc.date, _ZERO) + alloc.hours
+            total_allocated += alloc.hours
 
         # Get all tickets that have allocations this month
         ticket_ids = sorted(ticket_hours.keys())
 
-        # Preload all relevant tickets (avoids per-ticket DB queries in the loop)
-        all_tickets = {
-            t.id: t
-            for t in storage.get_all_tickets(include_archived=True)
-            if t.id in set(ticket_ids)
-        }
+        # Preload just the tickets shown as rows (avoids per-ticket DB queries
+        # in the loop without reading the whole ticket history)
+        all_tickets = storage.get_tickets(ticket_ids)
 
         # Points setup. Lifetime hours are scoped to contract_start (not
         # points_start_date) so pre-contract work, which is billed under
         # the previous arrangement, doesn't inflate this contract's
         # per-ticket points - matching the billing view and the carryover
         # row in this same screen.
-        config = storage.get_config()
+        config = self._config
         show_points = config.points_start_date is not None
         lifetime_hours: dict[str, Decimal] = {}
         if show_points:
@@ -1671,35 +2189,45 @@ class TimesheetApp(App):
         max_ticket_len = max((len(tid) for tid in ticket_ids), default=6) + 2
         ticket_col_width = min(max(max_ticket_len, 8), 12)
 
-        # Determine which days to show (exclude weekends unless they have worked hours)
+        # Determine which days to show (exclude weekends unless they have worked hours).
+        # Each shown day is kept as (day, date, is_weekend, is_friday) so the
+        # row loops below don't rebuild dates or recompute weekdays per cell.
+        # Weekdays and dates are stepped on from the 1st's, so classifying a
+        # day needs no date() or weekday() call.
         days_to_show: list[int] = []
+        day_meta: list[tuple[int, date, bool, bool]] = []
+        first = date(self.current_year, self.current_month, 1)
+        first_ordinal = first.toordinal()
+        first_weekday = first.weekday()
+        # Weekend days are included only if they have worked hours
+        worked_weekend_days = {
+            e.date.day for e in entries
+            if e.date.weekday() >= 5 and e.worked_hours > 0
+        }
         for day in range(1, num_days + 1):
-            d = date(self.current_year, self.current_month, day)
-            is_weekend = d.weekday() >= 5
-            if not is_weekend:
-                days_to_show.append(day)
-            else:
-                # Include weekend day only if it has worked hours
-                entry = entries_dict.get(d)
-                if entry and entry.worked_hours > 0:
-                    days_to_show.append(day)
+            weekday = (first_weekday + day - 1) % 7
+            is_weekend = weekday >= 5
+            if is_weekend and day not in worked_weekend_days:
+                continue
+            days_to_show.append(day)
+            day_meta.append((day, date.fromordinal(first_ordinal + day - 1), is_weekend, weekday == 4))
 
         # Store for click handling
         self._alloc_days_to_show = days_to_show
+        self._alloc_dates_to_show = [meta[1] for meta in day_meta]
+        self._alloc_lookup = alloc_lookup
+        self._alloc_lookup_state = lookup_state
 
         # Rebuild table with correct columns
-        table = self.query_one("#allocations-table", DataTable)
+        table = self._alloc_table
         table.clear(columns=True)
 
         # Add columns: Ticket, Description, then each day, then Total
-        # Track Fridays for adding vertical separators
-        friday_days = set()
+        # Fridays get vertical separators
         table.add_column("Ticket", width=ticket_col_width)
         table.add_column("Description", width=20)
-        for day in days_to_show:
-            d = date(self.current_year, self.current_month, day)
-            if d.weekday() == 4:  # Friday - week boundary
-                friday_days.add(day)
+        for day, _, _, is_friday in day_meta:
+            if is_friday:  # Friday - week boundary
                 # Right-justify day number, add │ separator (extra width for circle icon)
                 table.add_column(f"{day:>5}│", width=6)
             else:
@@ -1711,43 +2239,34 @@ class TimesheetApp(App):
         if show_points:
             table.add_column("Pts", width=5)
 
-        # Add rows for each ticket
+        # Add rows for each ticket. Entered hours are summed across the
+        # rows here, so the summary rows needn't rescan every ticket per day.
+        month_entered = _ZERO
+        ticket_cells: dict[str, tuple[str | Text, Text]] = {}
+        row_totals: dict[str, tuple[Decimal, Decimal]] = {}
         for ticket_id in ticket_ids:
             ticket = all_tickets.get(ticket_id)
             desc = ticket.description[:18] if ticket else ""
             # Closed tickets get a leading green ✓; the marker carries the
             # meaning even if Textual's row cursor strips the colour.
-            id_cell = self._ticket_id_cell(ticket_id)
+            id_cell = self._format_ticket_id_cell(ticket_id, ticket)
+            ticket_cells[ticket_id] = (id_cell, self._highlighted_ticket_id_cell(ticket_id, ticket))
             row_data: list[str | Text] = [id_cell, desc]
-            row_total = Decimal("0")
-            row_entered = Decimal("0")
+            row_total = _ZERO
+            row_entered = _ZERO
 
-            for day in days_to_show:
-                d = date(self.current_year, self.current_month, day)
-                hours = ticket_hours[ticket_id].get(d, Decimal("0"))
+            hours_by_day = ticket_hours[ticket_id]
+            for _, d, is_weekend, is_friday in day_meta:
+                hours = hours_by_day.get(d, _ZERO)
                 row_total += hours
 
-                is_weekend = d.weekday() >= 5
-                is_friday = day in friday_days
-
                 if hours > 0:
                     # Check entered state for icon and styling
                     alloc = alloc_lookup.get((ticket_id, d))
-                    if alloc and alloc.entered_on_client:
+                    entered = alloc is not None and alloc.entered_on_client
+                    if entered:
                         row_entered += hours
-                        icon = "●"
-                        icon_style = "dim green" if is_weekend else "green"
-                    else:
-                        icon = "○"
-                        icon_style = "dim yellow" if is_weekend else "yellow"
-                    text_style = "dim" if is_weekend else ""
-                    content = f"{float(hours):g}"
-                    cell = Text()
-                    # Coloured icon + right-justified hours
-                    cell.append(icon, style=icon_style)
-                    cell.append(f"{content:>4}", style=text_style)
-                    if is_friday:
-                        cell.append("│", style="dim")
+                    cell = self._alloc_hours_cell(hours, entered, is_weekend, is_friday)
                 else:
                     # No allocation for this ticket on this day
                     cell = Text()
@@ -1761,13 +2280,11 @@ class TimesheetApp(App):
             alloc_cell.append("│", style="dim")
             alloc_cell.append(f"{float(row_total):>5g}", style="bold")
             row_data.append(alloc_cell)
-            entered_style = "bold" if row_entered == row_total else "bold red"
-            entered_cell = Text()
-            entered_cell.append("│", style="dim")
-            entered_cell.append(f"{float(row_entered):>6g}", style=entered_style)
-            row_data.append(entered_cell)
+            month_entered += row_entered
+            row_totals[ticket_id] = (row_total, row_entered)
+            row_data.append(self._alloc_entered_cell(row_entered, row_total))
             if show_points:
-                total_lifetime = lifetime_hours.get(ticket_id, Decimal("0"))
+                total_lifetime = lifetime_hours.get(ticket_id, _ZERO)
                 pts = calculate_points(total_lifetime, config.hours_per_point)
                 if pts > 0:
                     is_archived = ticket.archived if ticket else False
@@ -1780,6 +2297,8 @@ class TimesheetApp(App):
                     pts_cell = Text("-", style="dim")
                 row_data.append(pts_cell)
             table.add_row(*row_data, key=ticket_id)
+        self._alloc_ticket_cells = ticket_cells
+        self._alloc_row_totals = row_totals
 
         # Add carryover rows: tickets with prior-month allocations that
         # haven't been billed yet. Lets the user see what still needs
@@ -1793,9 +2312,7 @@ class TimesheetApp(App):
                 Text("─" * 6, style="dim"),
                 Text("── carryover (unbilled prior work) ──", style="dim italic"),
             ]
-            for day in days_to_show:
-                d = date(self.current_year, self.current_month, day)
-                is_friday = day in friday_days
+            for _, _, _, is_friday in day_meta:
                 cell = Text()
                 cell.append("     ", style="dim")
                 if is_friday:
@@ -1812,8 +2329,7 @@ class TimesheetApp(App):
                     Text(co_ticket.id, style="dim"),
                     Text(co_ticket.description[:18], style="dim"),
                 ]
-                for day in days_to_show:
-                    is_friday = day in friday_days
+                for _, _, _, is_friday in day_meta:
                     cell = Text()
                     cell.append("    -", style="dim")
                     if is_friday:
@@ -1836,27 +2352,21 @@ class TimesheetApp(App):
         worked_row: list[str | Text] = ["Worked", ""]
         status_row: list[str | Text] = ["Status", ""]
         week_total_row: list[str | Text] = ["Wk Tot", ""]
-        week_total = Decimal("0")
-        month_total = Decimal("0")
-        month_entered = Decimal("0")
+        week_total = _ZERO
+        month_total = _ZERO
+        mismatch_days = 0
 
-        for day in days_to_show:
-            d = date(self.current_year, self.current_month, day)
+        # One pass builds all three rows and the mismatch count, sharing
+        # each day's entry and worked hours
+        for _, d, is_weekend, is_friday in day_meta:
             entry = entries_dict.get(d)
-            worked = entry.worked_hours if entry else Decimal("0")
-            is_weekend = d.weekday() >= 5
-            is_friday = day in friday_days
+            worked = entry.worked_hours if entry else _ZERO
 
             # Accumulate weekly and monthly totals (worked hours only, not adjustments)
-            if entry:
-                week_total += entry.worked_hours
-                month_total += entry.worked_hours
-
-            # Accumulate entered hours for the day across all tickets
-            for tid in ticket_ids:
-                alloc = alloc_lookup.get((tid, d))
-                if alloc and alloc.entered_on_client:
-                    month_entered += alloc.hours
+            week_total += worked
+            month_total += worked
+            if self._has_allocation_mismatch(d, entries_dict, allocated_by_day):
+                mismatch_days += 1
 
             if worked > 0:
                 content = f"{float(worked):g}"
@@ -1882,7 +2392,9 @@ class TimesheetApp(App):
                 worked_row.append(cell)
 
             # Status indicator
-            status_cell = self._get_allocation_status_with_sep(d, worked, is_friday)
+            status_cell = self._get_allocation_status_with_sep(
+                worked, allocated_by_day.get(d, _ZERO), is_friday,
+            )
             status_row.append(status_cell)
 
             # Week total - show on Friday, empty otherwise
@@ -1891,7 +2403,7 @@ class TimesheetApp(App):
                 cell.append(f"{float(week_total):>5g}", style="bold")
                 cell.append("│", style="dim")
                 week_total_row.append(cell)
-                week_total = Decimal("0")  # Reset for next week
+                week_total = _ZERO  # Reset for next week
             else:
                 cell = Text()
                 cell.append("     ", style="dim")
@@ -1899,26 +2411,18 @@ class TimesheetApp(App):
 
         # Show partial final week total if the month doesn't end on a Friday
         if week_total > 0:
-            # Find the last day shown
-            last_day = days_to_show[-1] if days_to_show else 0
-            last_d = date(self.current_year, self.current_month, last_day) if last_day else None
-            if last_d and last_d.weekday() != 4:  # Not a Friday
+            # Check the last day shown isn't a Friday
+            if day_meta and not day_meta[-1][3]:
                 # Replace the last cell in week_total_row with the partial total
                 week_total_row[-1] = Text(f"{float(week_total):>5g}", style="bold")
 
-        total_allocated = sum((a.hours for a in allocations), Decimal("0"))
-
         worked_row.extend([Text("│", style="dim"), Text("│", style="dim")])
         status_row.extend([Text("│", style="dim"), Text("│", style="dim")])
-        entered_style = "bold" if month_entered == total_allocated else "bold red"
         alloc_cell = Text()
         alloc_cell.append("│", style="dim")
         alloc_cell.append(f"{float(month_total):>5g}", style="bold")
         week_total_row.append(alloc_cell)
-        entered_cell = Text()
-        entered_cell.append("│", style="dim")
-        entered_cell.append(f"{float(month_entered):>6g}", style=entered_style)
-        week_total_row.append(entered_cell)
+        week_total_row.append(self._alloc_entered_cell(month_entered, total_allocated))
 
         # Points total for the summary rows is simply this month's bill,
         # mirroring the Billing view: a ticket cashes in the month it is
@@ -1928,10 +2432,8 @@ class TimesheetApp(App):
         bill_pts = 0
         bill_finalised = False
         if show_points:
-            bill_pts, bill_finalised = storage.get_month_bill_points(
+            bill_pts, bill_finalised = self._get_month_bill_points(
                 self.current_year, self.current_month,
-                config.hours_per_point, config.point_rate, config.vat_rate,
-                contract_start=config.contract_start,
             )
             worked_row.append(Text(""))
             status_row.append(Text(""))
@@ -1944,95 +2446,78 @@ class TimesheetApp(App):
         # Clear description pane on refresh
         self.query_one("#alloc-description", DayDescription).clear_display()
 
-        # Update summary
-        alloc_summary = self.query_one("#allocations-summary", Static)
-        total_worked = sum((e.worked_hours for e in entries), Decimal("0"))
-        mismatch_days = sum(
-            1 for day in days_to_show
-            if self._has_allocation_mismatch(
-                date(self.current_year, self.current_month, day),
-                entries_dict
-            )
+        # Update summary. Days left out of day_meta are weekends with no
+        # worked hours, so the summary-row total is the whole month's.
+        self._alloc_totals = _AllocTotals(
+            total_allocated, month_total, month_entered, mismatch_days,
+            (bill_pts, bill_finalised) if show_points else None,
+        )
+        self.query_one("#allocations-summary", Static).update(
+            self._alloc_summary_text(self._alloc_totals)
         )
 
+    @staticmethod
+    def _alloc_hours_cell(hours: Decimal, entered: bool, is_weekend: bool, is_friday: bool) -> Text:
+        """Build an allocations-view day cell for a ticket with hours that day."""
+        if entered:
+            icon = "●"
+            icon_style = "dim green" if is_weekend else "green"
+        else:
+            icon = "○"
+            icon_style = "dim yellow" if is_weekend else "yellow"
+        text_style = "dim" if is_weekend else ""
+        content = f"{float(hours):g}"
+        cell = Text()
+        # Coloured icon + right-justified hours
+        cell.append(icon, style=icon_style)
+        cell.append(f"{content:>4}", style=text_style)
+        if is_friday:
+            cell.append("│", style="dim")
+        return cell
+
+    @staticmethod
+    def _alloc_entered_cell(entered: Decimal, allocated: Decimal) -> Text:
+        """Build an Entered column cell, red while hours remain unentered."""
+        cell = Text()
+        cell.append("│", style="dim")
+        cell.append(f"{float(entered):>6g}", style="bold" if entered == allocated else "bold red")
+        return cell
+
+    @staticmethod
+    def _alloc_summary_text(totals: _AllocTotals) -> Text:
+        """Build the allocations view's summary line."""
         text = Text()
-        text.append(f"Total allocated: {float(total_allocated):.1f}h")
-        text.append(f"   Total worked: {float(total_worked):.1f}h")
-        entered_summary_style = "" if month_entered == total_allocated else "red"
-        text.append(f"   Total entered: {float(month_entered):.1f}h", style=entered_summary_style)
-        if mismatch_days > 0:
-            text.append(f"   Mismatched days: {mismatch_days}", style="red")
-        if show_points:
+        text.append(f"Total allocated: {float(totals.allocated):.1f}h")
+        text.append(f"   Total worked: {float(totals.worked):.1f}h")
+        entered_summary_style = "" if totals.entered == totals.allocated else "red"
+        text.append(f"   Total entered: {float(totals.entered):.1f}h", style=entered_summary_style)
+        if totals.mismatch_days > 0:
+            text.append(f"   Mismatched days: {totals.mismatch_days}", style="red")
+        if totals.bill is not None:
+            bill_pts, bill_finalised = totals.bill
             bill_label = "Billed" if bill_finalised else "To bill"
             text.append(f"   {bill_label}: {bill_pts} pts", style="bold green")
-        alloc_summary.update(text)
+        return text
+
+    def _has_allocation_mismatch(
+        self, d: date, entries_dict: dict, allocated_by_day: dict[date, Decimal],
+    ) -> bool:
+        """Check if a day has an allocation mismatch.
 
-    def _has_allocation_mismatch(self, d: date, entries_dict: dict) -> bool:
-        """Check if a day has an allocation mismatch."""
+        allocated_by_day maps each date to its total allocated hours; days
+        without allocations may be missing.
+        """
         entry = entries_dict.get(d)
         if not entry or entry.worked_hours == 0:
             return False
-        allocated = storage.get_total_allocated_hours(d)
-        return allocated != entry.worked_hours
+        return allocated_by_day.get(d, _ZERO) != entry.worked_hours
 
     def _set_view_mode(self, mode: str):
         """Switch between view modes and toggle widget visibility."""
         self.view_mode = mode
 
-        # Week view widgets
-        week_widgets = ["#combined-header", "#week-table-container", "#week-earnings", "#weekly-summary"]
-        # Month view widgets
-        month_widgets = ["#month-header", "#month-table-container", "#month-earnings", "#month-summary"]
-        # Year view widgets
-        year_widgets = ["#year-header", "#year-table-container", "#year-earnings", "#year-summary"]
-        # Day view widgets
-        day_widgets = ["#day-header", "#day-time-entry", "#day-table-container", "#day-summary", "#day-description"]
-        # Allocations report widgets
-        alloc_widgets = ["#allocations-header", "#allocations-table-container", "#alloc-description", "#allocations-summary"]
-        # Billing view widgets
-        billing_widgets = ["#billing-header", "#billing-table-container", "#billing-summary"]
-
-        for widget_id in week_widgets:
-            widget = self.query_one(widget_id)
-            if mode == "week":
-                widget.remove_class("hidden")
-            else:
-                widget.add_class("hidden")
-
-        for widget_id in month_widgets:
-            widget = self.query_one(widget_id)
-            if mode == "month":
-                widget.remove_class("hidden")
-            else:
-                widget.add_class("hidden")
-
-        for widget_id in year_widgets:
-            widget = self.query_one(widget_id)
-            if mode == "year":
-                widget.remove_class("hidden")
-            else:
-                widget.add_class("hidden")
-
-        for widget_id in day_widgets:
-            widget = self.query_one(widget_id)
-            if mode == "day":
-                widget.remove_class("hidden")
-            else:
-                widget.add_class("hidden")
-
-        for widget_id in alloc_widgets:
-            widget = self.query_one(widget_id)
-            if mode == "allocations":
-                widget.remove_class("hidden")
-            else:
-                widget.add_class("hidden")
-
-        for widget_id in billing_widgets:
-            widget = self.query_one(widget_id)
-            if mode == "billing":
-                widget.remove_class("hidden")
-            else:
-                widget.add_class("hidden")
+        for view, widget in self._mode_widgets:
+            widget.set_class(view != mode, "hidden")
 
         # Update binding visibility based on view mode
         self._update_bindings_for_mode(mode)
@@ -2041,17 +2526,17 @@ class TimesheetApp(App):
 
         # Focus the appropriate table for the view
         if mode == "week":
-            self.query_one("#week-table", DataTable).focus()
+            self._week_table.focus()
         elif mode == "month":
-            self.query_one("#month-table", DataTable).focus()
+            self._month_table.focus()
         elif mode == "year":
-            self.query_one("#year-table", DataTable).focus()
+            self._year_table.focus()
         elif mode == "day":
-            self.query_one("#day-table", DataTable).focus()
+            self._day_table.focus()
         elif mode == "allocations":
-            self.query_one("#allocations-table", DataTable).focus()
+            self._alloc_table.focus()
         elif mode == "billing":
-            self.query_one("#billing-table", DataTable).focus()
+            self._billing_table.focus()
 
     def _update_bindings_for_mode(self, mode: str):
         """Update footer bindings based on view mode."""
@@ -2067,63 +2552,20 @@ class TimesheetApp(App):
         mode = self.view_mode
 
         # View switching — hide the current view's own key
-        if action == "week_view":
-            return mode != "week"
-        elif action == "month_view":
-            return mode not in ("month", "day")
-        elif action == "year_view":
-            return mode not in ("year", "day")
-        elif action == "allocations_view":
-            return mode != "allocations"
-        elif action == "billing_view":
-            return mode != "billing"
-
-        # Navigation
-        elif action == "goto_today":
-            return mode in ("week", "month") or False
-        elif action == "edit_ticket_on_alloc_row":
-            return mode == "allocations" or False
-        elif action in ("alloc_prev_month", "alloc_next_month"):
-            return mode in ("allocations", "billing") or False
-
-        # Week/day view
-        elif action == "edit_day":
-            return mode in ("week", "day") or False
-        elif action == "toggle_money":
-            return mode in ("month", "year", "allocations", "billing") or False
-
-        # Year view only
-        elif action == "populate_holidays":
-            return mode == "year" or False
-
-        # Day view / allocations view — allocation operations
-        elif action in ("add_allocation", "delete_allocation", "move_allocation"):
-            return mode in ("day", "allocations") or False
-        elif action == "toggle_entered":
-            return mode == "day" or False
-        elif action == "back_to_week":
-            return mode == "day" or False
-
-        # Allocations view only
-        elif action == "toggle_points_entered":
-            return mode == "allocations" or False
-        elif action == "export_allocations":
-            return mode == "allocations" or False
-
-        # Billing view only — only when viewing the current (unbilled) bill
-        elif action == "finalise_billing":
-            return (mode == "billing" and self.billing_view_period is None) or False
-        # Invoice generation — any bill on screen (current or finalised)
-        elif action == "generate_invoice":
-            return mode == "billing" or False
-
-        # Ticket/deliverable management — always available
-        elif action == "manage_tickets":
-            return True
-        elif action == "manage_deliverables":
+        hidden_in = _ACTION_HIDDEN_IN.get(action)
+        if hidden_in is not None:
+            return mode not in hidden_in
+
+        # Everything else not listed (e.g. ticket/deliverable management)
+        # is always available
+        shown_in = _ACTION_SHOWN_IN.get(action)
+        if shown_in is None:
             return True
 
-        return True
+        # Finalising only applies to the current (unbilled) bill
+        if action == "finalise_billing" and self.billing_view_period is not None:
+            return False
+        return mode in shown_in
 
     def action_prev_week(self):
         if self.view_mode == "day":
@@ -2146,14 +2588,14 @@ class TimesheetApp(App):
                 self.current_month -= 1
             self.weeks = get_weeks_in_month(self.current_year, self.current_month)
             self._load_month_data()
-            header = self.query_one("#combined-header", CombinedHeader)
+            header = self._combined_header
             header.year = self.current_year
             header.month = self.current_month
             self._refresh_display()
             return
 
         # Remember which day of week (row) is selected
-        table = self.query_one("#week-table", DataTable)
+        table = self._week_table
         selected_row = table.cursor_row
 
         if self.current_week_idx > 0:
@@ -2170,7 +2612,7 @@ class TimesheetApp(App):
             self.weeks = get_weeks_in_month(self.current_year, self.current_month)
             self.current_week_idx = len(self.weeks) - 1
             self._load_month_data()
-            header = self.query_one("#combined-header", CombinedHeader)
+            header = self._combined_header
             header.year = self.current_year
             header.month = self.current_month
             self._refresh_display()
@@ -2199,14 +2641,14 @@ class TimesheetApp(App):
                 self.current_month += 1
             self.weeks = get_weeks_in_month(self.current_year, self.current_month)
             self._load_month_data()
-            header = self.query_one("#combined-header", CombinedHeader)
+            header = self._combined_header
             header.year = self.current_year
             header.month = self.current_month
             self._refresh_display()
             return
 
         # Remember which day of week (row) is selected
-        table = self.query_one("#week-table", DataTable)
+        table = self._week_table
         selected_row = table.cursor_row
 
         if self.current_week_idx < len(self.weeks) - 1:
@@ -2223,7 +2665,7 @@ class TimesheetApp(App):
             self.weeks = get_weeks_in_month(self.current_year, self.current_month)
             self.current_week_idx = 0
             self._load_month_data()
-            header = self.query_one("#combined-header", CombinedHeader)
+            header = self._combined_header
             header.year = self.current_year
             header.month = self.current_month
             self._refresh_display()
@@ -2233,20 +2675,20 @@ class TimesheetApp(App):
 
     def action_cursor_up(self):
         if self.view_mode == "year":
-            table = self.query_one("#year-table", DataTable)
+            table = self._year_table
         elif self.view_mode == "month":
-            table = self.query_one("#month-table", DataTable)
+            table = self._month_table
         else:
-            table = self.query_one("#week-table", DataTable)
+            table = self._week_table
         table.action_cursor_up()
 
     def action_cursor_down(self):
         if self.view_mode == "year":
-            table = self.query_one("#year-table", DataTable)
+            table = self._year_table
         elif self.view_mode == "month":
-            table = self.query_one("#month-table", DataTable)
+            table = self._month_table
         else:
-            table = self.query_one("#week-table", DataTable)
+            table = self._week_table
         table.action_cursor_down()
 
     def action_toggle_money(self):
@@ -2273,7 +2715,7 @@ class TimesheetApp(App):
     def _get_focused_ticket_id(self) -> str | None:
         """Get the ticket ID from the currently focused row, if any."""
         if self.view_mode == "day":
-            table = self.query_one("#day-table", DataTable)
+            table = self._day_table
             if table.row_count == 0:
                 return None
             row_key = table.coordinate_to_cell_key(
@@ -2311,16 +2753,17 @@ class TimesheetApp(App):
         # Reload allocations for the target date (in case they differ from displayed)
         target_allocations = storage.get_allocations_for_date(target_date)
 
-        # Check if already allocated
-        existing = next((a for a in target_allocations if a.ticket_id == ticket.id), None)
-        if existing:
-            self.notify(f"{ticket.id} already has an allocation. Edit it instead.", severity="warning")
-            return
+        # Check if already allocated, totalling the day's hours on the same pass
+        total_allocated = _ZERO
+        for a in target_allocations:
+            if a.ticket_id == ticket.id:
+                self.notify(f"{ticket.id} already has an allocation. Edit it instead.", severity="warning")
+                return
+            total_allocated += a.hours
 
         # Calculate remaining hours (fetch entry from storage for boundary days)
         entry = storage.get_entry(target_date)
-        worked = entry.worked_hours if entry else Decimal("0")
-        total_allocated = sum((a.hours for a in target_allocations), Decimal("0"))
+        worked = entry.worked_hours if entry else _ZERO
         remaining = worked - total_allocated
 
         self.push_screen(
@@ -2337,7 +2780,7 @@ class TimesheetApp(App):
         if self.view_mode != "day" or not self.day_view_date:
             return
 
-        table = self.query_one("#day-table", DataTable)
+        table = self._day_table
         if table.row_count == 0:
             self.notify("No allocations to delete", severity="warning")
             return
@@ -2366,7 +2809,7 @@ class TimesheetApp(App):
         if self.view_mode != "day" or not self.day_view_date:
             return
 
-        table = self.query_one("#day-table", DataTable)
+        table = self._day_table
         if table.row_count == 0:
             self.notify("No allocations to move", severity="warning")
             return
@@ -2409,23 +2852,15 @@ class TimesheetApp(App):
         if existing:
             self.notify(
                 f"{source_alloc.ticket_id} already has an allocation on "
-                f"{target_date.strftime('%b %d')}",
+                f"{format_short_date(target_date)}",
                 severity="error",
             )
             return
 
-        storage.delete_allocation(source_alloc.ticket_id, source_alloc.date)
-        moved = TicketAllocation(
-            ticket_id=source_alloc.ticket_id,
-            date=target_date,
-            hours=source_alloc.hours,
-            description=source_alloc.description,
-            entered_on_client=source_alloc.entered_on_client,
-        )
-        storage.save_allocation(moved)
+        storage.move_allocation(source_alloc.ticket_id, source_alloc.date, target_date)
 
-        src_str = source_alloc.date.strftime("%b %d")
-        dst_str = target_date.strftime("%b %d")
+        src_str = format_short_date(source_alloc.date)
+        dst_str = format_short_date(target_date)
         self.notify(f"Moved {source_alloc.ticket_id} from {src_str} to {dst_str}")
         self._refresh_display()
 
@@ -2434,7 +2869,7 @@ class TimesheetApp(App):
         if self.view_mode != "day" or not self.day_view_date:
             return
 
-        table = self.query_one("#day-table", DataTable)
+        table = self._day_table
         if table.row_count == 0:
             return
 
@@ -2449,14 +2884,7 @@ class TimesheetApp(App):
 
         # Toggle the flag
         new_value = not alloc.entered_on_client
-        updated_alloc = TicketAllocation(
-            ticket_id=alloc.ticket_id,
-            date=alloc.date,
-            hours=alloc.hours,
-            description=alloc.description,
-            entered_on_client=new_value,
-        )
-        storage.save_allocation(updated_alloc)
+        storage.set_allocation_entered(alloc.ticket_id, alloc.date, new_value)
 
         status = "marked as entered" if new_value else "unmarked"
         self.notify(f"{ticket_id} {status}")
@@ -2477,7 +2905,7 @@ class TimesheetApp(App):
                 self.current_month = target_date.month
                 self.weeks = get_weeks_in_month(self.current_year, self.current_month)
                 self._load_month_data()
-                header = self.query_one("#combined-header", CombinedHeader)
+                header = self._combined_header
                 header.year = self.current_year
                 header.month = self.current_month
 
@@ -2514,21 +2942,20 @@ class TimesheetApp(App):
 
         self._select_date(today)
 
-        header = self.query_one("#combined-header", CombinedHeader)
+        header = self._combined_header
         header.year = self.current_year
         header.month = self.current_month
 
     def _select_date(self, target: date):
         """Move cursor to the row for a specific date."""
-        table = self.query_one("#week-table", DataTable)
+        table = self._week_table
         week_start, _ = self.weeks[self.current_week_idx]
 
-        # Find which row (0-6) corresponds to the target date
-        for row_idx in range(7):
-            row_date = week_start + timedelta(days=row_idx)
-            if row_date == target:
-                table.move_cursor(row=row_idx)
-                break
+        # Rows are the week's days in order, so the row (0-6) is the
+        # target's offset from the week start
+        row_idx = (target - week_start).days
+        if 0 <= row_idx < 7:
+            table.move_cursor(row=row_idx)
 
     def _select_day_in_week(self):
         """Select appropriate day when entering week view.
@@ -2549,7 +2976,7 @@ class TimesheetApp(App):
             self._select_date(today)
         # Otherwise select Monday (2 days after Saturday start)
         else:
-            monday = week_start + timedelta(days=2)
+            monday = week_start + _DAY_OFFSETS[2]
             self._select_date(monday)
 
     def action_allocations_view(self):
@@ -2579,17 +3006,15 @@ class TimesheetApp(App):
             current_month_key = f"{self.current_year}-{self.current_month:02d}"
             self._set_view_mode("year")
             # Select the row for the current month
-            table = self.query_one("#year-table", DataTable)
-            for row_idx, row_key in enumerate(table.rows.keys()):
-                if str(row_key.value) == current_month_key:
-                    table.move_cursor(row=row_idx)
-                    break
+            table = self._year_table
+            if current_month_key in table.rows:
+                table.move_cursor(row=table.get_row_index(current_month_key))
 
     def action_month_view(self):
         """Switch to month view."""
         if self.view_mode == "year":
             # In year view, navigate to the selected month
-            table = self.query_one("#year-table", DataTable)
+            table = self._year_table
             row_key = table.coordinate_to_cell_key(Coordinate(table.cursor_row, 0)).row_key
             if row_key:
                 parts = str(row_key.value).split("-")
@@ -2605,11 +3030,10 @@ class TimesheetApp(App):
             self._set_view_mode("month")
             # Select the row for the current week
             if current_week_start:
-                table = self.query_one("#month-table", DataTable)
-                for row_idx, row_key in enumerate(table.rows.keys()):
-                    if str(row_key.value) == current_week_start.isoformat():
-                        table.move_cursor(row=row_idx)
-                        break
+                table = self._month_table
+                week_key = current_week_start.isoformat()
+                if week_key in table.rows:
+                    table.move_cursor(row=table.get_row_index(week_key))
 
     def action_week_view(self):
         """Switch to week view."""
@@ -2618,15 +3042,12 @@ class TimesheetApp(App):
             self.action_back_to_week()
         elif self.view_mode == "month":
             # In month view, navigate to the selected week
-            table = self.query_one("#month-table", DataTable)
+            table = self._month_table
             row_key = table.coordinate_to_cell_key(Coordinate(table.cursor_row, 0)).row_key
             if row_key:
                 week_start = date.fromisoformat(str(row_key.value))
-                # Find the week index for this week
-                for i, (start, end) in enumerate(self.weeks):
-                    if start == week_start:
-                        self.current_week_idx = i
-                        break
+                # Find the week index for this week (unchanged if not in this month)
+                self.current_week_idx = self._date_to_week.get(week_start, self.current_week_idx)
                 self._set_view_mode("week")
                 self._select_day_in_week()
         elif self.view_mode != "week":
@@ -2640,7 +3061,7 @@ class TimesheetApp(App):
         self.weeks = get_weeks_in_month(self.current_year, self.current_month)
         self.current_week_idx = 0
         self._load_month_data()
-        header = self.query_one("#combined-header", CombinedHeader)
+        header = self._combined_header
         header.year = self.current_year
         header.month = self.current_month
         self._set_view_mode("month")
@@ -2652,7 +3073,7 @@ class TimesheetApp(App):
         self.weeks = get_weeks_in_month(self.current_year, self.current_month)
         self.current_week_idx = 0
         self._load_month_data()
-        header = self.query_one("#combined-header", CombinedHeader)
+        header = self._combined_header
         header.year = self.current_year
         header.month = self.current_month
 
@@ -2680,23 +3101,18 @@ class TimesheetApp(App):
             if entry is None or (entry.worked_hours == 0 and entry.adjusted_hours == 0):
                 # Create entry if it doesn't exist
                 if entry is None:
-                    entry = TimeEntry(date=d, day_of_week=d.strftime("%a"))
-                self.push_screen(EditDayScreen(entry), self._on_day_edit_complete)
+                    entry = TimeEntry(date=d, day_of_week=DAY_ABBRS[d.weekday()])
+                self._push_edit_day_screen(entry, self._on_day_edit_complete)
 
     def _navigate_to_prev_worked_day(self) -> None:
         """Navigate to previous day with worked hours."""
         if not self.day_view_date:
             return
 
-        # Search backwards from current day for a day with worked hours
-        current = self.day_view_date - timedelta(days=1)
-        # Search up to 365 days back
-        for _ in range(365):
-            entry = storage.get_entry(current)
-            if entry and entry.worked_hours > 0:
-                self._navigate_to_day_view(current, auto_edit=False)
-                return
-            current -= timedelta(days=1)
+        # Search up to 365 days back for the latest day with worked hours
+        entry = storage.get_nearest_worked_entry(self.day_view_date, forward=False)
+        if entry:
+            self._navigate_to_day_view(entry.date, auto_edit=False)
         # No day found - stay on current day
 
     def _navigate_to_next_worked_day(self) -> None:
@@ -2704,15 +3120,10 @@ class TimesheetApp(App):
         if not self.day_view_date:
             return
 
-        # Search forwards from current day for a day with worked hours
-        current = self.day_view_date + timedelta(days=1)
-        # Search up to 365 days forward
-        for _ in range(365):
-            entry = storage.get_entry(current)
-            if entry and entry.worked_hours > 0:
-                self._navigate_to_day_view(current, auto_edit=False)
-                return
-            current += timedelta(days=1)
+        # Search up to 365 days forward for the earliest day with worked hours
+        entry = storage.get_nearest_worked_entry(self.day_view_date, forward=True)
+        if entry:
+            self._navigate_to_day_view(entry.date, auto_edit=False)
         # No day found - stay on current day
 
     def _edit_allocation(self, ticket_id: str) -> None:
@@ -2734,9 +3145,9 @@ class TimesheetApp(App):
 
         # Calculate remaining hours (fetch entry from storage for boundary days)
         entry = storage.get_entry(self.day_view_date)
-        worked = entry.worked_hours if entry else Decimal("0")
-        total_allocated = sum((a.hours for a in self.day_allocations), Decimal("0"))
-        remaining = worked - total_allocated + alloc.hours  # Add back current allocation
+        worked = entry.worked_hours if entry else _ZERO
+        # The day view totals its allocations when it loads them
+        remaining = worked - self._day_allocations_total + alloc.hours  # Add back current allocation
 
         self.push_screen(
             EditAllocationScreen(
@@ -2794,29 +3205,25 @@ class TimesheetApp(App):
         if self.view_mode != "allocations":
             return
 
-        table = self.query_one("#allocations-table", DataTable)
-        alloc_desc = self.query_one("#alloc-description", DayDescription)
+        table = self._alloc_table
+        alloc_desc = self._alloc_description
         row_key = event.cell_key.row_key
+        ticket_id = str(row_key.value) if row_key else None
+        prev_row = self._alloc_highlighted_row
 
         # Skip if no row key or if it's a summary row
-        if not row_key or str(row_key.value).startswith("__"):
+        if ticket_id is None or ticket_id.startswith("__"):
             # Restore previous highlight if any
-            prev_row = getattr(self, '_alloc_highlighted_row', None)
             if prev_row:
                 self._restore_ticket_cell(table, prev_row)
                 self._alloc_highlighted_row = None
             alloc_desc.clear_display()
             return
 
-        ticket_id = str(row_key.value)
-        prev_row = getattr(self, '_alloc_highlighted_row', None)
-
-        # Restore previous row's ticket cell if different
-        if prev_row and prev_row != ticket_id:
-            self._restore_ticket_cell(table, prev_row)
-
-        # Highlight current row's ticket cell
+        # Move the ticket cell highlight when the row changes
         if prev_row != ticket_id:
+            if prev_row:
+                self._restore_ticket_cell(table, prev_row)
             self._highlight_ticket_cell(table, ticket_id)
             self._alloc_highlighted_row = ticket_id
 
@@ -2827,13 +3234,8 @@ class TimesheetApp(App):
         cursor_col = table.cursor_column
 
         if day_col_start <= cursor_col < day_col_end:
-            day_index = cursor_col - day_col_start
-            day = days_to_show[day_index]
-            d = date(self.current_year, self.current_month, day)
-            alloc = next(
-                (a for a in storage.get_allocations_for_date(d) if a.ticket_id == ticket_id),
-                None,
-            )
+            d = self._alloc_dates_to_show[cursor_col - day_col_start]
+            alloc = self._alloc_view_allocation(ticket_id, d)
             if alloc:
                 ticket = storage.get_ticket(ticket_id)
                 alloc_desc.update_display(
@@ -2846,9 +3248,27 @@ class TimesheetApp(App):
         else:
             alloc_desc.clear_display()
 
+    def _alloc_view_allocation(self, ticket_id: str, d: date) -> TicketAllocation | None:
+        """Get a ticket's allocation on a day of the allocations view's month.
+
+        Served from the lookup built by the last render while it still
+        reflects storage, otherwise read from storage.
+        """
+        state = (self._render_version, storage.write_count(), self.current_year, self.current_month)
+        if state == self._alloc_lookup_state:
+            return self._alloc_lookup.get((ticket_id, d))
+        return next(
+            (a for a in storage.get_allocations_for_date(d) if a.ticket_id == ticket_id),
+            None,
+        )
+
     def _ticket_id_cell(self, ticket_id: str) -> str | Text:
         """Build the ticket ID cell content, with closed-ticket styling."""
-        ticket = storage.get_ticket(ticket_id)
+        return self._format_ticket_id_cell(ticket_id, storage.get_ticket(ticket_id))
+
+    @staticmethod
+    def _format_ticket_id_cell(ticket_id: str, ticket: Ticket | None) -> str | Text:
+        """Build the ticket ID cell content for an already loaded ticket."""
         if ticket and ticket.archived:
             return Text.assemble(
                 ("✓ ", "bold green"),
@@ -2856,22 +3276,30 @@ class TimesheetApp(App):
             )
         return "  " + ticket_id
 
+    @staticmethod
+    def _highlighted_ticket_id_cell(ticket_id: str, ticket: Ticket | None) -> Text:
+        """Build the reverse-video ticket ID cell for an already loaded ticket."""
+        prefix = "✓ " if ticket and ticket.archived else "  "
+        return Text(prefix + ticket_id, style="reverse")
+
     def _highlight_ticket_cell(self, table: DataTable, ticket_id: str) -> None:
         """Highlight the ticket ID cell with reverse video style."""
-        first_col_key = list(table.columns.keys())[0]
-        ticket = storage.get_ticket(ticket_id)
-        prefix = "✓ " if ticket and ticket.archived else "  "
-        table.update_cell(
-            ticket_id, first_col_key,
-            Text(prefix + ticket_id, style="reverse"),
-        )
+        first_col_key = next(iter(table.columns))
+        cells = self._alloc_ticket_cells.get(ticket_id)
+        if cells is not None:
+            cell = cells[1]
+        else:
+            cell = self._highlighted_ticket_id_cell(ticket_id, storage.get_ticket(ticket_id))
+        table.update_cell(ticket_id, first_col_key, cell)
 
     def _restore_ticket_cell(self, table: DataTable, ticket_id: str) -> None:
         """Restore the ticket ID cell to its original style."""
-        first_col_key = list(table.columns.keys())[0]
+        first_col_key = next(iter(table.columns))
+        cells = self._alloc_ticket_cells.get(ticket_id)
         try:
             table.update_cell(
-                ticket_id, first_col_key, self._ticket_id_cell(ticket_id),
+                ticket_id, first_col_key,
+                cells[0] if cells is not None else self._ticket_id_cell(ticket_id),
             )
         except Exception:
             pass  # Row may no longer exist
@@ -2881,7 +3309,7 @@ class TimesheetApp(App):
         if self.view_mode != "allocations":
             return
 
-        table = self.query_one("#allocations-table", DataTable)
+        table = self._alloc_table
 
         # Get current cursor position
         cursor_row = table.cursor_row
@@ -2890,7 +3318,7 @@ class TimesheetApp(App):
         # Get the row key from cursor position
         if cursor_row >= len(table.rows):
             return
-        row_key = list(table.rows.keys())[cursor_row]
+        row_key = table.coordinate_to_cell_key(Coordinate(cursor_row, 0)).row_key
 
         # Skip summary rows
         if str(row_key.value).startswith("__"):
@@ -2911,45 +3339,83 @@ class TimesheetApp(App):
         if day_index >= len(days_to_show):
             return
 
-        day = days_to_show[day_index]
-        d = date(self.current_year, self.current_month, day)
+        d = self._alloc_dates_to_show[day_index]
 
         # Check if there's an allocation for this ticket/date
-        alloc = next(
-            (a for a in storage.get_allocations_for_date(d) if a.ticket_id == ticket_id),
-            None
-        )
+        alloc = self._alloc_view_allocation(ticket_id, d)
 
         if alloc:
+            # The table can be patched in place only if it was rendered
+            # from what is in storage now
+            writes, version = storage.write_count()
+            lookup_state = (self._render_version, (writes, version), self.current_year, self.current_month)
+            rendered_from_storage = lookup_state == self._alloc_lookup_state
+
             # Toggle the entered state
-            updated = TicketAllocation(
-                ticket_id=alloc.ticket_id,
-                date=alloc.date,
-                hours=alloc.hours,
-                description=alloc.description,
-                entered_on_client=not alloc.entered_on_client,
-            )
-            storage.save_allocation(updated)
-            status = "entered" if updated.entered_on_client else "not entered"
-            self.notify(f"{ticket_id} on {d.strftime('%b %d')}: {status}")
+            entered = not alloc.entered_on_client
+            storage.set_allocation_entered(alloc.ticket_id, alloc.date, entered)
+            status = "entered" if entered else "not entered"
+            self.notify(f"{ticket_id} on {format_short_date(d)}: {status}")
+
+            # ...and if nothing else (e.g. the HTTP API) committed before
+            # this toggle did
+            writes_after = storage.write_count()
+            if rendered_from_storage and writes_after == (writes + 1, version + 1):
+                self._patch_alloc_entered(table, alloc, entered, cursor_row, cursor_col, writes_after)
+                return
 
             # Refresh and restore cursor position
             self._refresh_display()
-            table = self.query_one("#allocations-table", DataTable)
+            table = self._alloc_table
             table.move_cursor(row=cursor_row, column=cursor_col)
 
+    def _patch_alloc_entered(
+        self, table: DataTable, alloc: TicketAllocation, entered: bool, row: int, col: int,
+        writes: tuple[int, int],
+    ) -> None:
+        """Redraw only the cells that change when an allocation's entered flag flips.
+
+        That is the allocation's own cell, its row's and the month's Entered
+        totals and the summary line; the render's lookup is brought up to date
+        so it keeps serving the view, as of storage.write_count() == writes.
+        """
+        weekday = alloc.date.weekday()
+        table.update_cell_at(
+            Coordinate(row, col),
+            self._alloc_hours_cell(alloc.hours, entered, weekday >= 5, weekday == 4),
+        )
+
+        delta = alloc.hours if entered else -alloc.hours
+        # Columns: Ticket, Description, the days, Alloc, Entered
+        entered_col = 2 + len(self._alloc_days_to_show) + 1
+        row_total, row_entered = self._alloc_row_totals[alloc.ticket_id]
+        row_entered += delta
+        self._alloc_row_totals[alloc.ticket_id] = (row_total, row_entered)
+        table.update_cell_at(Coordinate(row, entered_col), self._alloc_entered_cell(row_entered, row_total))
+
+        totals = self._alloc_totals
+        totals = self._alloc_totals = totals._replace(entered=totals.entered + delta)
+        table.update_cell_at(
+            Coordinate(table.get_row_index("__week_total__"), entered_col),
+            self._alloc_entered_cell(totals.entered, totals.allocated),
+        )
+        self.query_one("#allocations-summary", Static).update(self._alloc_summary_text(totals))
+
+        self._alloc_lookup[(alloc.ticket_id, alloc.date)] = replace(alloc, entered_on_client=entered)
+        self._alloc_lookup_state = (self._render_version, writes, self.current_year, self.current_month)
+
     def _toggle_points_entered_state(self) -> None:
         """Toggle points_entered for the ticket in the currently selected row."""
         if self.view_mode != "allocations":
             return
 
-        table = self.query_one("#allocations-table", DataTable)
+        table = self._alloc_table
         cursor_row = table.cursor_row
         cursor_col = table.cursor_column
 
         if cursor_row >= len(table.rows):
             return
-        row_key = list(table.rows.keys())[cursor_row]
+        row_key = table.coordinate_to_cell_key(Coordinate(cursor_row, 0)).row_key
 
         # Skip summary rows
         if str(row_key.value).startswith("__"):
@@ -2967,7 +3433,7 @@ class TimesheetApp(App):
 
         # Refresh and restore cursor position
         self._refresh_display()
-        table = self.query_one("#allocations-table", DataTable)
+        table = self._alloc_table
         table.move_cursor(row=cursor_row, column=cursor_col)
 
     def _get_alloc_cell_info(self) -> tuple[str | None, date | None]:
@@ -2978,14 +3444,14 @@ class TimesheetApp(App):
         if self.view_mode != "allocations":
             return None, None
 
-        table = self.query_one("#allocations-table", DataTable)
+        table = self._alloc_table
         cursor_row = table.cursor_row
         cursor_col = table.cursor_column
 
         if cursor_row >= len(table.rows):
             return None, None
 
-        row_key = list(table.rows.keys())[cursor_row]
+        row_key = table.coordinate_to_cell_key(Coordinate(cursor_row, 0)).row_key
         if str(row_key.value).startswith("__"):
             return None, None
 
@@ -2996,9 +3462,7 @@ class TimesheetApp(App):
         day_col_end = day_col_start + len(days_to_show)
 
         if day_col_start <= cursor_col < day_col_end:
-            day_index = cursor_col - day_col_start
-            day = days_to_show[day_index]
-            d = date(self.current_year, self.current_month, day)
+            d = self._alloc_dates_to_show[cursor_col - day_col_start]
             return ticket_id, d
 
         return ticket_id, None
@@ -3009,10 +3473,7 @@ class TimesheetApp(App):
         if not ticket_id or not d:
             return
 
-        alloc = next(
-            (a for a in storage.get_allocations_for_date(d) if a.ticket_id == ticket_id),
-            None,
-        )
+        alloc = self._alloc_view_allocation(ticket_id, d)
         if not alloc:
             self.notify("No allocation to edit", severity="warning")
             return
@@ -3025,13 +3486,13 @@ class TimesheetApp(App):
 
         # Calculate remaining hours
         entry = storage.get_entry(d)
-        worked = entry.worked_hours if entry else Decimal("0")
+        worked = entry.worked_hours if entry else _ZERO
         day_allocs = storage.get_allocations_for_date(d)
-        total_allocated = sum((a.hours for a in day_allocs), Decimal("0"))
+        total_allocated = sum((a.hours for a in day_allocs), _ZERO)
         remaining = worked - total_allocated + alloc.hours
 
         # Save cursor context for restoring after edit
-        table = self.query_one("#allocations-table", DataTable)
+        table = self._alloc_table
         self._alloc_cursor_ctx = (ticket_id, table.cursor_column)
 
         self.push_screen(
@@ -3059,10 +3520,10 @@ class TimesheetApp(App):
         """
         if self.view_mode != "allocations":
             return
-        table = self.query_one("#allocations-table", DataTable)
+        table = self._alloc_table
         if table.cursor_row >= len(table.rows):
             return
-        row_key = list(table.rows.keys())[table.cursor_row]
+        row_key = table.coordinate_to_cell_key(Coordinate(table.cursor_row, 0)).row_key
         key_str = str(row_key.value)
         if key_str.startswith("__co_"):
             ticket_id = key_str[len("__co_"):]
@@ -3099,17 +3560,13 @@ class TimesheetApp(App):
             return
         saved_ticket_id, saved_col = ctx
         target_ticket = ticket_id or saved_ticket_id
-        table = self.query_one("#allocations-table", DataTable)
-        row_keys = list(table.rows.keys())
-        for idx, key in enumerate(row_keys):
-            if str(key.value) == target_ticket:
-                table.move_cursor(row=idx, column=saved_col)
-                return
+        table = self._alloc_table
+        if target_ticket and target_ticket in table.rows:
+            table.move_cursor(row=table.get_row_index(target_ticket), column=saved_col)
+            return
         # Ticket no longer in table — clamp to last row
-        if row_keys:
-            table.move_cursor(
-                row=max(0, len(row_keys) - 1), column=saved_col,
-            )
+        if table.row_count:
+            table.move_cursor(row=table.row_count - 1, column=saved_col)
 
     def _on_alloc_view_edit_complete(self, result: tuple[str, str, str] | None) -> None:
         """Handle allocation edit from allocations view."""
@@ -3137,7 +3594,7 @@ class TimesheetApp(App):
     def _alloc_add_allocation(self) -> None:
         """Add an allocation from the allocations view via ticket selector."""
         # Determine the date from the current cursor column
-        table = self.query_one("#allocations-table", DataTable)
+        table = self._alloc_table
         cursor_col = table.cursor_column
         days_to_show = getattr(self, '_alloc_days_to_show', [])
         day_col_start = 2
@@ -3147,9 +3604,7 @@ class TimesheetApp(App):
             self.notify("Select a day column to add an allocation", severity="warning")
             return
 
-        day_index = cursor_col - day_col_start
-        day = days_to_show[day_index]
-        d = date(self.current_year, self.current_month, day)
+        d = self._alloc_dates_to_show[cursor_col - day_col_start]
 
         self._allocation_target_date = d
         self._alloc_cursor_ctx = (None, table.cursor_column)
@@ -3167,15 +3622,15 @@ class TimesheetApp(App):
         existing = next((a for a in day_allocs if a.ticket_id == ticket.id), None)
         if existing:
             self.notify(
-                f"{ticket.id} already has an allocation on {target_date.strftime('%b %d')}. Use 'e' to edit.",
+                f"{ticket.id} already has an allocation on {format_short_date(target_date)}. Use 'e' to edit.",
                 severity="warning",
             )
             return
 
         # Calculate remaining hours
         entry = storage.get_entry(target_date)
-        worked = entry.worked_hours if entry else Decimal("0")
-        total_allocated = sum((a.hours for a in day_allocs), Decimal("0"))
+        worked = entry.worked_hours if entry else _ZERO
+        total_allocated = sum((a.hours for a in day_allocs), _ZERO)
         remaining = worked - total_allocated
 
         self.push_screen(
@@ -3193,20 +3648,17 @@ class TimesheetApp(App):
         if not ticket_id or not d:
             return
 
-        alloc = next(
-            (a for a in storage.get_allocations_for_date(d) if a.ticket_id == ticket_id),
-            None,
-        )
+        alloc = self._alloc_view_allocation(ticket_id, d)
         if not alloc:
             self.notify("No allocation to delete", severity="warning")
             return
 
         # Save cursor context
-        table = self.query_one("#allocations-table", DataTable)
+        table = self._alloc_table
         self._alloc_cursor_ctx = (ticket_id, table.cursor_column)
 
         self.push_screen(
-            ConfirmScreen(f"Delete allocation for {ticket_id} on {d.strftime('%b %d')}?"),
+            ConfirmScreen(f"Delete allocation for {ticket_id} on {format_short_date(d)}?"),
             lambda confirmed: self._on_alloc_delete_confirmed(confirmed, ticket_id, d),
         )
 
@@ -3214,7 +3666,7 @@ class TimesheetApp(App):
         """Handle delete allocation confirmation from allocations view."""
         if confirmed:
             storage.delete_allocation(ticket_id, d)
-            self.notify(f"Deleted allocation for {ticket_id} on {d.strftime('%b %d')}")
+            self.notify(f"Deleted allocation for {ticket_id} on {format_short_date(d)}")
             self._refresh_display()
             self._restore_alloc_cursor(ticket_id)
 
@@ -3224,15 +3676,12 @@ class TimesheetApp(App):
         if not ticket_id or not d:
             return
 
-        alloc = next(
-            (a for a in storage.get_allocations_for_date(d) if a.ticket_id == ticket_id),
-            None,
-        )
+        alloc = self._alloc_view_allocation(ticket_id, d)
         if not alloc:
             self.notify("No allocation to move", severity="warning")
             return
 
-        table = self.query_one("#allocations-table", DataTable)
+        table = self._alloc_table
         self._alloc_cursor_ctx = (ticket_id, table.cursor_column)
 
         self.push_screen(
@@ -3262,24 +3711,16 @@ class TimesheetApp(App):
         if existing:
             self.notify(
                 f"{source_alloc.ticket_id} already has an allocation on "
-                f"{target_date.strftime('%b %d')}",
+                f"{format_short_date(target_date)}",
                 severity="error",
             )
             return
 
-        # Delete from source, create on target
-        storage.delete_allocation(source_alloc.ticket_id, source_alloc.date)
-        moved = TicketAllocation(
-            ticket_id=source_alloc.ticket_id,
-            date=target_date,
-            hours=source_alloc.hours,
-            description=source_alloc.description,
-            entered_on_client=source_alloc.entered_on_client,
-        )
-        storage.save_allocation(moved)
+        # Move from source to target
+        storage.move_allocation(source_alloc.ticket_id, source_alloc.date, target_date)
 
-        src_str = source_alloc.date.strftime("%b %d")
-        dst_str = target_date.strftime("%b %d")
+        src_str = format_short_date(source_alloc.date)
+        dst_str = format_short_date(target_date)
         self.notify(f"Moved {source_alloc.ticket_id} from {src_str} to {dst_str}")
         self._refresh_display()
 
@@ -3351,21 +3792,16 @@ class TimesheetApp(App):
 
     def _setup_billing_table(self):
         """Set up the billing table columns."""
-        table = self.query_one("#billing-table", DataTable)
+        table = self._billing_table
         table.cursor_type = "row"
-        table.clear(columns=True)
-        table.add_column("Deliverable", width=12, key="del_id")
-        table.add_column("Title", width=30, key="title")
-        table.add_column("Work Package", width=10, key="wp")
-        table.add_column("Hours", width=8, key="hours")
-        table.add_column("Points", width=8, key="points")
         if self.show_money:
-            table.add_column("Ex VAT", width=12, key="ex_vat")
-            table.add_column("Inc VAT", width=12, key="inc_vat")
+            table.set_columns(_BILLING_COLUMNS + _BILLING_MONEY_COLUMNS)
+        else:
+            table.set_columns(_BILLING_COLUMNS)
 
     def _refresh_billing_display(self):
         """Refresh the billing view (current or a finalised period)."""
-        config = storage.get_config()
+        config = self._config
         period = self.billing_view_period
         finalised = storage.get_finalised_bills()
         is_snapshot = False
@@ -3397,13 +3833,13 @@ class TimesheetApp(App):
             ticket_count = len(storage.get_billed_tickets_for_period(year, month))
 
         # Populate table
-        table = self.query_one("#billing-table", DataTable)
+        table = self._billing_table
         table.clear()
 
-        total_hours = Decimal("0")
-        total_points = Decimal("0")
-        total_ex = Decimal("0")
-        total_inc = Decimal("0")
+        total_hours = _ZERO
+        total_points = _ZERO
+        total_ex = _ZERO
+        total_inc = _ZERO
 
         for line in lines:
             del_label = line.deliverable_id or "UNLINKED"
@@ -3439,9 +3875,7 @@ class TimesheetApp(App):
         if period is None:
             label = "CURRENT BILL"
         else:
-            label = (
-                f"BILL {date(period[0], period[1], 1).strftime('%b %Y').upper()}"
-            )
+            label = f"BILL {MONTH_ABBRS[period[1]].upper()} {period[0]}"
         header = self.query_one("#billing-header", Static)
         header_text = (
             f"  {label}  ({ticket_count} ticket(s), "
@@ -3480,7 +3914,7 @@ class TimesheetApp(App):
             summary_parts = [
                 f"{label}: {int(total_points)} pts across "
                 f"{ticket_count} ticket(s)  |  "
-                f"YTD through {date(period[0], period[1], 1).strftime('%b %Y')}: "
+                f"YTD through {MONTH_ABBRS[period[1]]} {period[0]}: "
                 f"{int(ytd_through_period)} pts",
             ]
             if not is_snapshot:
@@ -3538,7 +3972,7 @@ class TimesheetApp(App):
         if self.view_mode != "billing" or self.billing_view_period is not None:
             return
 
-        config = storage.get_config()
+        config = self._config
         lines = storage.get_current_bill_summary(
             hours_per_point=config.hours_per_point,
             point_rate=config.point_rate,
@@ -3552,7 +3986,7 @@ class TimesheetApp(App):
         ticket_count = len(storage.get_billable_tickets(
             contract_start=config.contract_start,
         ))
-        total_inc = sum((ln.amount_inc_vat for ln in lines), Decimal("0"))
+        total_inc = sum((ln.amount_inc_vat for ln in lines), _ZERO)
         total_inc_str = f"£{total_inc:,.2f}"
 
         # Default the bill's month to when the work was actually done (latest
@@ -3574,7 +4008,7 @@ class TimesheetApp(App):
                 vat_rate=config.vat_rate,
                 contract_start=config.contract_start,
             )
-            month_name = date(year, month, 1).strftime("%B %Y")
+            month_name = f"{MONTH_NAMES[month]} {year}"
             self.notify(
                 f"Bill finalised for {month_name}: "
                 f"{len(billed_ids)} ticket(s), {total_inc_str}",
@@ -3598,7 +4032,7 @@ class TimesheetApp(App):
         if self.view_mode != "billing":
             return
 
-        config = storage.get_config()
+        config = self._config
         period = self.billing_view_period
 
         # Mirror _refresh_billing_display's source selection exactly so the
@@ -3663,21 +4097,9 @@ class TimesheetApp(App):
 
     def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
         """Handle Enter/double-click on table row."""
-        # Get the table ID to ensure we're handling the correct table
-        table_id = event.control.id
-
-        # Map view modes to their expected table IDs
-        expected_table_ids = {
-            "year": "year-table",
-            "month": "month-table",
-            "week": "week-table",
-            "day": "day-table",
-            "allocations": "allocations-table",
-            "billing": "billing-table",
-        }
-
-        # Only process if the event is from the expected table for this view mode
-        if table_id != expected_table_ids.get(self.view_mode):
+        # Only process if the event is from this view mode's table; each
+        # view's table is named after its mode (e.g. "allocations-table")
+        if event.control.id != f"{self.view_mode}-table":
             return
 
         if self.view_mode == "year":
@@ -3691,11 +4113,8 @@ class TimesheetApp(App):
             # In month view, selecting a week navigates to that week in week view
             if event.row_key:
                 week_start = date.fromisoformat(str(event.row_key.value))
-                # Find the week index for this week
-                for i, (start, end) in enumerate(self.weeks):
-                    if start == week_start:
-                        self.current_week_idx = i
-                        break
+                # Find the week index for this week (unchanged if not in this month)
+                self.current_week_idx = self._date_to_week.get(week_start, self.current_week_idx)
                 self._set_view_mode("week")
                 self._select_day_in_week()
         elif self.view_mode == "week":
@@ -3720,7 +4139,7 @@ class TimesheetApp(App):
             return
         deliverable_id: str | None = None if key == "unlinked" else key
 
-        config = storage.get_config()
+        config = self._config
         period = self.billing_view_period
         if period is None:
             lines = storage.get_current_bill_summary(
@@ -3763,28 +4182,17 @@ class TimesheetApp(App):
         if self.view_mode != "year":
             return
 
-        config = storage.get_config()
+        config = self._config
 
-        # Populate holidays for all months in the company year (Sep-Aug)
-        months = [
-            (self.company_year_start, 9),
-            (self.company_year_start, 10),
-            (self.company_year_start, 11),
-            (self.company_year_start, 12),
-            (self.company_year_start + 1, 1),
-            (self.company_year_start + 1, 2),
-            (self.company_year_start + 1, 3),
-            (self.company_year_start + 1, 4),
-            (self.company_year_start + 1, 5),
-            (self.company_year_start + 1, 6),
-            (self.company_year_start + 1, 7),
-            (self.company_year_start + 1, 8),
-        ]
+        # Populate holidays for the whole company year (Sep-Aug) at once
+        total_count = storage.populate_holidays_range(
+            date(self.company_year_start, 9, 1),
+            date(self.company_year_start + 1, 8, 31),
+            config.standard_day_hours,
+        )
 
-        total_count = 0
-        for year, month in months:
-            count = storage.populate_holidays(year, month, config.standard_day_hours)
-            total_count += count
+        # Holiday entries were written behind the month cache; reload it
+        self._reload_month_data()
 
         # Refresh display
         self._refresh_display()
@@ -3793,52 +4201,80 @@ class TimesheetApp(App):
     def action_edit_day(self):
         """Open edit modal for selected day."""
         if self.view_mode == "week":
-            table = self.query_one("#week-table", DataTable)
+            table = self._week_table
             current_row = table.cursor_row
             row_key = table.coordinate_to_cell_key(Coordinate(current_row, 0)).row_key
 
             if row_key:
                 selected_date = date.fromisoformat(str(row_key.value))
+                if self._sync_month_cache():
+                    self._refresh_display()
                 entry = self._get_or_create_entry(selected_date)
                 # Store current row for advancing after edit
                 self._edit_row = current_row
-                self.push_screen(EditDayScreen(entry), self._on_edit_complete)
+                self._push_edit_day_screen(entry, self._on_edit_complete)
         elif self.view_mode == "day" and self.day_view_date:
             # In day view, edit the current day's time entry
             entry = storage.get_entry(self.day_view_date)
             if not entry:
                 entry = TimeEntry(
                     date=self.day_view_date,
-                    day_of_week=self.day_view_date.strftime("%a"),
+                    day_of_week=DAY_ABBRS[self.day_view_date.weekday()],
                 )
-            self.push_screen(EditDayScreen(entry), self._on_day_edit_complete)
+            self._push_edit_day_screen(entry, self._on_day_edit_complete)
+
+    def _push_edit_day_screen(self, entry: TimeEntry, callback) -> None:
+        """Show the edit modal for an entry, reusing a single installed screen.
+
+        The screen is installed on first use and kept after it is dismissed,
+        so later edits only reload its inputs instead of composing new widgets.
+        """
+        if self.is_screen_installed("edit-day"):
+            self.get_screen("edit-day", EditDayScreen).load_entry(entry)
+        else:
+            self.install_screen(EditDayScreen(entry), name="edit-day")
+        self.push_screen("edit-day", callback)
 
     def _on_day_edit_complete(self, result: TimeEntry | None) -> None:
         """Handle result from edit modal in day view."""
         if result:
             storage.save_entry(result)
-            # Also update local cache if in current month
-            if result.date.year == self.current_year and result.date.month == self.current_month:
-                self.entries[result.date] = result
-            self._refresh_display()
+            # Also update the in-memory month data (self.entries is the
+            # current month's cache entry)
+            self._cache_entry(result)
+            if self.view_mode == "day":
+                # The saved entry is the day on show; no need to read it back
+                self._refresh_day_display(result)
+            else:
+                self._refresh_display()
 
     def _on_edit_complete(self, result: TimeEntry | None) -> None:
         """Handle result from edit modal."""
         if result:
-            storage.save_entry(result)
-            self.entries[result.date] = result
-            self._refresh_display()
+            self._save_week_entry(result)
 
         # Move to next row (or stay on last row)
-        table = self.query_one("#week-table", DataTable)
+        table = self._week_table
         if hasattr(self, '_edit_row'):
             next_row = min(self._edit_row + 1, 6)  # 7 rows (0-6)
             table.move_cursor(row=next_row)
             del self._edit_row
 
+    def _save_week_entry(self, entry: TimeEntry) -> None:
+        """Save an entry changed from the week view and redraw its row.
+
+        The write goes straight to storage (a single commit), then the
+        in-memory month data is updated and only that day's row patched;
+        the cursor stays where it is.
+        """
+        storage.save_entry(entry)
+        self.entries[entry.date] = entry
+        self._cache_entry(entry)
+        self._refresh_week_day(entry.date)
+
     def _get_selected_date(self) -> date | None:
         """Get the currently selected date from the table."""
-        table = self.query_one("#week-table", DataTable)
+        table = self._week_table
         row_key = table.coordinate_to_cell_key(Coordinate(table.cursor_row, 0)).row_key
         if row_key:
             return date.fromisoformat(str(row_key.value))
@@ -3858,8 +4294,12 @@ class TimesheetApp(App):
         if not selected_date:
             return
 
+        # Judge the day against what is in storage now, not a cached copy
+        # another process has since overwritten
+        if self._sync_month_cache():
+            self._refresh_display()
         entry = self._get_or_create_entry(selected_date)
-        config = storage.get_config()
+        config = self._config
 
         def do_apply(confirmed: bool | None = True) -> None:
             if not confirmed:
@@ -3874,14 +4314,11 @@ class TimesheetApp(App):
                 adjust_type=adjust_type,
                 comment=None,
             )
-            storage.save_entry(new_entry)
-            self.entries[new_entry.date] = new_entry
-
             # Remember cursor position and move to next row if possible
-            table = self.query_one("#week-table", DataTable)
+            table = self._week_table
             current_row = table.cursor_row
 
-            self._refresh_display()
+            self._save_week_entry(new_entry)
 
             # Move to next row, or stay if at the end
             if current_row < 6:
@@ -3889,13 +4326,14 @@ class TimesheetApp(App):
             else:
                 table.move_cursor(row=current_row)
 
-            self.notify(f"{type_name} recorded for {entry.date.strftime('%b %d')}")
+            self.notify(f"{type_name} recorded for {date_str}")
 
+        date_str = format_short_date(entry.date)
         if self._entry_is_blank(entry):
             do_apply()
         else:
             self.push_screen(
-                ConfirmScreen(f"Overwrite existing entry for {entry.date.strftime('%b %d')}?"),
+                ConfirmScreen(f"Overwrite existing entry for {date_str}?"),
                 do_apply
             )
 
@@ -3918,36 +4356,20 @@ class TimesheetApp(App):
         selected_date = self._get_selected_date()
         if not selected_date:
             return
+        if self._sync_month_cache():
+            self._refresh_display()
         entry = self.entries.get(selected_date)
         if not entry or self._entry_is_blank(entry):
             self.notify("Nothing to cut")
             return
 
-        # Remember cursor position
-        table = self.query_one("#week-table", DataTable)
-        current_row = table.cursor_row
-
         # Copy to clipboard
         self._day_clipboard = entry
 
         # Clear the entry
-        cleared = TimeEntry(
-            date=entry.date,
-            day_of_week=entry.day_of_week,
-            clock_in=None,
-            lunch_duration=None,
-            clock_out=None,
-            adjustment=None,
-            adjust_type=None,
-            comment=None,
-        )
-        storage.save_entry(cleared)
-        self.entries[cleared.date] = cleared
-        self._refresh_display()
-
-        # Restore cursor position
-        table.move_cursor(row=current_row)
-        self.notify(f"Cut {entry.date.strftime('%b %d')}")
+        cleared = TimeEntry(date=entry.date, day_of_week=entry.day_of_week)
+        self._save_week_entry(cleared)
+        self.notify(f"Cut {format_short_date(entry.date)}")
 
     def action_copy_day(self) -> None:
         """Copy the selected day to clipboard."""
@@ -3956,19 +4378,22 @@ class TimesheetApp(App):
         selected_date = self._get_selected_date()
         if not selected_date:
             return
+        if self._sync_month_cache():
+            self._refresh_display()
         entry = self.entries.get(selected_date)
         if not entry or self._entry_is_blank(entry):
             self.notify("Nothing to copy")
             return
 
         self._day_clipboard = entry
-        self.notify(f"Copied {entry.date.strftime('%b %d')}")
+        self.notify(f"Copied {format_short_date(entry.date)}")
 
     def action_paste_day(self) -> None:
         """Paste clipboard contents to the selected day."""
         if self.view_mode != "week":
             return
-        if not self._day_clipboard:
+        clipboard = self._day_clipboard
+        if not clipboard:
             self.notify("Clipboard is empty")
             return
         selected_date = self._get_selected_date()
@@ -3976,52 +4401,35 @@ class TimesheetApp(App):
             return
 
         # Get or create entry for target date
+        if self._sync_month_cache():
+            self._refresh_display()
         target = self._get_or_create_entry(selected_date)
 
         def do_paste(confirmed: bool | None) -> None:
             if not confirmed:
                 return
-            # Remember cursor position
-            table = self.query_one("#week-table", DataTable)
-            current_row = table.cursor_row
-
             # Create new entry with clipboard data but target date
-            pasted = TimeEntry(
-                date=target.date,
-                day_of_week=target.day_of_week,
-                clock_in=self._day_clipboard.clock_in if self._day_clipboard else None,
-                lunch_duration=self._day_clipboard.lunch_duration if self._day_clipboard else None,
-                clock_out=self._day_clipboard.clock_out if self._day_clipboard else None,
-                adjustment=self._day_clipboard.adjustment if self._day_clipboard else None,
-                adjust_type=self._day_clipboard.adjust_type if self._day_clipboard else None,
-                comment=self._day_clipboard.comment if self._day_clipboard else None,
-            )
-            storage.save_entry(pasted)
-            self.entries[pasted.date] = pasted
-            self._refresh_display()
-
-            # Restore cursor position
-            table.move_cursor(row=current_row)
-            self.notify(f"Pasted to {target.date.strftime('%b %d')}")
+            pasted = replace(clipboard, date=target.date, day_of_week=target.day_of_week)
+            self._save_week_entry(pasted)
+            self.notify(f"Pasted to {format_short_date(target.date)}")
 
         if self._entry_is_blank(target):
             do_paste(True)
         else:
             self.push_screen(
-                ConfirmScreen(f"Overwrite existing entry for {target.date.strftime('%b %d')}?"),
+                ConfirmScreen(f"Overwrite existing entry for {format_short_date(target.date)}?"),
                 do_paste
             )
 
 
 def main():
-    import sys
     if len(sys.argv) > 1 and sys.argv[1] == "--db-info":
-        from datetime import datetime
         db_path = storage.DB_PATH
         print(f"Database: {db_path}")
         if db_path.exists():
-            mtime = datetime.fromtimestamp(db_path.stat().st_mtime)
-            size = db_path.stat().st_size
+            stat = db_path.stat()
+            mtime = datetime.fromtimestamp(stat.st_mtime)
+            size = stat.st_size
             print(f"Modified: {mtime.strftime('%Y-%m-%d %H:%M:%S')}")
             print(f"Size: {size:,} bytes")
         else:
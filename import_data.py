@@ -150,8 +150,7 @@ def import_from_json(json_path: Path):
             continue
 
         entries = import_sheet(sheet_data)
-        for entry in entries:
-            storage.save_entry(entry)
+        storage.save_entries(entries)
 
         total_entries += len(entries)
         print(f"Imported {len(entries)} entries from {sheet_name}")
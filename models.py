@@ -5,7 +5,7 @@ from datetime import date, time, timedelta
 from decimal import Decimal
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TimeEntry:
     date: date
     day_of_week: str
@@ -36,6 +36,24 @@ class TimeEntry:
             return Decimal("0")
         return Decimal(str(self.adjustment.total_seconds() / 3600)).quantize(Decimal("0.01"))
 
+    @property
+    def worked_minutes(self) -> int:
+        """Whole minutes worked, for fast integer aggregation."""
+        if not self.clock_in or not self.clock_out:
+            return 0
+
+        start = self.clock_in.hour * 60 + self.clock_in.minute
+        end = self.clock_out.hour * 60 + self.clock_out.minute
+        lunch = int(self.lunch_duration.total_seconds() // 60) if self.lunch_duration else 0
+        return end - start - lunch
+
+    @property
+    def adjusted_minutes(self) -> int:
+        """Adjustment rounded to whole minutes, for fast integer aggregation."""
+        if not self.adjustment:
+            return 0
+        return round(self.adjustment.total_seconds() / 60)
+
     @property
     def total_hours(self) -> Decimal:
         """Total billable hours (worked + adjustment)."""
@@ -56,7 +74,7 @@ class Config:
     annual_max_points: int = 960
 
 
-@dataclass
+@dataclass(slots=True)
 class Ticket:
     """A ticket/project that time can be allocated to."""
 
@@ -71,7 +89,7 @@ class Ticket:
     billed_month: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TicketAllocation:
     """Hours allocated to a ticket on a specific date."""
 
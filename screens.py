@@ -16,6 +16,7 @@ from textual.screen import ModalScreen
 import invoice
 from models import InvoiceSettings, Ticket, TicketAllocation, TimeEntry
 import storage
+from utils import ADJUST_TYPE_CODES, format_short_date
 
 
 def _emit_terminal_title(title: str) -> None:
@@ -165,33 +166,62 @@ class EditDayScreen(ModalScreen[TimeEntry | None]):
         super().__init__()
         self.entry = entry
 
+    def _title(self) -> str:
+        d = self.entry.date
+        return f"Edit {self.entry.day_of_week} {format_short_date(d)}, {d.year}"
+
+    def _field_values(self) -> dict[str, str]:
+        """Input values for the current entry, keyed by input ID."""
+        entry = self.entry
+        return {
+            "clock-in": f"{entry.clock_in.hour:02d}:{entry.clock_in.minute:02d}" if entry.clock_in else "",
+            "lunch": str(int(entry.lunch_duration.total_seconds() // 60)) if entry.lunch_duration else "",
+            "clock-out": f"{entry.clock_out.hour:02d}:{entry.clock_out.minute:02d}" if entry.clock_out else "",
+            "adjustment": str(entry.adjusted_hours) if entry.adjustment else "",
+            "adjust-type": entry.adjust_type or "",
+            "comment": entry.comment or "",
+        }
+
+    def load_entry(self, entry: TimeEntry) -> None:
+        """Repopulate the form with another entry so the screen can be reused.
+
+        The app installs a single instance and reloads it on each edit rather
+        than composing a fresh set of widgets every time the modal opens.
+        """
+        self.entry = entry
+        if not self.is_mounted:
+            # Not composed yet; compose() will read self.entry
+            return
+        self.query_one("#edit-title", Label).update(self._title())
+        for field_id, value in self._field_values().items():
+            self.query_one(f"#{field_id}", Input).value = value
+        self.query_one("#clock-in", Input).focus()
+
     def compose(self) -> ComposeResult:
+        values = self._field_values()
         with Vertical(id="edit-dialog"):
-            yield Label(
-                f"Edit {self.entry.day_of_week} {self.entry.date.strftime('%b %d, %Y')}",
-                id="edit-title"
-            )
+            yield Label(self._title(), id="edit-title")
 
             # Row 1: Clock In, Lunch, Clock Out
             with Horizontal(classes="field-row"):
                 with Vertical(classes="field-group"):
                     yield Label("In (HH:MM)", classes="field-label")
                     yield Input(
-                        value=self.entry.clock_in.strftime("%H:%M") if self.entry.clock_in else "",
+                        value=values["clock-in"],
                         placeholder="09:00",
                         id="clock-in"
                     )
                 with Vertical(classes="field-group"):
                     yield Label("Lunch (m)", classes="field-label")
                     yield Input(
-                        value=str(int(self.entry.lunch_duration.total_seconds() // 60)) if self.entry.lunch_duration else "",
+                        value=values["lunch"],
                         placeholder="30",
                         id="lunch"
                     )
                 with Vertical(classes="field-group"):
                     yield Label("Out (HH:MM)", classes="field-label")
                     yield Input(
-                        value=self.entry.clock_out.strftime("%H:%M") if self.entry.clock_out else "",
+                        value=values["clock-out"],
                         placeholder="17:30",
                         id="clock-out"
                     )
@@ -201,14 +231,14 @@ class EditDayScreen(ModalScreen[TimeEntry | None]):
                 with Vertical(classes="field-group"):
                     yield Label("Adjust (h)", classes="field-label")
                     yield Input(
-                        value=str(self.entry.adjusted_hours) if self.entry.adjustment else "",
+                        value=values["adjustment"],
                         placeholder="0",
                         id="adjustment"
                     )
                 with Vertical(classes="field-group"):
                     yield Label("Type (L/S/T/P)", classes="field-label")
                     yield Input(
-                        value=self.entry.adjust_type or "",
+                        value=values["adjust-type"],
                         placeholder="L/S/T/P",
                         id="adjust-type",
                         max_length=1,
@@ -216,7 +246,7 @@ class EditDayScreen(ModalScreen[TimeEntry | None]):
                 with Vertical(classes="field-group", id="comment-group"):
                     yield Label("Comment", classes="field-label")
                     yield Input(
-                        value=self.entry.comment or "",
+                        value=values["comment"],
                         placeholder="",
                         id="comment"
                     )
@@ -249,8 +279,9 @@ class EditDayScreen(ModalScreen[TimeEntry | None]):
             val = event.value.upper()
             if val != event.value:
                 event.input.value = val
-            # Auto-advance to comment if valid type entered
-            if val in ("L", "S", "T", "P"):
+            # Auto-advance to comment if a valid type was typed (not when
+            # the form is being loaded with an existing entry)
+            if val in ADJUST_TYPE_CODES and event.input.has_focus:
                 self.query_one("#comment", Input).focus()
 
     def _parse_time(self, val: str) -> time | None:
@@ -259,6 +290,9 @@ class EditDayScreen(ModalScreen[TimeEntry | None]):
         if not val:
             return None
         try:
+            # Fast path for the usual zero-padded HH:MM
+            if len(val) == 5 and val[2] == ":":
+                return time(int(val[:2]), int(val[3:]))
             parts = val.split(":")
             return time(int(parts[0]), int(parts[1]))
         except (ValueError, IndexError):
@@ -284,7 +318,7 @@ class EditDayScreen(ModalScreen[TimeEntry | None]):
         adjustment = timedelta(hours=float(adj_val)) if adj_val else None
 
         adjust_type_val = self.query_one("#adjust-type", Input).value.strip().upper()
-        adjust_type = adjust_type_val if adjust_type_val in ("L", "S", "T", "P") else None
+        adjust_type = adjust_type_val if adjust_type_val in ADJUST_TYPE_CODES else None
 
         # Validate: if something was entered but it's not valid, show error
         if self.query_one("#adjust-type", Input).value.strip() and not adjust_type:
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import atexit
 import os
 import sqlite3
+import threading
 from dataclasses import dataclass
 from datetime import date, time, timedelta
 from decimal import ROUND_CEILING, Decimal
@@ -29,10 +31,81 @@ def _get_db_path() -> Path:
 DB_PATH = _get_db_path()
 
 
+# Commits made through get_connection in this process; see write_count()
+_write_count = 0
+
+# (path, thread id, connection) that PRAGMA data_version is read on, opened
+# on first use and reopened if DB_PATH changes; see _data_version()
+_watcher: tuple[Path, int, sqlite3.Connection] | None = None
+
+
+class _CountingConnection(sqlite3.Connection):
+    """Connection that records each commit in _write_count."""
+
+    def commit(self) -> None:
+        global _write_count
+        if self.in_transaction and _watcher is not None and _watcher[1] == threading.get_ident():
+            # While this transaction holds the write lock no other process
+            # can commit, so reading data_version now takes in everything
+            # committed elsewhere before this commit rather than letting it
+            # merge into the change this commit is seen as
+            _data_version()
+        super().commit()
+        _write_count += 1
+
+
+def _data_version() -> int:
+    """Return PRAGMA data_version from the long-lived watcher connection.
+
+    SQLite changes the value whenever any other connection, in this
+    process or another, has committed to the database since it was last
+    read. The connection belongs to the thread that first calls this.
+    """
+    global _watcher
+    if _watcher is None or _watcher[0] != DB_PATH:
+        _close_watcher()
+        DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+        _watcher = (DB_PATH, threading.get_ident(), sqlite3.connect(DB_PATH))
+    return _watcher[2].execute("PRAGMA data_version").fetchone()[0]
+
+
+def _close_watcher() -> None:
+    """Close the data_version watcher connection, if open."""
+    global _watcher
+    if _watcher is not None:
+        _watcher[2].close()
+        _watcher = None
+
+
+atexit.register(_close_watcher)
+
+
+def write_count() -> tuple[int, int]:
+    """Return a key that changes whenever the database is committed to.
+
+    The key is (commits made by this process, PRAGMA data_version); the
+    second part also moves when another process (the HTTP API, an
+    import) commits. Callers compare it with an earlier reading to tell
+    whether any data may have changed in between.
+
+    data_version moves once per reading however many commits it covers.
+    Each local commit reads it while holding the write lock, so a reading
+    of (commits + 1, version + 1) after one local commit means nothing
+    else was committed between (commits, version) and that commit.
+    """
+    return (_write_count, _data_version())
+
+
 def get_connection() -> sqlite3.Connection:
     DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(DB_PATH)
+    conn = sqlite3.connect(DB_PATH, factory=_CountingConnection)
     conn.row_factory = sqlite3.Row
+    # These settings last only as long as the connection. NORMAL is safe in
+    # WAL mode (a crash can lose the last commit, never corrupt the file),
+    # and memory-mapping lets reads skip a read() syscall per page.
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=268435456")
     return conn
 
 
@@ -437,17 +510,18 @@ def _row_to_entry(row: sqlite3.Row) -> TimeEntry:
     )
 
 
-def save_entry(entry: TimeEntry):
-    """Insert or update a time entry."""
-    conn = get_connection()
+_SAVE_ENTRY_SQL = """
+    INSERT OR REPLACE INTO time_entries
+    (date, day_of_week, clock_in, lunch_minutes, clock_out, adjustment_minutes, adjust_type, comment)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _entry_params(entry: TimeEntry) -> tuple:
+    """Column values for _SAVE_ENTRY_SQL."""
     lunch_mins = int(entry.lunch_duration.total_seconds() // 60) if entry.lunch_duration else None
     adj_mins = int(entry.adjustment.total_seconds() // 60) if entry.adjustment else None
-
-    conn.execute("""
-        INSERT OR REPLACE INTO time_entries
-        (date, day_of_week, clock_in, lunch_minutes, clock_out, adjustment_minutes, adjust_type, comment)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-    """, (
+    return (
         entry.date.isoformat(),
         entry.day_of_week,
         _format_time(entry.clock_in),
@@ -456,7 +530,21 @@ def save_entry(entry: TimeEntry):
         adj_mins,
         entry.adjust_type,
         entry.comment,
-    ))
+    )
+
+
+def save_entry(entry: TimeEntry):
+    """Insert or update a time entry."""
+    conn = get_connection()
+    conn.execute(_SAVE_ENTRY_SQL, _entry_params(entry))
+    conn.commit()
+    conn.close()
+
+
+def save_entries(entries: list[TimeEntry]) -> None:
+    """Insert or update several time entries in a single transaction."""
+    conn = get_connection()
+    conn.executemany(_SAVE_ENTRY_SQL, [_entry_params(entry) for entry in entries])
     conn.commit()
     conn.close()
 
@@ -487,6 +575,36 @@ def get_entries_range(start: date, end: date) -> list[TimeEntry]:
     return [_row_to_entry(row) for row in rows]
 
 
+def get_nearest_worked_entry(d: date, forward: bool, max_days: int = 365) -> TimeEntry | None:
+    """Get the closest entry after (or before) d with worked hours.
+
+    Only days within max_days of d are searched. Rows without both clock
+    times can't have worked hours, so they are filtered out in SQL, and
+    rows are converted only until one with worked time turns up.
+    """
+    if forward:
+        start, end, order = d + timedelta(days=1), d + timedelta(days=max_days), "ASC"
+    else:
+        start, end, order = d - timedelta(days=max_days), d - timedelta(days=1), "DESC"
+    conn = get_connection()
+    try:
+        rows = conn.execute(
+            f"""
+            SELECT * FROM time_entries
+            WHERE date >= ? AND date <= ? AND clock_in <> '' AND clock_out <> ''
+            ORDER BY date {order}
+            """,
+            (start.isoformat(), end.isoformat()),
+        )
+        for row in rows:
+            entry = _row_to_entry(row)
+            if entry.worked_minutes > 0:
+                return entry
+        return None
+    finally:
+        conn.close()
+
+
 def get_month_entries(year: int, month: int) -> list[TimeEntry]:
     """Get all entries for a calendar month."""
     from calendar import monthrange
@@ -669,25 +787,33 @@ def populate_holidays(year: int, month: int, standard_hours: Decimal) -> int:
     from calendar import monthrange
     start = date(year, month, 1)
     end = date(year, month, monthrange(year, month)[1])
+    return populate_holidays_range(start, end, standard_hours)
+
 
-    holidays_in_month = get_holidays_in_range(start, end)
-    count = 0
+def populate_holidays_range(start: date, end: date, standard_hours: Decimal) -> int:
+    """Pre-populate holiday entries between two dates (inclusive).
 
-    for holiday_date, holiday_name in holidays_in_month.items():
-        existing = get_entry(holiday_date)
+    Existing entries are read in one query and the new ones written in a
+    single transaction. Returns count of entries created.
+    """
+    existing = {entry.date: entry for entry in get_entries_range(start, end)}
+    holidays = []
+
+    for holiday_date, holiday_name in get_holidays_in_range(start, end).items():
+        entry = existing.get(holiday_date)
         # Only create if no entry exists or entry has no data
-        if not existing or (not existing.clock_in and not existing.adjustment):
-            entry = TimeEntry(
+        if not entry or (not entry.clock_in and not entry.adjustment):
+            holidays.append(TimeEntry(
                 date=holiday_date,
                 day_of_week=holiday_date.strftime("%a"),
                 adjustment=timedelta(hours=float(standard_hours)),
                 adjust_type="P",
                 comment=holiday_name,
-            )
-            save_entry(entry)
-            count += 1
+            ))
 
-    return count
+    if holidays:
+        save_entries(holidays)
+    return len(holidays)
 
 
 # --- Ticket Functions ---
@@ -746,6 +872,23 @@ def get_ticket(ticket_id: str) -> Ticket | None:
     return _row_to_ticket(row) if row else None
 
 
+def get_tickets(ticket_ids: list[str]) -> dict[str, Ticket]:
+    """Get the given tickets, archived or not, keyed by ID.
+
+    IDs with no matching ticket are left out of the result.
+    """
+    if not ticket_ids:
+        return {}
+    conn = get_connection()
+    placeholders = ",".join("?" * len(ticket_ids))
+    rows = conn.execute(
+        f"SELECT * FROM tickets WHERE id IN ({placeholders})",
+        ticket_ids,
+    ).fetchall()
+    conn.close()
+    return {row["id"]: _row_to_ticket(row) for row in rows}
+
+
 def get_all_tickets(include_archived: bool = False) -> list[Ticket]:
     """Get all tickets, optionally including archived ones."""
     conn = get_connection()
@@ -986,6 +1129,33 @@ def delete_allocation(ticket_id: str, d: date) -> None:
     conn.close()
 
 
+def set_allocation_entered(ticket_id: str, d: date, entered: bool) -> None:
+    """Set whether an allocation has been entered on the client's system."""
+    conn = get_connection()
+    conn.execute(
+        "UPDATE ticket_allocations SET entered_on_client = ? WHERE ticket_id = ? AND date = ?",
+        (int(entered), ticket_id, d.isoformat()),
+    )
+    conn.commit()
+    conn.close()
+
+
+def move_allocation(ticket_id: str, from_date: date, to_date: date) -> None:
+    """Move an allocation to another date, keeping its hours and flags.
+
+    A single UPDATE, so the move is one commit rather than a delete and a
+    re-insert. Like save_allocation, it replaces any allocation the ticket
+    already has on to_date.
+    """
+    conn = get_connection()
+    conn.execute(
+        "UPDATE OR REPLACE ticket_allocations SET date = ? WHERE ticket_id = ? AND date = ?",
+        (to_date.isoformat(), ticket_id, from_date.isoformat()),
+    )
+    conn.commit()
+    conn.close()
+
+
 def get_total_allocated_hours(d: date) -> Decimal:
     """Get the total hours allocated for a specific date."""
     conn = get_connection()
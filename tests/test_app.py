@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sqlite3
 from datetime import date, timedelta
 from decimal import Decimal
 from unittest.mock import patch
@@ -81,6 +82,18 @@ class TestAppUtilityMethods:
             assert year == 2026
             assert month == 1
 
+    def test_get_week_month_across_year_end(self):
+        """Test a week straddling New Year goes to the year with more weekdays."""
+        from app import TimesheetApp
+
+        with patch.object(TimesheetApp, 'run'):
+            app = TimesheetApp()
+
+            # Sat Dec 27 2025 - Fri Jan 2 2026: Mon-Wed in December
+            assert app._get_week_month(date(2025, 12, 27), date(2026, 1, 2)) == (2025, 12)
+            # Sat Jan 3 2026 - Fri Jan 9 2026 sits wholly in January
+            assert app._get_week_month(date(2026, 1, 3), date(2026, 1, 9)) == (2026, 1)
+
     def test_count_weekdays_full_week(self):
         """Test counting weekdays in a full week."""
         from app import TimesheetApp
@@ -178,6 +191,217 @@ class TestAppUtilityMethods:
             assert app._entry_is_blank(entry) is False
 
 
+class TestWindowSubtitle:
+    """Tests for the per-view window title."""
+
+    def test_subtitles_match_strftime(self):
+        """Test lookup-table formatting matches the strftime output it replaced."""
+        from app import TimesheetApp
+
+        with patch.object(TimesheetApp, 'run'):
+            app = TimesheetApp()
+            app.current_year, app.current_month = 2026, 9
+
+            app.view_mode = "month"
+            assert app._compute_window_subtitle() == f"TIMESHEET: {date(2026, 9, 1):%B %Y}"
+
+            app.view_mode = "day"
+            app.day_view_date = date(2026, 9, 7)
+            assert app._compute_window_subtitle() == f"ALLOCATIONS: {date(2026, 9, 7):%a %b %d, %Y}"
+
+            app.view_mode = "billing"
+            app.billing_view_period = (2026, 3)
+            assert app._compute_window_subtitle() == "BILL MAR 2026"
+
+
+class TestGetWeekTotals:
+    """Tests for week totals in the month view."""
+
+    def test_totals_from_loaded_entries(self):
+        """Test totals use the given entries without querying storage."""
+        from app import TimesheetApp
+        from models import TimeEntry
+
+        with patch.object(TimesheetApp, 'run'):
+            app = TimesheetApp()
+            # Sat Jan 31 - Fri Feb 6 2026; only the February days count
+            entries = {
+                date(2026, 1, 30): TimeEntry(date=date(2026, 1, 30), day_of_week="Fri", adjustment=timedelta(hours=7.5), adjust_type="L"),
+                date(2026, 2, 2): TimeEntry(date=date(2026, 2, 2), day_of_week="Mon", adjustment=timedelta(hours=7.5), adjust_type="S"),
+            }
+
+            with patch('app.storage.get_entries_range') as get_range:
+                totals = app._get_week_totals(
+                    date(2026, 1, 31), date(2026, 2, 6),
+                    filter_month=2, entries_dict=entries,
+                )
+
+            get_range.assert_not_called()
+            assert totals["sick"] == Decimal("7.5")
+            assert totals["leave"] == Decimal("0")
+            assert totals["max_hours"] == Decimal("37.5")
+
+
+class TestGetMonthTotals:
+    """Tests for month totals in the year view."""
+
+    def test_totals_from_given_entries(self):
+        """Test totals use the given entries without querying storage."""
+        from app import TimesheetApp
+        from models import TimeEntry
+
+        with patch.object(TimesheetApp, 'run'):
+            app = TimesheetApp()
+            entries = [
+                TimeEntry(date=date(2026, 2, 2), day_of_week="Mon", adjustment=timedelta(hours=7.5), adjust_type="P"),
+            ]
+
+            with patch('app.storage.get_month_entries') as get_month:
+                totals = app._get_month_totals(2026, 2, entries)
+
+            get_month.assert_not_called()
+            assert totals["public_holiday"] == Decimal("7.5")
+            # 20 weekdays in February 2026, less the public holiday
+            assert totals["max_hours"] == Decimal("142.5")
+
+    def test_worked_matches_per_entry_hours(self):
+        """Test worked hours, which pre-contract months bill by the hour, sum the per-day hours."""
+        from datetime import time
+        from app import TimesheetApp
+        from models import TimeEntry
+
+        with patch.object(TimesheetApp, 'run'):
+            app = TimesheetApp()
+            entries = [
+                TimeEntry(date=date(2026, 2, d), day_of_week="Day", clock_in=time(9, 0), lunch_duration=timedelta(minutes=30), clock_out=time(17, 20))
+                for d in (2, 3, 4)
+            ]
+
+            totals = app._get_month_totals(2026, 2, entries)
+
+            # 7.83h a day; rounding the summed minutes instead would give 23.50h
+            assert totals["worked"] == Decimal("23.49")
+            assert totals["worked"] * Decimal("50") == sum(e.worked_hours for e in entries) * Decimal("50")
+
+    def test_totals_cached_until_save(self, clean_db):
+        """Test totals are reused until something is saved."""
+        from app import TimesheetApp
+        from models import TimeEntry
+        import storage
+
+        with patch.object(TimesheetApp, 'run'):
+            app = TimesheetApp()
+            first = app._get_month_totals(2026, 2, [])
+
+            with patch('app.storage.get_month_entries') as get_month:
+                assert app._get_month_totals(2026, 2) is first
+            get_month.assert_not_called()
+
+            storage.save_entry(TimeEntry(date=date(2026, 2, 2), day_of_week="Mon", adjustment=timedelta(hours=7.5), adjust_type="L"))
+            totals = app._get_month_totals(2026, 2)
+            assert totals is not first
+            assert totals["leave"] == Decimal("7.5")
+
+
+class TestGetMonthBillPoints:
+    """Tests for the memoised month bill points."""
+
+    def test_bill_cached_until_save(self, clean_db):
+        """Test the bill is fetched once and refetched after a save."""
+        from app import TimesheetApp
+        from models import TimeEntry
+        import storage
+
+        with patch.object(TimesheetApp, 'run'):
+            app = TimesheetApp()
+
+            with patch('app.storage.get_month_bill_points', return_value=(3, True)) as get_bill:
+                assert app._get_month_bill_points(2026, 2) == (3, True)
+                assert app._get_month_bill_points(2026, 2) == (3, True)
+                assert get_bill.call_count == 1
+
+                storage.save_entry(TimeEntry(date=date(2026, 2, 2), day_of_week="Mon"))
+                app._get_month_bill_points(2026, 2)
+                assert get_bill.call_count == 2
+
+    def test_bill_refetched_after_commit_elsewhere(self, clean_db):
+        """Test an allocation written by another process (e.g. the HTTP API) expires the bill."""
+        from app import TimesheetApp
+        import storage
+
+        with patch.object(TimesheetApp, 'run'):
+            app = TimesheetApp()
+
+            with patch('app.storage.get_month_bill_points', return_value=(3, True)) as get_bill:
+                app._get_month_bill_points(2026, 2)
+
+                conn = sqlite3.connect(storage.DB_PATH)
+                conn.execute("INSERT INTO tickets (id, description, created_at) VALUES ('T-1', 'Ticket', '2026-02-02')")
+                conn.execute("INSERT INTO ticket_allocations (ticket_id, date, hours) VALUES ('T-1', '2026-02-02', '2')")
+                conn.commit()
+                conn.close()
+
+                app._get_month_bill_points(2026, 2)
+                assert get_bill.call_count == 2
+
+
+class TestGetMaxHoursToDate:
+    """Tests for the max-hours-to-date figure."""
+
+    def test_public_holidays_in_range_subtracted(self):
+        """Test only public holidays inside the range reduce the maximum."""
+        from app import TimesheetApp
+        from models import TimeEntry
+
+        with patch.object(TimesheetApp, 'run'):
+            app = TimesheetApp()
+            app.entries = {
+                date(2026, 5, 4): TimeEntry(date=date(2026, 5, 4), day_of_week="Mon", adjustment=timedelta(hours=7.5), adjust_type="P"),
+                date(2026, 5, 5): TimeEntry(date=date(2026, 5, 5), day_of_week="Tue", adjustment=timedelta(hours=7.5), adjust_type="L"),
+                date(2026, 5, 25): TimeEntry(date=date(2026, 5, 25), day_of_week="Mon", adjustment=timedelta(hours=7.5), adjust_type="P"),
+            }
+
+            # 10 weekdays from Fri 1 to Thu 14 May, one of them a public holiday
+            max_hours = app._get_max_hours_to_date(date(2026, 5, 1), date(2026, 5, 14))
+
+            assert max_hours == Decimal("67.5")
+
+
+class TestTallyHundredths:
+    """Tests for summing entries as integer hundredths of an hour."""
+
+    def test_tally_by_adjust_type(self):
+        """Test worked time and each adjustment type are summed separately."""
+        from datetime import time
+        from app import TimesheetApp
+        from models import TimeEntry
+
+        entries = [
+            TimeEntry(date=date(2026, 1, 12), day_of_week="Mon", clock_in=time(9, 0), lunch_duration=timedelta(minutes=30), clock_out=time(17, 0)),
+            TimeEntry(date=date(2026, 1, 13), day_of_week="Tue", adjustment=timedelta(hours=7.5), adjust_type="L"),
+            TimeEntry(date=date(2026, 1, 14), day_of_week="Wed", adjustment=timedelta(hours=2), adjust_type="T"),
+            TimeEntry(date=date(2026, 1, 15), day_of_week="Thu", adjustment=timedelta(hours=7.5), adjust_type="P"),
+        ]
+
+        assert TimesheetApp._tally_hundredths(entries) == (750, 750, 0, 200, 750)
+
+    def test_matches_sum_of_per_entry_hours(self):
+        """Test each day is rounded before summing, as worked_hours rounds it."""
+        from datetime import time
+        from app import TimesheetApp
+        from models import TimeEntry
+
+        # 7h50m each: 7.83h per day, 23.49h over three, not 23.50h
+        entries = [
+            TimeEntry(date=date(2026, 1, d), day_of_week="Day", clock_in=time(9, 0), lunch_duration=timedelta(minutes=30), clock_out=time(17, 20))
+            for d in (12, 13, 14)
+        ]
+
+        worked = TimesheetApp._tally_hundredths(entries)[0]
+        assert worked == 2349
+        assert Decimal(worked) / 100 == sum(e.worked_hours for e in entries)
+
+
 class TestGetAllocationStatus:
     """Tests for _get_allocation_status method."""
 
@@ -191,6 +415,8 @@ class TestGetAllocationStatus:
             result = app._get_allocation_status(date(2026, 1, 27), Decimal("0"))
 
             assert str(result) == "-"
+            # Fixed indicators are shared rather than rebuilt per row
+            assert app._get_allocation_status(date(2026, 1, 28), Decimal("0")) is result
 
     def test_no_allocations(self):
         """Test status when worked but no allocations."""
@@ -255,7 +481,7 @@ class TestHasAllocationMismatch:
         with patch.object(TimesheetApp, 'run'):
             app = TimesheetApp()
 
-            result = app._has_allocation_mismatch(date(2026, 1, 27), {})
+            result = app._has_allocation_mismatch(date(2026, 1, 27), {}, {})
 
             assert result is False
 
@@ -274,7 +500,7 @@ class TestHasAllocationMismatch:
                 )
             }
 
-            result = app._has_allocation_mismatch(date(2026, 1, 27), entries_dict)
+            result = app._has_allocation_mismatch(date(2026, 1, 27), entries_dict, {})
 
             assert result is False
 
@@ -283,7 +509,6 @@ class TestHasAllocationMismatch:
         from app import TimesheetApp
         from datetime import time
         from models import TimeEntry
-        import storage
 
         with patch.object(TimesheetApp, 'run'):
             app = TimesheetApp()
@@ -298,8 +523,9 @@ class TestHasAllocationMismatch:
                 )
             }
 
-            with patch.object(storage, 'get_total_allocated_hours', return_value=Decimal("7.5")):
-                result = app._has_allocation_mismatch(date(2026, 1, 27), entries_dict)
+            result = app._has_allocation_mismatch(
+                date(2026, 1, 27), entries_dict, {date(2026, 1, 27): Decimal("7.5")},
+            )
 
             assert result is False
 
@@ -308,7 +534,6 @@ class TestHasAllocationMismatch:
         from app import TimesheetApp
         from datetime import time
         from models import TimeEntry
-        import storage
 
         with patch.object(TimesheetApp, 'run'):
             app = TimesheetApp()
@@ -323,7 +548,401 @@ class TestHasAllocationMismatch:
                 )
             }
 
-            with patch.object(storage, 'get_total_allocated_hours', return_value=Decimal("5")):
-                result = app._has_allocation_mismatch(date(2026, 1, 27), entries_dict)
+            result = app._has_allocation_mismatch(
+                date(2026, 1, 27), entries_dict, {date(2026, 1, 27): Decimal("5")},
+            )
+
+            assert result is True
+
+    def test_no_allocations(self):
+        """Test a worked day missing from the allocation totals is a mismatch."""
+        from app import TimesheetApp
+        from datetime import time
+        from models import TimeEntry
+
+        with patch.object(TimesheetApp, 'run'):
+            app = TimesheetApp()
+
+            entries_dict = {
+                date(2026, 1, 27): TimeEntry(
+                    date=date(2026, 1, 27),
+                    day_of_week="Mon",
+                    clock_in=time(9, 0),
+                    clock_out=time(12, 0),
+                )
+            }
+
+            result = app._has_allocation_mismatch(date(2026, 1, 27), entries_dict, {})
 
             assert result is True
+
+
+class TestWeekRowCells:
+    """Tests for _week_row_cells caching."""
+
+    def test_cells_reused_for_unchanged_entry(self):
+        """Test cells are reused while the entry object is unchanged."""
+        from app import TimesheetApp
+        from models import TimeEntry
+
+        with patch.object(TimesheetApp, 'run'):
+            app = TimesheetApp()
+            app.current_month = 1
+            d = date(2026, 1, 27)
+            entry = TimeEntry(date=d, day_of_week="Tue", comment="First")
+            app.entries = {d: entry}
+
+            first = app._week_row_cells(d, entry)
+            assert app._week_row_cells(d, entry) is first
+
+            replacement = TimeEntry(date=d, day_of_week="Tue", comment="Second")
+            app.entries[d] = replacement
+            second = app._week_row_cells(d, replacement)
+            assert second is not first
+            assert str(second[-1]) == "Second"
+
+    def test_boundary_day_rebuilt_on_month_change(self):
+        """Test a boundary day's date cell follows the viewed month."""
+        from app import TimesheetApp
+        from models import TimeEntry
+
+        with patch.object(TimesheetApp, 'run'):
+            app = TimesheetApp()
+            app.entries = {}
+            d = date(2026, 1, 31)
+            entry = TimeEntry(date=d, day_of_week="Sat")
+
+            app.current_month = 1
+            assert str(app._week_row_cells(d, entry)[1]) == "Jan 31"
+
+            app.current_month = 2
+            assert str(app._week_row_cells(d, entry)[1]) == "(Jan 31)"
+
+    def test_blank_day_rendered_without_entry(self):
+        """Test a day with no entry renders a dashed row."""
+        from app import TimesheetApp
+
+        with patch.object(TimesheetApp, 'run'):
+            app = TimesheetApp()
+            app.current_month = 1
+            app.entries = {}
+
+            cells = [str(c) for c in app._week_row_cells(date(2026, 1, 24), None)]
+            assert cells == ["Sat", "Jan 24", "-", "-", "-", "-", "-", "", ""]
+
+
+class TestMonthCache:
+    """Tests for the adjacent-month entry cache."""
+
+    def test_adjacent_months_wrap_year(self):
+        """Test neighbours wrap across year boundaries."""
+        from app import TimesheetApp
+
+        assert TimesheetApp._adjacent_months((2026, 1)) == [(2025, 12), (2026, 1), (2026, 2)]
+        assert TimesheetApp._adjacent_months((2026, 12)) == [(2026, 11), (2026, 12), (2027, 1)]
+
+    def test_fetch_months_splits_by_month(self, clean_db):
+        """Test one fetch fills each requested month, including empty ones."""
+        from app import TimesheetApp
+        from models import TimeEntry
+        import storage
+
+        storage.save_entry(TimeEntry(date=date(2026, 1, 30), day_of_week="Fri", adjustment=timedelta(hours=1), adjust_type="T"))
+        storage.save_entry(TimeEntry(date=date(2026, 2, 2), day_of_week="Mon", adjustment=timedelta(hours=1), adjust_type="T"))
+
+        with patch.object(TimesheetApp, 'run'):
+            app = TimesheetApp()
+            app._fetch_months([(2026, 1), (2026, 2), (2026, 3)])
+
+            assert list(app._month_cache[(2026, 1)]) == [date(2026, 1, 30)]
+            assert list(app._month_cache[(2026, 2)]) == [date(2026, 2, 2)]
+            assert app._month_cache[(2026, 3)] == {}
+
+    def test_cache_entry_updates_loaded_months(self):
+        """Test a saved entry replaces every cached copy of its date."""
+        from app import TimesheetApp
+        from models import TimeEntry
+
+        with patch.object(TimesheetApp, 'run'):
+            app = TimesheetApp()
+            old = TimeEntry(date=date(2026, 1, 31), day_of_week="Sat")
+            app._month_cache = {(2026, 1): {}, (2026, 2): {old.date: old}}
+
+            new = TimeEntry(date=date(2026, 1, 31), day_of_week="Sat", comment="Updated")
+            app._cache_entry(new)
+
+            assert app._month_cache[(2026, 1)][new.date] is new
+            assert app._month_cache[(2026, 2)][new.date] is new
+
+    def test_reloaded_after_commit_elsewhere(self, clean_db):
+        """Test the cache is reloaded after another process commits, but not after a local save."""
+        from app import TimesheetApp
+        from models import TimeEntry
+        import storage
+
+        with patch.object(TimesheetApp, 'run'):
+            app = TimesheetApp()
+            app._month_cache_writes = storage.write_count()
+
+            storage.save_entry(TimeEntry(date=date(2026, 2, 2), day_of_week="Mon", comment="Local"))
+            with patch.object(app, '_reload_month_data') as reload:
+                assert not app._sync_month_cache()
+            reload.assert_not_called()
+
+            # e.g. import_data.py run from another terminal
+            conn = sqlite3.connect(storage.DB_PATH)
+            conn.execute("INSERT INTO time_entries (date, day_of_week, comment) VALUES ('2026-02-03', 'Tue', 'Imported')")
+            conn.commit()
+            conn.close()
+            with patch.object(app, '_reload_month_data') as reload:
+                assert app._sync_month_cache()
+            reload.assert_called_once()
+
+
+class TestTableCells:
+    """Tests for the table cell helpers."""
+
+    def test_style_change_is_detected(self):
+        """Test cells differing only in dimming are not treated as equal."""
+        from rich.text import Text
+        from app import _same_cell
+
+        assert _same_cell(Text("8h"), Text("8h"))
+        assert not _same_cell(Text("8h"), Text("8h", style="dim"))
+        assert not _same_cell(Text("8h"), Text("7.5h"))
+        assert _same_cell("", "")
+
+    def test_cells_are_shared(self):
+        """Test cells are reused per value and style."""
+        from app import _DASHES, _DIM, _PLAIN, _cell
+
+        assert _cell("-", _DIM) is _DASHES[_DIM]
+        assert _cell("", _PLAIN) is _cell("", _PLAIN)
+        assert _cell("-", _DIM) is not _cell("-", _PLAIN)
+        assert _cell("8h", _PLAIN) is _cell("8h", _PLAIN)
+        assert _cell("8h", _PLAIN) is not _cell("8h", _DIM)
+
+
+class TestConfigCache:
+    """Tests for the lazily loaded config."""
+
+    def test_config_reloaded_after_invalidate(self, clean_db):
+        """Test the config is read once and re-read only after invalidation."""
+        from app import TimesheetApp
+        import storage
+
+        with patch.object(TimesheetApp, 'run'):
+            app = TimesheetApp()
+            first = app._config
+            assert app._config is first
+
+            first.standard_day_hours = Decimal("8")
+            storage.save_config(first)
+            app._invalidate_config()
+
+            assert app._config is not first
+            assert app._config.standard_day_hours == Decimal("8")
+
+
+class TestRenderCache:
+    """Tests for skipping refreshes with nothing new to show."""
+
+    def test_render_skipped_until_state_changes(self, clean_db):
+        """Test a view re-renders only after navigation, a save or invalidation."""
+        from app import TimesheetApp
+        from models import TimeEntry
+        import storage
+
+        with patch.object(TimesheetApp, 'run'):
+            app = TimesheetApp()
+            assert not app._render_is_current("week", 2026, 1, 0)
+            assert app._render_is_current("week", 2026, 1, 0)
+            assert not app._render_is_current("week", 2026, 1, 1)
+
+            storage.save_entry(TimeEntry(date=date(2026, 1, 5), day_of_week="Mon"))
+            assert not app._render_is_current("week", 2026, 1, 1)
+
+            app._invalidate_render()
+            assert not app._render_is_current("week", 2026, 1, 1)
+            assert app._render_is_current("week", 2026, 1, 1)
+
+
+class TestGetOrCreateEntry:
+    """Tests for _get_or_create_entry."""
+
+    def test_blank_entry_reused_and_not_stored(self):
+        """Test an unsaved day gets one shared blank entry kept out of entries."""
+        from app import TimesheetApp
+
+        with patch.object(TimesheetApp, 'run'):
+            app = TimesheetApp()
+            app.entries = {}
+            d = date(2026, 1, 5)
+
+            blank = app._get_or_create_entry(d)
+            assert blank.day_of_week == "Mon"
+            assert blank.clock_in is None
+            assert app._get_or_create_entry(d) is blank
+            assert d not in app.entries
+
+
+class TestCheckAction:
+    """Tests for per-view action availability."""
+
+    def test_view_keys_hidden_in_own_view(self):
+        """Test a view's own switching key is hidden while in that view."""
+        from app import TimesheetApp
+
+        with patch.object(TimesheetApp, 'run'):
+            app = TimesheetApp()
+            app.view_mode = "day"
+
+            assert app.check_action("week_view", ()) is True
+            assert app.check_action("month_view", ()) is False
+            assert app.check_action("year_view", ()) is False
+
+    def test_mode_specific_actions(self):
+        """Test view-specific actions are shown only in their views."""
+        from app import TimesheetApp
+
+        with patch.object(TimesheetApp, 'run'):
+            app = TimesheetApp()
+            app.view_mode = "allocations"
+
+            assert app.check_action("add_allocation", ()) is True
+            assert app.check_action("toggle_entered", ()) is False
+            assert app.check_action("manage_tickets", ()) is True
+
+    def test_finalise_only_for_current_bill(self):
+        """Test finalising is hidden when viewing a past bill."""
+        from app import TimesheetApp
+
+        with patch.object(TimesheetApp, 'run'):
+            app = TimesheetApp()
+            app.view_mode = "billing"
+
+            app.billing_view_period = None
+            assert app.check_action("finalise_billing", ()) is True
+            app.billing_view_period = (2026, 1)
+            assert app.check_action("finalise_billing", ()) is False
+
+
+class TestWorkedDayNavigation:
+    """Tests for stepping between worked days in the day view."""
+
+    def test_skips_days_without_worked_hours(self, clean_db):
+        """Test navigation jumps over leave and unsaved days to worked days."""
+        from app import TimesheetApp
+        from datetime import time
+        from models import TimeEntry
+        import storage
+
+        storage.save_entry(TimeEntry(date=date(2026, 3, 2), day_of_week="Mon", clock_in=time(9, 0), clock_out=time(17, 0)))
+        storage.save_entry(TimeEntry(date=date(2026, 3, 4), day_of_week="Wed", adjustment=timedelta(hours=7.5), adjust_type="L"))
+        storage.save_entry(TimeEntry(date=date(2026, 3, 6), day_of_week="Fri", clock_in=time(9, 0), clock_out=time(17, 0)))
+
+        with patch.object(TimesheetApp, 'run'):
+            app = TimesheetApp()
+            app.day_view_date = date(2026, 3, 4)
+
+            with patch.object(app, '_navigate_to_day_view') as navigate:
+                app._navigate_to_prev_worked_day()
+                navigate.assert_called_once_with(date(2026, 3, 2), auto_edit=False)
+
+                navigate.reset_mock()
+                app._navigate_to_next_worked_day()
+                navigate.assert_called_once_with(date(2026, 3, 6), auto_edit=False)
+
+    def test_stays_put_without_worked_days(self, clean_db):
+        """Test navigation does nothing when no worked day is in range."""
+        from app import TimesheetApp
+
+        with patch.object(TimesheetApp, 'run'):
+            app = TimesheetApp()
+            app.day_view_date = date(2026, 3, 4)
+
+            with patch.object(app, '_navigate_to_day_view') as navigate:
+                app._navigate_to_prev_worked_day()
+                app._navigate_to_next_worked_day()
+            navigate.assert_not_called()
+
+
+class TestAllocViewAllocation:
+    """Tests for allocation lookups in the allocations view."""
+
+    def test_lookup_used_until_save(self, clean_db):
+        """Test the rendered lookup is used only while nothing has been committed."""
+        from app import TimesheetApp
+        from models import Ticket, TicketAllocation
+        import storage
+
+        storage.save_ticket(Ticket(id="T-1", description="Ticket"))
+        d = date(2026, 3, 2)
+        alloc = TicketAllocation(ticket_id="T-1", date=d, hours=Decimal("2"))
+        storage.save_allocation(alloc)
+
+        with patch.object(TimesheetApp, 'run'):
+            app = TimesheetApp()
+            app.current_year, app.current_month = 2026, 3
+            app._alloc_lookup = {("T-1", d): alloc}
+            app._alloc_lookup_state = (app._render_version, storage.write_count(), 2026, 3)
+
+            with patch('app.storage.get_allocations_for_date') as get_allocs:
+                assert app._alloc_view_allocation("T-1", d) is alloc
+                assert app._alloc_view_allocation("T-2", d) is None
+            get_allocs.assert_not_called()
+
+            storage.save_allocation(TicketAllocation(ticket_id="T-1", date=d, hours=Decimal("3")))
+            saved = app._alloc_view_allocation("T-1", d)
+            assert saved is not None
+            assert saved.hours == Decimal("3")
+
+            # A delete from another process (e.g. the HTTP API) is seen too
+            app._alloc_lookup = {("T-1", d): saved}
+            app._alloc_lookup_state = (app._render_version, storage.write_count(), 2026, 3)
+            conn = sqlite3.connect(storage.DB_PATH)
+            conn.execute("DELETE FROM ticket_allocations")
+            conn.commit()
+            conn.close()
+            assert app._alloc_view_allocation("T-1", d) is None
+
+
+class TestHighlightTicketCell:
+    """Tests for moving the ticket ID highlight in the allocations view."""
+
+    def test_rendered_cells_reused(self):
+        """Test highlight and restore use the cells from the last render."""
+        from unittest.mock import MagicMock
+        from rich.text import Text
+        from app import TimesheetApp
+
+        with patch.object(TimesheetApp, 'run'):
+            app = TimesheetApp()
+            normal = "  T-1"
+            highlighted = Text("  T-1", style="reverse")
+            app._alloc_ticket_cells = {"T-1": (normal, highlighted)}
+            table = MagicMock()
+            table.columns = {"ticket": None}
+
+            with patch('app.storage.get_ticket') as get_ticket:
+                app._highlight_ticket_cell(table, "T-1")
+                table.update_cell.assert_called_with("T-1", "ticket", highlighted)
+                app._restore_ticket_cell(table, "T-1")
+                table.update_cell.assert_called_with("T-1", "ticket", normal)
+            get_ticket.assert_not_called()
+
+
+class TestAllocEnteredCell:
+    """Tests for the allocations view's Entered column cells."""
+
+    def test_style_flags_unentered_hours(self):
+        """Test the cell is red until every allocated hour is entered."""
+        from app import TimesheetApp
+
+        partial = TimesheetApp._alloc_entered_cell(Decimal("3.75"), Decimal("7.5"))
+        assert partial.plain == "│  3.75"
+        assert partial.spans[-1].style == "bold red"
+
+        complete = TimesheetApp._alloc_entered_cell(Decimal("7.5"), Decimal("7.5"))
+        assert complete.plain == "│   7.5"
+        assert complete.spans[-1].style == "bold"
@@ -1,14 +1,28 @@
 """Tests for models.py - TimeEntry and Config dataclasses."""
 
+from dataclasses import FrozenInstanceError
 from datetime import date, time, timedelta
 from decimal import Decimal
 
+import pytest
+
 from models import TimeEntry, Config, Ticket, TicketAllocation
 
 
 class TestTimeEntry:
     """Tests for TimeEntry dataclass."""
 
+    def test_uses_slots(self):
+        """Test that entries store fields in slots rather than a __dict__."""
+        entry = TimeEntry(date=date(2026, 1, 15), day_of_week="Wed")
+        assert not hasattr(entry, "__dict__")
+
+    def test_is_frozen(self):
+        """Test that entries can't be modified in place once created."""
+        entry = TimeEntry(date=date(2026, 1, 15), day_of_week="Wed")
+        with pytest.raises(FrozenInstanceError):
+            setattr(entry, "comment", "changed")
+
     def test_worked_hours_full_day(self):
         """Test worked hours for a standard 7.5 hour day."""
         entry = TimeEntry(
@@ -159,6 +173,38 @@ class TestTimeEntry:
         )
         assert entry.total_hours == Decimal("0")
 
+    def test_worked_minutes(self):
+        """Test worked minutes match worked hours."""
+        entry = TimeEntry(
+            date=date(2026, 1, 15),
+            day_of_week="Wed",
+            clock_in=time(8, 45),
+            lunch_duration=timedelta(minutes=45),
+            clock_out=time(17, 20),
+        )
+        assert entry.worked_minutes == 470
+        assert entry.worked_hours == Decimal("7.83")
+
+    def test_worked_minutes_incomplete(self):
+        """Test worked minutes are zero without both clock times."""
+        entry = TimeEntry(
+            date=date(2026, 1, 15),
+            day_of_week="Wed",
+            clock_in=time(9, 0),
+        )
+        assert entry.worked_minutes == 0
+
+    def test_adjusted_minutes(self):
+        """Test adjusted minutes for a full day and no adjustment."""
+        entry = TimeEntry(
+            date=date(2026, 1, 15),
+            day_of_week="Wed",
+            adjustment=timedelta(hours=7.5),
+            adjust_type="L",
+        )
+        assert entry.adjusted_minutes == 450
+        assert TimeEntry(date=date(2026, 1, 15), day_of_week="Wed").adjusted_minutes == 0
+
 
 class TestConfig:
     """Tests for Config dataclass."""
@@ -58,6 +58,46 @@ class TestEditDayScreen:
         assert screen.entry.clock_in is None
         assert screen.entry.clock_out is None
 
+    def test_title_matches_strftime(self):
+        """Test the title formats the date as strftime('%b %d, %Y') did."""
+        screen = EditDayScreen(TimeEntry(date=date(2026, 1, 6), day_of_week="Tue"))
+
+        assert screen._title() == f"Edit Tue {date(2026, 1, 6):%b %d, %Y}"
+
+    def test_parse_time(self):
+        """Test parsing of time inputs."""
+        screen = EditDayScreen(TimeEntry(date=date(2026, 1, 27), day_of_week="Tue"))
+
+        assert screen._parse_time("09:30") == time(9, 30)
+        assert screen._parse_time(" 9:05 ") == time(9, 5)
+        assert screen._parse_time("") is None
+        assert screen._parse_time("25:00") is None
+        assert screen._parse_time("ab:cd") is None
+        assert screen._parse_time("9") is None
+
+    def test_load_entry_before_mount(self):
+        """Test load_entry swaps the entry and field values on an unmounted screen."""
+        screen = EditDayScreen(TimeEntry(date=date(2026, 1, 26), day_of_week="Mon"))
+        entry = TimeEntry(
+            date=date(2026, 1, 27),
+            day_of_week="Tue",
+            clock_in=time(8, 5),
+            lunch_duration=timedelta(minutes=45),
+            adjustment=timedelta(hours=7.5),
+            adjust_type="L",
+        )
+        screen.load_entry(entry)
+
+        assert screen.entry is entry
+        assert screen._field_values() == {
+            "clock-in": "08:05",
+            "lunch": "45",
+            "clock-out": "",
+            "adjustment": "7.50",
+            "adjust-type": "L",
+            "comment": "",
+        }
+
 
 class TestEditTicketScreen:
     """Tests for the EditTicketScreen."""
@@ -72,6 +72,17 @@ class TestInitDb:
 
         conn.close()
 
+    def test_connection_pragmas(self, temp_database):
+        """Test that connections use WAL with relaxed syncing."""
+        storage = temp_database
+        conn = storage.get_connection()
+
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+
+        conn.close()
+
     def test_idempotent(self, temp_database):
         """Test that init_db can be called multiple times safely."""
         storage = temp_database
@@ -238,6 +249,94 @@ class TestGetEntriesRange:
             assert entries[i].date < entries[i + 1].date
 
 
+class TestSaveEntries:
+    """Tests for save_entries function."""
+
+    def test_saves_all_in_one_commit(self, temp_database):
+        """Test every entry is written and existing ones are replaced."""
+        storage = temp_database
+        storage.save_entry(TimeEntry(date=date(2026, 1, 5), day_of_week="Mon", comment="old"))
+        writes, _ = storage.write_count()
+
+        storage.save_entries([
+            TimeEntry(date=date(2026, 1, 5), day_of_week="Mon", comment="new"),
+            TimeEntry(date=date(2026, 1, 6), day_of_week="Tue", clock_in=time(9, 0), clock_out=time(17, 0)),
+        ])
+
+        assert storage.write_count()[0] == writes + 1
+        entries = storage.get_entries_range(date(2026, 1, 5), date(2026, 1, 6))
+        assert [e.date for e in entries] == [date(2026, 1, 5), date(2026, 1, 6)]
+        assert entries[0].comment == "new"
+        assert entries[1].worked_hours == Decimal("8.00")
+
+
+class TestWriteCount:
+    """Tests for write_count function."""
+
+    def test_sees_commits_from_other_connections(self, temp_database):
+        """Test a commit made outside get_connection (e.g. by the API process) is noticed."""
+        import sqlite3
+
+        storage = temp_database
+        writes = storage.write_count()
+        assert storage.write_count() == writes
+
+        conn = sqlite3.connect(storage.DB_PATH)
+        conn.execute("INSERT INTO tickets (id, description, created_at) VALUES ('T-1', 'Ticket', '2026-01-05')")
+        conn.commit()
+        conn.close()
+
+        assert storage.write_count() != writes
+
+    def test_commit_elsewhere_not_absorbed_by_local_commit(self, temp_database):
+        """Test a commit from another process just before a local one still shows in the key."""
+        import sqlite3
+
+        storage = temp_database
+        writes, version = storage.write_count()
+
+        conn = sqlite3.connect(storage.DB_PATH)
+        conn.execute("INSERT INTO tickets (id, description, created_at) VALUES ('T-1', 'Ticket', '2026-01-05')")
+        conn.commit()
+        conn.close()
+        storage.save_entry(TimeEntry(date=date(2026, 1, 5), day_of_week="Mon"))
+
+        assert storage.write_count() != (writes + 1, version + 1)
+
+    def test_single_local_commit(self, temp_database):
+        """Test one local commit with nothing else moves both parts of the key by one."""
+        storage = temp_database
+        writes, version = storage.write_count()
+
+        storage.save_entry(TimeEntry(date=date(2026, 1, 5), day_of_week="Mon"))
+
+        assert storage.write_count() == (writes + 1, version + 1)
+
+
+class TestGetNearestWorkedEntry:
+    """Tests for get_nearest_worked_entry function."""
+
+    def test_skips_days_without_worked_time(self, temp_database):
+        """Test leave days and zero-length days are passed over in both directions."""
+        storage = temp_database
+        storage.save_entry(TimeEntry(date=date(2026, 1, 5), day_of_week="Mon", clock_in=time(9, 0), clock_out=time(17, 0)))
+        storage.save_entry(TimeEntry(date=date(2026, 1, 6), day_of_week="Tue", adjustment=timedelta(hours=7.5), adjust_type="L"))
+        storage.save_entry(TimeEntry(date=date(2026, 1, 7), day_of_week="Wed", clock_in=time(9, 0), clock_out=time(9, 0)))
+        storage.save_entry(TimeEntry(date=date(2026, 1, 9), day_of_week="Fri", clock_in=time(9, 0), clock_out=time(12, 0)))
+
+        assert storage.get_nearest_worked_entry(date(2026, 1, 8), forward=False).date == date(2026, 1, 5)
+        assert storage.get_nearest_worked_entry(date(2026, 1, 5), forward=True).date == date(2026, 1, 9)
+        assert storage.get_nearest_worked_entry(date(2026, 1, 9), forward=True) is None
+
+    def test_limited_to_max_days(self, temp_database):
+        """Test worked days beyond max_days are not found."""
+        storage = temp_database
+        storage.save_entry(TimeEntry(date=date(2026, 1, 5), day_of_week="Mon", clock_in=time(9, 0), clock_out=time(17, 0)))
+
+        assert storage.get_nearest_worked_entry(date(2026, 1, 15), forward=False, max_days=10).date == date(2026, 1, 5)
+        assert storage.get_nearest_worked_entry(date(2026, 1, 16), forward=False, max_days=10) is None
+
+
 class TestGetMonthEntries:
     """Tests for get_month_entries function."""
 
@@ -412,6 +511,18 @@ class TestHolidays:
         assert retrieved.clock_in == time(9, 0)
         assert retrieved.comment == "Worked half day"
 
+    def test_populate_holidays_range(self, temp_database):
+        """Test populating holidays across a whole company year."""
+        storage = temp_database
+
+        count = storage.populate_holidays_range(date(2026, 9, 1), date(2027, 8, 31), Decimal("7.5"))
+
+        entries = storage.get_entries_range(date(2026, 9, 1), date(2027, 8, 31))
+        assert count == len(entries) > 0
+        assert all(e.adjust_type == "P" and e.date.weekday() < 5 for e in entries)
+        assert date(2026, 12, 25) in {e.date for e in entries}
+        assert storage.populate_holidays_range(date(2026, 9, 1), date(2027, 8, 31), Decimal("7.5")) == 0
+
 
 class TestTicketPointsEntered:
     """Tests for points_entered flag on tickets."""
@@ -469,6 +580,69 @@ class TestTicketPointsEntered:
         assert retrieved.points_entered is True
 
 
+class TestAllocationEntered:
+    """Tests for the entered_on_client flag on allocations."""
+
+    def test_set_allocation_entered_preserves_other_fields(self, temp_database):
+        """Test toggling entered_on_client leaves hours and description alone."""
+        storage = temp_database
+        d = date(2026, 1, 15)
+        storage.save_allocation(TicketAllocation(
+            ticket_id="T-1", date=d, hours=Decimal("3.5"), description="Work",
+        ))
+
+        storage.set_allocation_entered("T-1", d, True)
+        alloc = storage.get_allocations_for_date(d)[0]
+        assert alloc.entered_on_client is True
+        assert alloc.hours == Decimal("3.5")
+        assert alloc.description == "Work"
+
+        storage.set_allocation_entered("T-1", d, False)
+        assert storage.get_allocations_for_date(d)[0].entered_on_client is False
+
+
+class TestMoveAllocation:
+    """Tests for move_allocation function."""
+
+    def test_keeps_hours_and_flags(self, temp_database):
+        """Test a moved allocation keeps its hours, description and entered flag."""
+        storage = temp_database
+        src, dst = date(2026, 1, 5), date(2026, 1, 6)
+        storage.save_allocation(TicketAllocation(
+            ticket_id="T-1", date=src, hours=Decimal("2.5"), description="Work", entered_on_client=True,
+        ))
+
+        storage.move_allocation("T-1", src, dst)
+
+        assert storage.get_allocations_for_date(src) == []
+        moved = storage.get_allocations_for_date(dst)
+        assert len(moved) == 1
+        assert moved[0].hours == Decimal("2.5")
+        assert moved[0].description == "Work"
+        assert moved[0].entered_on_client is True
+
+
+class TestGetTickets:
+    """Tests for get_tickets function."""
+
+    def test_returns_only_requested_tickets(self, temp_database):
+        """Test that only the given IDs are fetched, archived included."""
+        storage = temp_database
+        storage.save_ticket(Ticket(id="T-1", description="One"))
+        storage.save_ticket(Ticket(id="T-2", description="Two", archived=True))
+        storage.save_ticket(Ticket(id="T-3", description="Three"))
+
+        tickets = storage.get_tickets(["T-1", "T-2", "T-9"])
+
+        assert set(tickets) == {"T-1", "T-2"}
+        assert tickets["T-2"].archived is True
+
+    def test_empty_list(self, temp_database):
+        """Test that no IDs returns an empty dict."""
+        storage = temp_database
+        assert storage.get_tickets([]) == {}
+
+
 class TestGetTicketLifetimeHours:
     """Tests for get_ticket_lifetime_hours function."""
 
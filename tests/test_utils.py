@@ -1,9 +1,9 @@
 """Tests for utils.py - week calculation and points utilities."""
 
-from datetime import date
+from datetime import date, timedelta
 from decimal import Decimal
 
-from utils import get_week_start, get_weeks_in_month, calculate_points, ADJUST_TYPES
+from utils import get_week_start, get_weeks_in_month, get_week_month, calculate_points, count_weekdays, hundredths_to_hours, minutes_to_hundredths, format_short_date, ADJUST_TYPES, ADJUST_TYPE_CODES
 
 
 class TestGetWeekStart:
@@ -56,6 +56,17 @@ class TestGetWeekStart:
         assert get_week_start(dec31) == date(2025, 12, 27)
 
 
+class TestFormatShortDate:
+    """Tests for format_short_date function."""
+
+    def test_matches_strftime(self):
+        """Test the output matches strftime("%b %d") for every day of a year."""
+        d = date(2026, 1, 1)
+        while d.year == 2026:
+            assert format_short_date(d) == d.strftime("%b %d")
+            d += timedelta(days=1)
+
+
 class TestGetWeeksInMonth:
     """Tests for get_weeks_in_month function."""
 
@@ -126,6 +137,60 @@ class TestGetWeeksInMonth:
                     break
             assert covered, f"Day {d} not covered by any week"
 
+    def test_result_is_memoised(self):
+        """Repeated calls for the same month return the same immutable result."""
+        weeks = get_weeks_in_month(2026, 4)
+        assert isinstance(weeks, tuple)
+        assert get_weeks_in_month(2026, 4) is weeks
+
+
+class TestCountWeekdays:
+    """Tests for count_weekdays function."""
+
+    def test_full_week(self):
+        """A Saturday-to-Friday week has five weekdays."""
+        assert count_weekdays(date(2026, 1, 10), date(2026, 1, 16)) == 5
+
+    def test_single_days(self):
+        """A single weekday counts once, a single weekend day not at all."""
+        assert count_weekdays(date(2026, 1, 12), date(2026, 1, 12)) == 1
+        assert count_weekdays(date(2026, 1, 10), date(2026, 1, 10)) == 0
+
+    def test_end_before_start(self):
+        """An empty range has no weekdays."""
+        assert count_weekdays(date(2026, 1, 16), date(2026, 1, 10)) == 0
+
+    def test_matches_day_by_day_count(self):
+        """Closed form agrees with walking every day across a year."""
+        start = date(2026, 1, 1)
+        for offset in range(7):
+            s = start + timedelta(days=offset)
+            for length in range(0, 60):
+                e = s + timedelta(days=length)
+                expected = sum(
+                    1 for i in range(length + 1)
+                    if (s + timedelta(days=i)).weekday() < 5
+                )
+                assert count_weekdays(s, e) == expected
+
+
+class TestGetWeekMonth:
+    """Tests for get_week_month function."""
+
+    def test_majority_month_wins(self):
+        """A week goes to the month holding most of its weekdays."""
+        # Sat Jan 31 - Fri Feb 6 2026: all weekdays in February
+        assert get_week_month(date(2026, 1, 31), date(2026, 2, 6)) == (2026, 2)
+        # Sat Dec 27 2025 - Fri Jan 2 2026: Mon-Wed in December
+        assert get_week_month(date(2025, 12, 27), date(2026, 1, 2)) == (2025, 12)
+
+    def test_result_is_memoised(self):
+        """Repeated calls for the same week hit the cache."""
+        get_week_month.cache_clear()
+        get_week_month(date(2026, 4, 25), date(2026, 5, 1))
+        get_week_month(date(2026, 4, 25), date(2026, 5, 1))
+        assert get_week_month.cache_info().hits == 1
+
 
 class TestAdjustTypes:
     """Tests for ADJUST_TYPES constant."""
@@ -152,6 +217,10 @@ class TestAdjustTypes:
             if code:  # Non-empty codes should have descriptive labels
                 assert code in label
 
+    def test_adjust_type_codes(self):
+        """Test that ADJUST_TYPE_CODES holds the non-empty codes."""
+        assert ADJUST_TYPE_CODES == frozenset({"P", "L", "S", "T"})
+
 
 class TestCalculatePoints:
     """Tests for calculate_points function."""
@@ -187,3 +256,21 @@ class TestCalculatePoints:
     def test_negative_hours(self):
         """Test that negative hours gives zero points."""
         assert calculate_points(Decimal("-1"), Decimal("2")) == 0
+
+
+class TestMinutesToHundredths:
+    """Tests for minutes_to_hundredths and hundredths_to_hours functions."""
+
+    def test_whole_and_half_hours(self):
+        """Test exact conversions."""
+        assert minutes_to_hundredths(0) == 0
+        assert minutes_to_hundredths(450) == 750
+        assert hundredths_to_hours(750) == Decimal("7.50")
+
+    def test_rounds_to_nearest_hundredth(self):
+        """Test recurring fractions round as TimeEntry.worked_hours does."""
+        assert minutes_to_hundredths(20) == 33
+        assert minutes_to_hundredths(470) == 783
+        assert minutes_to_hundredths(1) == 2
+        assert minutes_to_hundredths(-20) == -33
+        assert hundredths_to_hours(2349) == Decimal("23.49")
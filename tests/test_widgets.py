@@ -64,10 +64,37 @@ class TestCombinedHeader:
         # Week nav start should be at left arrow position
         assert header.week_nav_start == header.left_arrow_pos
 
+    def test_update_display_skips_unchanged(self):
+        """Test that an unchanged header is not rebuilt."""
+        header = CombinedHeader(2026, 1)
+        header.update = MagicMock()
+
+        header.update_display(2, 5, date(2026, 1, 3), date(2026, 1, 9))
+        header.update_display(2, 5, date(2026, 1, 3), date(2026, 1, 9))
+        assert header.update.call_count == 1
+
+        header.month = 2
+        header.update_display(2, 5, date(2026, 1, 3), date(2026, 1, 9))
+        assert header.update.call_count == 2
+
 
 class TestWeeklySummary:
     """Tests for the WeeklySummary widget."""
 
+    def test_update_display_skips_unchanged(self):
+        """Test that unchanged totals are not reformatted."""
+        summary = WeeklySummary()
+        summary.update = MagicMock()
+
+        config = Config()
+        args = (Decimal("30"), Decimal("37.5"), Decimal("0"), Decimal("0"), Decimal("0"), Decimal("0"))
+        summary.update_display(*args, config)
+        summary.update_display(*args, config)
+        assert summary.update.call_count == 1
+
+        summary.update_display(Decimal("37.5"), *args[1:], config)
+        assert summary.update.call_count == 2
+
     def test_update_display_all_zero(self):
         """Test display with all zero values."""
         summary = WeeklySummary()
@@ -372,3 +399,15 @@ class TestDayTimeEntry:
         assert "Type:" in text_str
         assert "L" in text_str
         assert "Annual leave" in text_str
+
+    def test_unchanged_display_not_rebuilt(self):
+        """Test repeating the same values doesn't update the widget again."""
+        entry = DayTimeEntry()
+        entry.update = MagicMock()
+
+        entry.update_display("09:00", "30m", "17:00", "-", "", "")
+        entry.update_display("09:00", "30m", "17:00", "-", "", "")
+        assert entry.update.call_count == 1
+
+        entry.update_display("09:00", "30m", "17:30", "-", "", "")
+        assert entry.update.call_count == 2
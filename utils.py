@@ -6,6 +6,22 @@ import math
 from datetime import date, timedelta
 from decimal import Decimal
 from calendar import monthrange
+from functools import lru_cache
+
+# Fixed English names indexed like date fields, so hot formatting paths can
+# avoid locale-aware strftime. MONTH_* have an empty slot 0 (months are 1-12);
+# DAY_ABBRS is indexed by date.weekday() (Mon=0).
+DAY_ABBRS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+MONTH_ABBRS = ("", "Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+MONTH_NAMES = (
+    "", "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+)
+
+
+def format_short_date(d: date) -> str:
+    """Format a date as e.g. "Jan 05", like strftime("%b %d") in English."""
+    return f"{MONTH_ABBRS[d.month]} {d.day:02d}"
 
 
 def get_week_start(d: date) -> date:
@@ -15,8 +31,14 @@ def get_week_start(d: date) -> date:
     return d - timedelta(days=days_since_saturday)
 
 
-def get_weeks_in_month(year: int, month: int) -> list[tuple[date, date]]:
-    """Get list of (week_start, week_end) tuples that overlap with the month."""
+@lru_cache(maxsize=256)
+def get_weeks_in_month(year: int, month: int) -> tuple[tuple[date, date], ...]:
+    """Get (week_start, week_end) tuples that overlap with the month.
+
+    Results are memoised per (year, month) since navigation asks for the
+    same few months repeatedly; the tuple return keeps the cached value
+    immutable.
+    """
     first_day = date(year, month, 1)
     last_day = date(year, month, monthrange(year, month)[1])
 
@@ -28,7 +50,44 @@ def get_weeks_in_month(year: int, month: int) -> list[tuple[date, date]]:
         weeks.append((week_start, week_end))
         week_start = week_start + timedelta(days=7)
 
-    return weeks
+    return tuple(weeks)
+
+
+# _WEEKDAYS_IN_PARTIAL_WEEK[start_weekday][n] is the number of Mon-Fri days
+# in a run of n (0-6) consecutive days beginning on start_weekday (Mon=0)
+_WEEKDAYS_IN_PARTIAL_WEEK = [
+    [sum(1 for i in range(n) if (sw + i) % 7 < 5) for n in range(7)]
+    for sw in range(7)
+]
+
+
+def count_weekdays(start: date, end: date) -> int:
+    """Count weekdays (Mon-Fri) from start to end inclusive in constant time."""
+    if end < start:
+        return 0
+    days = end.toordinal() - start.toordinal() + 1
+    full_weeks, remainder = divmod(days, 7)
+    return full_weeks * 5 + _WEEKDAYS_IN_PARTIAL_WEEK[start.weekday()][remainder]
+
+
+@lru_cache(maxsize=512)
+def get_week_month(week_start: date, week_end: date) -> tuple[int, int]:
+    """Return the (year, month) holding the majority of a week's weekdays.
+
+    Ties go to the earlier month. Memoised like get_weeks_in_month, as the
+    same weeks come up again while navigating back and forth.
+    """
+    first = (week_start.year, week_start.month)
+    second = (week_end.year, week_end.month)
+    if first == second:
+        return first
+
+    # A week spans at most two months; count each side of the boundary
+    boundary = week_end.replace(day=1)
+    first_count = count_weekdays(week_start, boundary - timedelta(days=1))
+    second_count = count_weekdays(boundary, week_end)
+
+    return first if first_count >= second_count else second
 
 
 ADJUST_TYPES = [
@@ -39,6 +98,24 @@ ADJUST_TYPES = [
     ("T", "T - Training"),
 ]
 
+# Non-empty adjust type codes, built once for membership checks
+ADJUST_TYPE_CODES = frozenset(code for code, _ in ADJUST_TYPES if code)
+
+
+def minutes_to_hundredths(minutes: int) -> int:
+    """Convert a whole number of minutes to hundredths of an hour.
+
+    Rounds to the nearest hundredth, as TimeEntry.worked_hours does, so a
+    sum of these matches the sum of the per-entry hours exactly.
+    """
+    # minutes * 100 / 60 is never exactly halfway between two hundredths
+    return (5 * minutes + 1) // 3
+
+
+def hundredths_to_hours(hundredths: int) -> Decimal:
+    """Convert hundredths of an hour to Decimal hours, to two decimal places."""
+    return Decimal(hundredths).scaleb(-2)
+
 
 def calculate_points(total_hours: Decimal, hours_per_point: Decimal) -> int:
     """Calculate points from total hours, ceiling-rounded.
@@ -9,10 +9,16 @@ from textual.containers import VerticalScroll
 from textual.widgets import Static
 from rich.text import Text
 
+from utils import DAY_ABBRS, MONTH_NAMES, format_short_date
+
 
 class CombinedHeader(Static):
     """Shows month name on left and week navigation on right."""
 
+    # Align week navigation to end at column 74 (matching summary right edge)
+    # Summary format: 45 spaces + label + hours(6) + "h      (" + days(5) + "d)" = ~74 chars
+    NAV_END_COL = 74
+
     def __init__(self, year: int, month: int, **kwargs):
         super().__init__(**kwargs)
         self.year = year
@@ -20,38 +26,33 @@ class CombinedHeader(Static):
         self.week_nav_start = 0
         self.left_arrow_pos = 0
         self.right_arrow_pos = 0
+        # Inputs of the last render, to skip rebuilding an unchanged header
+        self._rendered: tuple[int, int, int, int, date, date] | None = None
 
     def update_display(self, week_num: int, total_weeks: int, week_start: date, week_end: date):
-        month_name = date(self.year, self.month, 1).strftime("%B %Y")
-        title = f"TIMESHEET: WEEK {week_num} {month_name}"
-        start_str = week_start.strftime("%b %d")
-        end_str = week_end.strftime("%b %d")
+        key = (self.year, self.month, week_num, total_weeks, week_start, week_end)
+        if key == self._rendered:
+            return
+        self._rendered = key
+
+        title = f"TIMESHEET: WEEK {week_num} {MONTH_NAMES[self.month]} {self.year}"
+        start_str = format_short_date(week_start)
+        end_str = format_short_date(week_end)
         week_nav = f"◄ {week_num}/{total_weeks} ({start_str} - {end_str}) ►"
 
-        # Align week navigation to end at column 74 (matching summary right edge)
-        # Summary format: 45 spaces + label + hours(6) + "h      (" + days(5) + "d)" = ~74 chars
-        target_end_col = 74
-        week_nav_start = target_end_col - len(week_nav)
+        week_nav_start = self.NAV_END_COL - len(week_nav)
 
         # Store positions for click detection
         self.week_nav_start = week_nav_start
         self.left_arrow_pos = week_nav_start  # Position of ◄
         self.right_arrow_pos = week_nav_start + len(week_nav) - 1  # Position of ►
 
-        # Create a Text with left and right justified content
-        text = Text()
-        text.append(title, style="bold")
-
         # Calculate spacing to position week_nav at the right spot
         spacing = week_nav_start - len(title)
-        if spacing > 0:
-            text.append(" " * spacing)
-        else:
-            text.append("  ")  # Minimum spacing
+        padding = " " * spacing if spacing > 0 else "  "  # Minimum spacing
 
-        text.append(week_nav, style="bold")
-
-        self.update(text)
+        # Build the left and right justified content in one go
+        self.update(Text.assemble((title, "bold"), padding, (week_nav, "bold")))
 
     def on_click(self, event) -> None:
         """Handle clicks on the arrows for week navigation."""
@@ -69,7 +70,17 @@ class CombinedHeader(Static):
 class WeeklySummary(Static):
     """Shows weekly hours breakdown by type."""
 
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Inputs of the last render, to skip rebuilding unchanged totals
+        self._rendered: tuple[Decimal, ...] | None = None
+
     def update_display(self, worked: Decimal, max_hours: Decimal, leave: Decimal, sick: Decimal, training: Decimal, public_holiday: Decimal, config):
+        key = (worked, max_hours, leave, sick, training, public_holiday, config.standard_day_hours)
+        if key == self._rendered:
+            return
+        self._rendered = key
+
         total = worked + leave + sick + training + public_holiday
 
         # Convert to days (assuming standard_day_hours)
@@ -124,7 +135,7 @@ class DayHeader(Static):
         """Update the day header display."""
         self.current_date = d
         self.worked_hours = worked_hours
-        day_str = d.strftime("%a %b %d, %Y")
+        day_str = f"{DAY_ABBRS[d.weekday()]} {format_short_date(d)}, {d.year}"
         title = f"ALLOCATIONS: {day_str}"
 
         text = Text()
@@ -135,6 +146,11 @@ class DayHeader(Static):
 class DayTimeEntry(Static):
     """Shows time entry details for the day view."""
 
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Inputs of the last render, to skip rebuilding an unchanged line
+        self._rendered: tuple[str, ...] | None = None
+
     def update_display(
         self,
         clock_in: str,
@@ -145,6 +161,11 @@ class DayTimeEntry(Static):
         comment: str,
     ) -> None:
         """Update the time entry display."""
+        key = (clock_in, lunch, clock_out, adjustment, adjust_type, comment)
+        if key == self._rendered:
+            return
+        self._rendered = key
+
         text = Text()
         text.append("  In: ", style="dim")
         text.append(f"{clock_in:<8}", style="" if clock_in != "-" else "dim")